@@ -3,10 +3,13 @@ FastAPI wrapper for Google ADK Portfolio Agent
 Provides REST API for Next.js frontend integration
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List
+import json
+import logging
 import os
 from pathlib import Path
 
@@ -14,11 +17,20 @@ from pathlib import Path
 from dotenv import load_dotenv
 load_dotenv()
 
-# Import the ADK agent
-from portfolio_agent_adk.agent import root_agent
+# Import the ADK agent runtime
+from portfolio_agent_adk.runtime import get_session_store, run_turn
+from services.answer_cache import get_answer_cache
+from services.telemetry import TelemetryMiddleware, configure_json_logging, metrics_payload
+
+# Structured logs: one JSON object per line, tagged with the request id
+configure_json_logging()
+logger = logging.getLogger("portfolio.api")
 
 app = FastAPI(title="Portfolio AI Agent API", version="1.0.0")
 
+# Per-request latency spans -> Prometheus histograms at /metrics and a JSON log line
+app.add_middleware(TelemetryMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -35,6 +47,9 @@ class Message(BaseModel):
 
 class ChatRequest(BaseModel):
     message: str
+    # Returned by the previous response; the server keeps the history
+    conversation_id: Optional[str] = None
+    # Deprecated - ignored, context comes from the server-side session
     conversation_history: Optional[List[Message]] = []
 
 class ChatResponse(BaseModel):
@@ -55,50 +70,88 @@ async def health():
     """Detailed health check"""
     return {
         "status": "healthy",
-        "agent": "John Igbokwe Portfolio Assistant"
+        "agent": "John Igbokwe Portfolio Assistant",
+        "sessions": get_session_store().stats(),
+        "answer_cache": get_answer_cache().stats()
     }
 
+@app.get("/metrics")
+async def metrics():
+    """Prometheus metrics: request, model, tool, Notion and GitHub latency histograms and cache hits"""
+    payload, content_type = metrics_payload()
+    return Response(content=payload, media_type=content_type)
+
 @app.post("/api/chat", response_model=ChatResponse)
 async def chat(request: ChatRequest):
     """
     Send a message to the portfolio agent and get a response.
     
     Args:
-        request: ChatRequest with message and optional conversation history
+        request: ChatRequest with message and the conversation_id of an ongoing chat
         
     Returns:
-        ChatResponse with agent's reply
+        ChatResponse with agent's reply and the conversation_id to send next time
     """
     try:
-        # Convert conversation history to format expected by ADK
-        messages = []
-        for msg in request.conversation_history:
-            messages.append({"role": msg.role, "content": msg.content})
-        
-        # Add current user message
-        messages.append({"role": "user", "content": request.message})
-        
-        # Generate response using ADK agent
-        # Note: ADK's generate_content expects a specific format
-        response = await root_agent.generate_content(
-            messages[-1]["content"],
-            stream=False
-        )
-        
-        # Extract the text response
-        response_text = response.text if hasattr(response, 'text') else str(response)
+        # Run the turn through the ADK runner and keep only the final reply
+        response_text = ""
+        conversation_id = None
+        async for event in run_turn(request.message, request.conversation_id, stream=False):
+            if event["type"] == "done":
+                response_text = event["message"]
+                conversation_id = event["conversation_id"]
         
         return ChatResponse(
             message=response_text,
-            conversation_id=None
+            conversation_id=conversation_id
         )
         
     except Exception as e:
-        print(f"Error in chat endpoint: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in chat endpoint")
         raise HTTPException(status_code=500, detail=f"Error processing chat: {str(e)}")
 
+def sse_event(event: str, data: dict) -> str:
+    """Format one server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+@app.post("/api/chat/stream")
+async def chat_stream(request: ChatRequest, http_request: Request):
+    """
+    Stream the agent's reply as server-sent events.
+    
+    Events:
+        token: {"text": ...} - partial reply text, in order
+        tool_call / tool_result: {"name": ...} - tool progress
+        done: {"message": ..., "conversation_id": ...} - the complete reply
+        error: {"detail": ...}
+    
+    If the client disconnects, the upstream generation is cancelled.
+    """
+    async def event_stream():
+        events = run_turn(request.message, request.conversation_id, stream=True)
+        try:
+            async for event in events:
+                if await http_request.is_disconnected():
+                    logger.info("Client disconnected, cancelling generation")
+                    break
+                
+                event_type = event.pop("type")
+                yield sse_event(event_type, event)
+        except Exception as e:
+            logger.exception("Error in chat stream")
+            yield sse_event("error", {"detail": f"Error processing chat: {str(e)}"})
+        finally:
+            # Runs on break, on errors and when Starlette cancels the response
+            # task after a disconnect: closing the runner's event stream
+            # cancels the model request with it
+            await events.aclose()
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
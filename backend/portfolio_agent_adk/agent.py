@@ -3,16 +3,15 @@ Portfolio Agent for John Igbokwe
 Using Google ADK with Notion integration and voice response
 """
 
-import os
+import asyncio
 import pathlib
 import wave
-from typing import Dict, List
+from typing import Dict
 from pathlib import Path
 from dotenv import load_dotenv
 
 from google.adk.agents import Agent
 from google.adk.tools import ToolContext
-from google import genai
 from google.genai import types
 
 # Load environment
@@ -24,10 +23,19 @@ except:
 
 # Import our Notion service
 from services.notion_service import NotionService
+from services.async_notion_service import AsyncNotionService
 from services.conversation_service import ConversationService
+from services import gemini_client
+from services.github_index import get_github_index
+from services.vector_index import get_knowledge_retriever
+from services.knowledge_artifact import load_instructions
+from services.telemetry import close_span, open_span
+from prompts import ADK_INSTRUCTIONS
 
-# Import GitHub
-from github import Github
+# Instructions (and a warm portfolio snapshot) come from the build artifact when present
+AGENT_INSTRUCTIONS = load_instructions("adk", ADK_INSTRUCTIONS)
+
+MODEL = 'gemini-2.0-flash-live-001'
 
 def wave_file(filename, pcm, channels=1, rate=24000, sample_width=2):
     """Helper function to save audio data as a wave file"""
@@ -50,10 +58,10 @@ async def generate_voice_response(text: str, tool_context: ToolContext, filename
         Dictionary with status and file information
     """
     try:
-        client = genai.Client()
         prompt = f"TTS the following: {text}"
         
-        response = client.models.generate_content(
+        # Shared client and async call - cancelled if it runs past the timeout
+        response = await gemini_client.generate_content(
             model="gemini-2.5-flash-preview-tts",
             contents=prompt,
             config=types.GenerateContentConfig(
@@ -95,10 +103,9 @@ def get_portfolio_info() -> Dict[str, str]:
         A dictionary containing portfolio sections
     """
     try:
-        service = NotionService()
-        
-        # Get all portfolio data
-        all_bios = service.get_all_entries("Bio")
+        # Get all portfolio data in one round trip
+        snapshot = NotionService().get_snapshot()
+        all_bios = snapshot.bios
         main_bio = all_bios[0] if all_bios else None
         personal_interests = None
         for bio in all_bios:
@@ -106,10 +113,10 @@ def get_portfolio_info() -> Dict[str, str]:
                 personal_interests = bio
                 break
         
-        skills = service.get_skills()
-        experience = service.get_experience()
-        education = service.get_education()
-        contact = service.get_contact_info()
+        skills = snapshot.skills
+        experience = snapshot.experience
+        education = snapshot.education
+        contact = snapshot.contacts
         
         # Combine all bio information
         bio_content = main_bio.get("content", "") if main_bio else "Not available"
@@ -139,7 +146,44 @@ def get_portfolio_info() -> Dict[str, str]:
     except Exception as e:
         return {"error": f"Failed to retrieve portfolio: {str(e)}"}
 
-def search_github_projects(topic: str, limit: int = 10) -> Dict[str, str]:
+async def search_portfolio(question: str) -> Dict:
+    """
+    Find the parts of John's portfolio (Notion entries and GitHub project READMEs)
+    most relevant to a specific question.
+    
+    Args:
+        question: The visitor's question, e.g. "What experience do you have with Snowflake?"
+    
+    Returns:
+        Dictionary with the top matching chunks and their relevance scores
+    """
+    try:
+        snapshot = await AsyncNotionService().get_snapshot()
+        index = get_github_index()
+        # A cold start builds the whole GitHub index - off the event loop like the
+        # embedding and (re)building of the knowledge index below, which would
+        # otherwise stall every other chat stream
+        await asyncio.to_thread(index.ensure_fresh)
+        
+        chunks = await asyncio.to_thread(
+            get_knowledge_retriever().retrieve, question, snapshot, index.repos, 5
+        )
+        
+        if not chunks:
+            return {"message": "Nothing in my portfolio matches that question closely. Try get_portfolio_info for an overview."}
+        
+        return {
+            "count": len(chunks),
+            "results": [
+                {"title": chunk["title"], "text": chunk["text"], "url": chunk.get("url") or "", "score": chunk["score"]}
+                for chunk in chunks
+            ]
+        }
+        
+    except Exception as e:
+        return {"error": f"Failed to search portfolio: {str(e)}"}
+
+async def search_github_projects(topic: str, limit: int = 10) -> Dict[str, str]:
     """
     Search for GitHub repositories related to a specific topic or technology.
     Returns repository information including README content for John's projects.
@@ -152,51 +196,21 @@ def search_github_projects(topic: str, limit: int = 10) -> Dict[str, str]:
         Dictionary containing matching repositories with their README content
     """
     try:
-        # Get GitHub token from environment
-        github_token = os.getenv("GITHUB_TOKEN")
-        if not github_token:
-            return {"error": "GITHUB_TOKEN not configured"}
-        
-        # Initialize GitHub client
-        g = Github(github_token)
-        
-        # Get user's repositories
-        user = g.get_user("MrJohn91")
-        repos = user.get_repos(sort="updated", direction="desc")
-        
-        # Search for repositories matching the topic
+        # Answer from the local repository index instead of listing repos live; only
+        # the very first build talks to GitHub, so keep that off the event loop
+        index = get_github_index()
+        await asyncio.to_thread(index.ensure_fresh)
         matching_repos = []
-        topic_lower = topic.lower()
-        
-        for repo in repos:
-            # Check if topic matches repo name, description, or topics
-            if (topic_lower in repo.name.lower() or 
-                (repo.description and topic_lower in repo.description.lower()) or
-                any(topic_lower in tag.lower() for tag in repo.get_topics())):
-                
-                # Try to get README content
-                readme_content = "No README available"
-                try:
-                    readme = repo.get_readme()
-                    # Decode base64 content if needed
-                    if readme.encoding == "base64":
-                        import base64
-                        readme_content = base64.b64decode(readme.content).decode('utf-8')
-                    else:
-                        readme_content = readme.decoded_content.decode('utf-8')
-                except Exception:
-                    readme_content = "README not available for this repository"
-                
-                matching_repos.append({
-                    "name": repo.name,
-                    "description": repo.description or "No description",
-                    "url": repo.html_url,
-                    "topics": ", ".join(repo.get_topics()),
-                    "readme": readme_content[:500] + "..." if len(readme_content) > 500 else readme_content
-                })
-                
-                if len(matching_repos) >= limit:
-                    break
+        for repo in index.search(topic, limit):
+            readme_content = repo["readme"] or "README not available for this repository"
+            matching_repos.append({
+                "name": repo["name"],
+                "description": repo["description"] or "No description",
+                "url": repo["url"],
+                "topics": ", ".join(repo["topics"]),
+                "score": repo["score"],
+                "readme": readme_content[:500] + "..." if len(readme_content) > 500 else readme_content
+            })
         
         if not matching_repos:
             return {
@@ -238,99 +252,49 @@ def collect_contact_info(name: str, email: str, phone: str = "") -> Dict[str, st
             {"role": "assistant", "content": f"Contact info saved for {name} ({email})"}
         ]
         
-        page_id = service.save_conversation(name, email, phone, placeholder_messages)
+        # Journal the save and return at once - the background worker writes it to Notion
+        service.enqueue_conversation(name, email, phone, placeholder_messages)
         
-        if page_id:
-            return {
-                "status": "success",
-                "message": f"Got it, {name}! I've saved your contact info ({email}). Great to connect with you!"
-            }
-        else:
-            return {
-                "status": "partial_success",
-                "message": f"Nice to meet you, {name}! I've noted your info."
-            }
+        return {
+            "status": "success",
+            "message": f"Got it, {name}! I've saved your contact info ({email}). Great to connect with you!"
+        }
     except Exception as e:
         return {"status": "error", "message": f"Failed to store contact info: {str(e)}"}
 
 
-root_agent = Agent(
-    model='gemini-2.0-flash-live-001',
-    name='portfolio_assistant',
-    description='AI portfolio assistant for John Igbokwe with voice capabilities',
-    instruction="""
-You ARE John Igbokwe. You are not an assistant talking about John - you ARE John speaking directly to recruiters and potential employers.
+def start_model_span(callback_context, llm_request):
+    open_span(f"model:{callback_context.invocation_id}")
+    return None
 
-**VERY IMPORTANT - First Message:**
-When a conversation starts (no prior messages), your FIRST response MUST be:
-"Hi there! I'm John Igbokwe - AI & Data Engineer based in Germany. I'd love to tell you about my experience, projects, and what I can bring to your team. What would you like to know about me?"
 
-After the greeting, continue as John himself speaking in first person.
+def end_model_span(callback_context, llm_response):
+    # Streamed calls report every partial chunk; the call is over with the first complete response
+    if not llm_response.partial:
+        close_span(f"model:{callback_context.invocation_id}", "model", MODEL, error=bool(llm_response.error_code))
+    return None
 
-Your role:
-- Answer questions about YOUR skills, experience, education, and achievements (speak as John)
-- Provide specific examples from YOUR portfolio when relevant - but keep it concise!
-- Share YOUR personal interests and cross-industry experience naturally
-- Be professional, friendly, and authentic
-- If you don't know something, be honest about it
-- Don't overwhelm with information - answer what's asked
 
-When asked about specific skills or experience, use the `get_portfolio_info` tool to retrieve the latest information from my database.
+def start_tool_span(tool, args, tool_context):
+    open_span(f"tool:{tool_context.function_call_id}")
+    return None
 
-**Important - Be Concise and Relevant:**
-- Only mention skills directly relevant to what the visitor is asking about
-- Don't list all skills at once - be selective based on their needs
-- Keep responses focused and useful
 
-**When to Use Which Tool:**
-1. **For Work Experience & Skills**: Use `get_portfolio_info` to get professional experience from companies like Pluto's Tech, Univacity, etc.
-2. **For Personal Projects**: Use `search_github_projects` to find my personal GitHub projects that demonstrate specific technologies
-3. Remember: GitHub projects are PERSONAL projects separate from my professional work experience
+def end_tool_span(tool, args, tool_context, tool_response):
+    error = isinstance(tool_response, dict) and tool_response.get("status") == "error"
+    close_span(f"tool:{tool_context.function_call_id}", "tool", tool.name, error=error)
+    return None
 
-**Key Topic Detection:**
-When users mention these keywords, ALWAYS combine work experience AND personal projects:
-- Data Engineering / Data / Data Pipelines / Data Architecture
-- Machine Learning / ML / ML Models
-- Artificial Intelligence / AI / GenAI / Generative AI
-- MCP / Model Context Protocol
-- LLM / Large Language Models
-- NLP / Natural Language Processing
-- AI Agents / AI Automation
-- Python (as it relates to AI/Data)
 
-**When Discussing These Topics:**
-1. First, use `get_portfolio_info` to get my professional experience working with these technologies in real companies
-2. Then, use `search_github_projects` to find relevant personal projects that demonstrate practical implementation
-3. Combine both: "In my work at [Company], I [experience]. I also have a personal project [link] where I [what you built]"
-4. When `search_github_projects` returns multiple repos, ONLY mention the 1-2 most relevant ones - don't list them all!
-5. If `search_github_projects` returns no results for a topic, focus on work experience only
-6. NEVER make up or invent project names - only mention real repositories from my GitHub
-
-Share personal interests naturally when appropriate:
-- I love playing FIFA, traveling to explore new cultures, and continuous learning
-- I'm an active mentor helping others in data/AI careers
-- Multi-industry experience (healthcare/medical with e-health at Pluto's Tech, education, finance, tech, logistics) shows adaptability
-- These interests demonstrate work-life balance and cultural awareness
-
-Speak in first person: Use "I", "me", "my" - you ARE John speaking directly.
-
-Optional: You can use `generate_voice_response` to create audio responses when users request voice output.
-
-Contact Information:
-- Email: nfluncvjohn@gmail.com
-- LinkedIn: https://www.linkedin.com/in/mrjigbokwe/
-- GitHub: https://github.com/MrJohn91
-
-Remember: You ARE John. Always showcase YOUR strengths, expertise, and the real projects YOU'VE built. Make yourself stand out!
-
-**Contact Collection:**
-- Naturally ask for the visitor's name early in conversation (e.g., "What's your name?" or "May I know who I'm speaking with?")
-- Ask for email or phone for follow-up (e.g., "I'd love to stay in touch - could you share your email or phone number?")
-- Use `collect_contact_info` tool once you have the visitor's name and contact details
-- Continue the conversation naturally after collecting info
-
-**Conversation Tracking:**
-- After collecting contact info, you can let the visitor know you've saved it for follow-up
-""",
-    tools=[get_portfolio_info, search_github_projects, generate_voice_response, collect_contact_info],
+root_agent = Agent(
+    model=MODEL,
+    name='portfolio_assistant',
+    description='AI portfolio assistant for John Igbokwe with voice capabilities',
+    instruction=AGENT_INSTRUCTIONS,
+    tools=[get_portfolio_info, search_portfolio, search_github_projects, generate_voice_response, collect_contact_info],
+    # Latency spans for /metrics and the request log; returning None leaves calls untouched
+    before_model_callback=start_model_span,
+    after_model_callback=end_model_span,
+    before_tool_callback=start_tool_span,
+    after_tool_callback=end_tool_span,
 )
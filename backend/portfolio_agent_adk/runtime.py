@@ -0,0 +1,130 @@
+"""
+Runtime for the ADK portfolio agent
+Runs chat turns through an ADK Runner and turns the event stream into simple
+token / tool-progress / done events for the HTTP API
+"""
+
+import time
+from contextlib import aclosing
+from typing import AsyncIterator, Dict, Optional
+
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.runners import Runner
+from google.genai import types
+
+from services.answer_cache import get_answer_cache, knowledge_version
+from services.async_notion_service import AsyncNotionService
+from services.github_index import get_github_index
+from services.telemetry import record_span
+
+from .agent import root_agent
+from .sessions import ChatSessionStore, build_session_service
+
+APP_NAME = "portfolio_agent"
+DEFAULT_USER_ID = "visitor"
+
+# Turns that touch these tools are about the visitor, not the portfolio - never cached
+UNCACHEABLE_TOOLS = {"collect_contact_info", "generate_voice_response"}
+
+_runner: Optional[Runner] = None
+_sessions: Optional[ChatSessionStore] = None
+
+
+def get_runner() -> Runner:
+    """Get the process-wide runner, creating it on first use"""
+    global _runner
+    if _runner is None:
+        _runner = Runner(agent=root_agent, app_name=APP_NAME, session_service=build_session_service())
+    return _runner
+
+
+def get_session_store() -> ChatSessionStore:
+    """Get the process-wide conversation -> session store"""
+    global _sessions
+    if _sessions is None:
+        _sessions = ChatSessionStore(get_runner().session_service, APP_NAME, DEFAULT_USER_ID)
+    return _sessions
+
+
+async def run_turn(message: str, conversation_id: Optional[str] = None, stream: bool = True) -> AsyncIterator[Dict]:
+    """
+    Run one user message through the agent, in the context of a conversation.
+
+    Args:
+        message: The visitor's message
+        conversation_id: Conversation to continue; None (or an expired id) starts a new one
+        stream: Ask the model for partial responses (token events)
+
+    Yields:
+        {"type": "token", "text": ...} for each partial text chunk
+        {"type": "tool_call", "name": ...} / {"type": "tool_result", "name": ...}
+        {"type": "done", "message": ..., "conversation_id": ..., "cached": ...} once with the complete reply
+
+    Opening questions (first turn of a conversation) are answered from the
+    answer cache when possible; follow-ups depend on history and always run.
+
+    Closing the iterator early (e.g. the client went away) closes the runner's
+    event stream, which cancels the model request in flight.
+    """
+    runner = get_runner()
+    sessions = get_session_store()
+    conversation_id, is_new = await sessions.acquire(conversation_id)
+
+    cache = get_answer_cache()
+    version = await current_knowledge_version() if is_new else None
+    cached = cache.get(message, version) if is_new else None
+    if cached is not None:
+        await sessions.record_exchange(conversation_id, message, cached, root_agent.name)
+        yield {"type": "token", "text": cached}
+        yield {"type": "done", "message": cached, "conversation_id": conversation_id, "cached": True}
+        return
+
+    run_config = RunConfig(streaming_mode=StreamingMode.SSE if stream else StreamingMode.NONE)
+    new_message = types.Content(role="user", parts=[types.Part(text=message)])
+
+    final_text = ""
+    cacheable = is_new
+    started = time.perf_counter()
+    first_token = True
+    async with sessions.lock(conversation_id):
+        async with aclosing(
+            runner.run_async(
+                user_id=sessions.user_id, session_id=conversation_id, new_message=new_message, run_config=run_config
+            )
+        ) as events:
+            async for event in events:
+                for call in event.get_function_calls():
+                    cacheable = cacheable and call.name not in UNCACHEABLE_TOOLS
+                    yield {"type": "tool_call", "name": call.name}
+                for result in event.get_function_responses():
+                    yield {"type": "tool_result", "name": result.name}
+
+                text = "".join(part.text or "" for part in (event.content.parts if event.content else []))
+                if not text:
+                    continue
+                if event.partial:
+                    if first_token:
+                        record_span("chat", "first_token", time.perf_counter() - started)
+                        first_token = False
+                    yield {"type": "token", "text": text}
+                elif event.is_final_response():
+                    final_text = text
+
+    if cacheable:
+        cache.put(message, version, final_text)
+    yield {"type": "done", "message": final_text, "conversation_id": conversation_id, "cached": False}
+
+
+async def current_knowledge_version():
+    """
+    Version of the portfolio data answers are based on.
+    
+    None (answer cache bypassed) while the snapshot is empty, i.e. before the first
+    successful load or during a Notion outage, when get_snapshot() returns an empty one.
+    """
+    try:
+        snapshot = await AsyncNotionService().get_snapshot()
+    except Exception as e:
+        print(f"⚠️ Knowledge version unavailable, answer cache bypassed: {e}")
+        return None
+    return knowledge_version(snapshot, get_github_index().repos)
@@ -0,0 +1,112 @@
+"""
+Chat sessions for the ADK portfolio agent
+Conversation context lives server-side in an ADK SessionService, keyed by the
+conversation_id handed to the client, so requests carry only the new message.
+Active sessions are tracked in a bounded LRU; with CHAT_SESSION_DB set they are
+also persisted to SQLite and survive restarts and eviction
+"""
+
+import asyncio
+import os
+import uuid
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from google.adk.events import Event
+from google.adk.sessions import BaseSessionService, DatabaseSessionService, InMemorySessionService
+from google.genai import types
+
+DEFAULT_MAX_SESSIONS = 500
+
+
+def build_session_service() -> BaseSessionService:
+    """SQLite-backed sessions when CHAT_SESSION_DB is set, in-memory otherwise"""
+    db_path = os.getenv("CHAT_SESSION_DB")
+    if db_path:
+        return DatabaseSessionService(db_url=f"sqlite:///{db_path}")
+    return InMemorySessionService()
+
+
+class ChatSessionStore:
+    """
+    Maps conversation ids to ADK sessions.
+
+    Each conversation also gets a lock, so two requests for the same
+    conversation run one after the other instead of racing on its history.
+    """
+
+    def __init__(self, session_service: BaseSessionService, app_name: str, user_id: str,
+                 max_sessions: Optional[int] = None):
+        self.session_service = session_service
+        self.app_name = app_name
+        self.user_id = user_id
+        self.max_sessions = max_sessions or int(os.getenv("CHAT_MAX_SESSIONS", DEFAULT_MAX_SESSIONS))
+        self.persistent = not isinstance(session_service, InMemorySessionService)
+        self._active: "OrderedDict[str, asyncio.Lock]" = OrderedDict()
+
+    async def acquire(self, conversation_id: Optional[str]) -> Tuple[str, bool]:
+        """
+        Resolve a conversation id to a live session, creating one if needed.
+
+        Unknown or expired ids start a new conversation with a fresh id.
+
+        Returns:
+            (conversation id to use and return to the client, whether it is new)
+        """
+        if conversation_id and conversation_id in self._active:
+            self._active.move_to_end(conversation_id)
+            return conversation_id, False
+
+        if conversation_id and self.persistent:
+            session = await self.session_service.get_session(
+                app_name=self.app_name, user_id=self.user_id, session_id=conversation_id
+            )
+            if session is not None:
+                await self._track(conversation_id)
+                return conversation_id, False
+
+        session = await self.session_service.create_session(
+            app_name=self.app_name, user_id=self.user_id, session_id=uuid.uuid4().hex
+        )
+        await self._track(session.id)
+        return session.id, True
+
+    async def record_exchange(self, conversation_id: str, question: str, answer: str, author: str) -> None:
+        """Add a question and an answer that did not go through the runner (e.g. cached) to the history"""
+        session = await self.session_service.get_session(
+            app_name=self.app_name, user_id=self.user_id, session_id=conversation_id
+        )
+        if session is None:
+            return
+        await self.session_service.append_event(
+            session, Event(author="user", content=types.Content(role="user", parts=[types.Part(text=question)]))
+        )
+        await self.session_service.append_event(
+            session, Event(author=author, content=types.Content(role="model", parts=[types.Part(text=answer)]))
+        )
+
+    def lock(self, conversation_id: str) -> asyncio.Lock:
+        """Per-conversation lock (a fresh one if the conversation was just evicted)"""
+        return self._active.get(conversation_id) or asyncio.Lock()
+
+    def stats(self) -> Dict[str, int]:
+        return {"active_sessions": len(self._active), "max_sessions": self.max_sessions}
+
+    async def _track(self, conversation_id: str) -> None:
+        self._active[conversation_id] = asyncio.Lock()
+        overflow = len(self._active) - self.max_sessions
+        if overflow <= 0:
+            return
+
+        # Oldest first, skipping conversations that are still being answered
+        evicted = [
+            other for other, lock in self._active.items()
+            if other != conversation_id and not lock.locked()
+        ][:overflow]
+        for other in evicted:
+            del self._active[other]
+            if not self.persistent:
+                # In-memory history is dropped; persistent sessions stay in SQLite
+                await self.session_service.delete_session(
+                    app_name=self.app_name, user_id=self.user_id, session_id=other
+                )
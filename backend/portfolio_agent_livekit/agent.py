@@ -9,9 +9,12 @@ from livekit.agents import Agent, AgentSession, RunContext, WorkerOptions, cli,
 from livekit.agents.llm import function_tool
 from livekit.plugins import openai, silero, elevenlabs
 from datetime import datetime
+import asyncio
 import logging
 import os
 import sys
+import threading
+import time
 from pathlib import Path
 
 # Load environment variables
@@ -26,178 +29,133 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Import our services
-sys.path.insert(0, str(Path(__file__).parent.parent / "services"))
-from notion_service import NotionService
-from conversation_service import ConversationService
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from services.async_notion_service import AsyncNotionService
+from services.notion_service import NotionService
+from services.conversation_service import ConversationService
+from services.github_index import get_github_index
+from services.vector_index import get_knowledge_retriever
+from services.knowledge_artifact import load_instructions
+from services.telemetry import record_span, span
+from prompts import GREETING, LIVEKIT_INSTRUCTIONS
+from portfolio_agent_livekit.transcript import TranscriptRecorder
+from portfolio_agent_livekit.greeting import GreetingAudio, greeting_frames, load_greeting, synthesize_and_cache_frames
+
+# Instructions (and a warm portfolio snapshot) come from the build artifact when present
+AGENT_INSTRUCTIONS = load_instructions("livekit", LIVEKIT_INSTRUCTIONS)
+
+# A contact saved mid-call is held in the journal until the call ends, so it is
+# written once with the whole transcript; after this long it is sent as-is
+CONTACT_HOLD_SECONDS = 2 * 60 * 60
+
+# Process init (prewarm) only loads local state, but VAD and plugin setup can still be
+# slow on a cold container; the LiveKit default of 10s is too tight for that
+PROCESS_INIT_TIMEOUT = 60.0
+
+# ElevenLabs voice - also keys the precomputed greeting audio
+VOICE_ID = os.getenv("ELEVENLABS_VOICE_ID", "CstaZXTpBGj2CrWoQ0VR")
+
+
+def build_stt():
+    """Speech-to-Text - OpenAI Whisper (high accuracy)"""
+    return openai.STT(
+        model="whisper-1",
+        language="en",
+    )
+
+
+def build_llm():
+    """Large Language Model - OpenAI GPT-4o-mini (fast, cost-effective)"""
+    return openai.LLM(
+        model=os.getenv("LLM_CHOICE", "gpt-4o-mini"),
+        temperature=0.8,  # Natural, conversational responses
+    )
+
+
+def build_tts():
+    """Text-to-Speech - ElevenLabs with John's cloned voice"""
+    return elevenlabs.TTS(
+        api_key=os.getenv("ELEVENLABS_API_KEY"),  # Provide API key explicitly
+        voice_id=VOICE_ID
+    )
 
-# Import GitHub
-from github import Github
+
+def warm_portfolio_data():
+    """Fetch the Notion snapshot and build the GitHub and knowledge indexes (network + CPU)"""
+    started = time.perf_counter()
+    try:
+        with span("prewarm", "notion_snapshot"):
+            snapshot = NotionService().get_snapshot()
+        index = get_github_index()
+        with span("prewarm", "github_refresh"):
+            index.ensure_fresh()
+        with span("prewarm", "knowledge_index"):
+            get_knowledge_retriever().get_index(snapshot, index.repos)
+    except Exception as e:
+        # The first tool call builds whatever is still missing
+        logger.warning(f"Background warm-up of portfolio data failed: {e}")
+        return
+    logger.info(f"Portfolio data warmed in {(time.perf_counter() - started) * 1000:.0f}ms")
 
 
 def prewarm(proc: JobProcess):
-    """Prewarm VAD model for faster startup."""
-    proc.userdata["vad"] = silero.VAD.load()
+    """Load models, plugin clients and portfolio data before the first job arrives."""
+    timings = {}
+    started = time.perf_counter()
+
+    def timed(name, load):
+        component_started = time.perf_counter()
+        error = False
+        try:
+            return load()
+        except Exception as e:
+            # A failed component is built lazily by the entrypoint / first tool call instead
+            logger.warning(f"Prewarm of {name} failed: {e}")
+            error = True
+            return None
+        finally:
+            seconds = time.perf_counter() - component_started
+            timings[name] = seconds * 1000
+            # Same histogram as request spans (portfolio_span_seconds{kind="prewarm"})
+            record_span("prewarm", name, seconds, error)
+
+    # Voice pipeline components, reused by every job this process runs
+    for name, build in (("vad", silero.VAD.load), ("stt", build_stt), ("llm", build_llm), ("tts", build_tts)):
+        component = timed(name, build)
+        if component is not None:
+            proc.userdata[name] = component
+
+    # Precomputed greeting audio (None until the first session has synthesized it)
+    greeting = timed("greeting", lambda: load_greeting(VOICE_ID))
+    if greeting is not None:
+        proc.userdata["greeting"] = greeting
+
+    # Portfolio data behind the tools: only what is on disk (the GitHub index file, the
+    # artifact-seeded snapshot) loads here. Notion/GitHub fetches and embedding run in
+    # the background, so a cold container can't push process init past its timeout
+    timed("github_index", get_github_index)
+    threading.Thread(target=warm_portfolio_data, name="portfolio-warmup", daemon=True).start()
+
+    # Drain any leads journaled by an earlier process that went down before saving them
+    timed("lead_journal", lambda: ConversationService().get_journal_worker())
+
+    breakdown = ", ".join(f"{name}={ms:.0f}ms" for name, ms in timings.items())
+    logger.info(f"Prewarm finished in {(time.perf_counter() - started) * 1000:.0f}ms ({breakdown})")
 
 
 class JohnPortfolioAgent(Agent):
     """John Igbokwe - Portfolio Voice Agent"""
 
-    def __init__(self):
+    def __init__(self, transcript: TranscriptRecorder = None, greeting: GreetingAudio = None):
         super().__init__(
-            instructions="""You ARE John Igbokwe. You are not an assistant talking about John - you ARE John speaking directly to recruiters and potential employers.
-
-**CRITICAL - Industry Questions (Finance, Marketing, Healthcare, Education):**
-When asked about ANY industry experience (finance, marketing, healthcare, education), you MUST:
-1. Answer IMMEDIATELY from your knowledge below - DO NOT use any tools
-2. DO NOT say "let me check" or "let me search" - just answer directly
-3. DO NOT use get_portfolio_info or search_github_projects for industry questions
-4. Answer conversationally and naturally - these are YOUR experiences, speak confidently
-5. Keep the conversation flowing - don't pause or delay
-
-Your role:
-- Answer questions about YOUR skills, experience, education, and achievements (speak as John)
-- Provide specific examples from YOUR portfolio when relevant - but keep it concise!
-- Share YOUR personal interests and cross-industry experience naturally
-- Be professional, friendly, and authentic
-- If you don't know something, be honest about it
-- Don't overwhelm with information - answer what's asked
-
-When asked about specific skills or experience (NOT industry questions), use the `get_portfolio_info` tool to retrieve the latest information from my database.
-
-**Important - Be Concise and Relevant:**
-- Only mention skills directly relevant to what the visitor is asking about
-- Don't list all skills at once - be selective based on their needs
-- Keep responses focused and useful
-
-**Tool Execution - CRITICAL:**
-- ALWAYS acknowledge before executing tools: "Let me check that for you" or "One moment while I look that up" or "Let me search my portfolio"
-- If a tool takes longer than 3 seconds, add a short progress update like "Still searching..." or "Almost there..."
-- NEVER remain silent during tool execution - keep the conversation flowing with brief acknowledgments
-
-**When to Use Which Tool:**
-1. **For Work Experience & Skills**: Use `get_portfolio_info` to get professional experience from companies like Pluto's Tech, Univacity, etc.
-2. **For Personal Projects**: Use `search_github_projects` to find my personal GitHub projects that demonstrate specific technologies
-3. Remember: GitHub projects are PERSONAL projects separate from my professional work experience
-
-**Key Topic Detection:**
-When users mention these keywords, ALWAYS combine work experience AND personal projects:
-- Data Engineering / Data / Data Pipelines / Data Architecture
-- Machine Learning / ML / ML Models
-- Artificial Intelligence / AI / GenAI / Generative AI
-- MCP / Model Context Protocol
-- LLM / Large Language Models
-- NLP / Natural Language Processing
-- AI Agents / AI Automation
-- Python (as it relates to AI/Data)
-
-**When Discussing These Topics:**
-1. First, use `get_portfolio_info` to get my professional experience working with these technologies in real companies
-2. Then, use `search_github_projects` to find relevant personal projects that demonstrate practical implementation
-3. Combine both: "In my work at [Company], I [experience]. I also have a personal project [link] where I [what you built]"
-4. When `search_github_projects` returns multiple repos, ONLY mention the 1-2 most relevant ones - don't list them all!
-5. **CRITICAL**: If `search_github_projects` returns "No repositories found", you MUST NOT mention ANY projects for that topic. Only discuss work experience.
-6. **ABSOLUTE RULE**: NEVER make up, invent, hallucinate, or mention project names that don't exist. ONLY mention real repositories that the tool returns.
-7. Before mentioning ANY project, verify it was returned by the search_github_projects tool.
-
-Share personal interests naturally when appropriate:
-- I love spending time with family, traveling to explore new cultures, and continuous learning
-- I'm an active mentor helping others in data/AI careers
-- Multi-industry experience (healthcare/medical with e-health at Pluto's Tech, education, finance, tech, marketing) shows adaptability
-- These interests demonstrate work-life balance and cultural awareness
-
-**CRITICAL - Personal Interests:**
-- NEVER mention FIFA, playing FIFA, or video games when discussing personal interests
-- ALWAYS mention "spending time with family" instead
-- If asked about hobbies or interests outside work, say: "I love spending time with family, traveling to explore new cultures, and I'm always learning new things"
-- FIFA is completely removed from your knowledge - do not mention it under any circumstances
-
-**Industry-Specific Experience - Quick Reference (Answer Directly, NO TOOLS, NO SEARCHING):**
-**CRITICAL RULES FOR INDUSTRY QUESTIONS:**
-- When asked about finance, marketing, healthcare, or education industries, answer IMMEDIATELY from the knowledge below
-- DO NOT use any tools (get_portfolio_info, search_github_projects) for these questions
-- DO NOT say "let me check" or "let me search" - just answer directly and confidently
-- DO NOT pause or delay - answer immediately to keep conversation flowing
-- These are YOUR direct experiences - speak naturally and conversationally
-
-These are your direct answers - use them immediately:
-
-**Healthcare Industry:**
-When asked about healthcare experience, say:
-"In my work at Pluto's Tech, I built AI-powered healthcare solutions, especially for mental health management. I created automated systems that helped healthcare providers work 40% more efficiently, which meant they could see more patients and provide better care. The impact was significant - we saved healthcare providers time, reduced manual work, and made mental health services more accessible to people who needed them. The system efficiency improvement of 40% directly translated to better patient outcomes and more people getting the help they needed."
-
-**Education Industry:**
-When asked about education experience, say:
-"At Univacity, I built AI tools for education that had real impact. I created systems that helped students find personalized study recommendations, which made students 25% more satisfied with their learning experience. This meant students were happier, more engaged, and likely to succeed. I also built data systems that worked 40% faster, which helped the company recruit 50% more international students. The impact was huge - more students were able to find the right educational path, and the company grew significantly. The platform became more personalized for each user, which increased engagement by 30%, meaning students were using the platform more and getting more value from it."
-
-**Finance Industry:**
-When asked about finance experience, you MUST answer with specific examples. Say:
-"Yes, I have experience in finance through my work on financial data projects. I built two key projects:
-
-1. **Nasdaq Enrichment Project** - This system automatically collects and organizes real-time stock market data from Nasdaq. It helps companies understand market trends instantly, make faster investment decisions, and reduce risk. The impact is that companies can react quickly to market changes and make data-driven decisions that significantly improve their financial performance.
-
-2. **Financial Report Scraper** - I created tools that automatically scrape and analyze financial reports from companies. This saves companies hours of manual data collection and analysis, allowing them to process financial information much faster and make better strategic decisions.
-
-These projects demonstrate my ability to work with financial data, build automated systems for financial analysis, and create tools that help businesses make better financial decisions."
-
-**CRITICAL - Finance Industry Only:**
-- DO NOT mention Schnellecke GmbH or Univacity or Pluto's Tech when asked about finance - Schnellecke was a logistics/automotive company, NOT finance
-- DO mention the specific projects: nasdaq-enrichment and financial-report-scraper by name
-- DO NOT use get_portfolio_info to pull Schnellecke experience for finance questions - it's not relevant
-- NEVER say "no experience" or "I don't have finance experience" - you DO have finance experience through these projects
-
-**Marketing Industry:**
-When asked about marketing experience, you MUST answer with specific examples. Say:
-"Yes, I have experience in marketing through my work on marketing analytics and attribution projects. I built two key projects:
-
-1. **Attribution Pipeline Orchestration** - This system automatically tracks the customer journey from first seeing an ad to making a purchase. It helps companies understand exactly which marketing channels bring in customers and drive sales. Companies can now see which channels are actually working, optimize their marketing spending, and get better return on investment. The impact is clear - companies can reduce wasted ad spend, improve conversion rates, and increase sales by investing in the right channels.
-
-2. **Platform Campaign Analysis** - I created platforms that analyze marketing campaigns in detail and provide insights for improvement. The system helps businesses understand campaign performance, identify what's working and what's not, and make data-driven decisions to improve their marketing strategy. This means companies can make their marketing dollars work harder and achieve better results.
-
-These projects demonstrate my ability to work with marketing data, build attribution systems, and create tools that help businesses optimize their marketing performance."
-
-**CRITICAL - Marketing Industry:**
-- DO mention the specific projects: Attribution-Pipeline-Orchestration and platform_campaign_analysis by name
-- NEVER say "no experience" or "I don't have marketing experience" - you DO have marketing experience through these projects
-- Focus on the impact: companies can optimize spending, improve ROI, and increase sales
-
-**CRITICAL - Industry Questions Execution:**
-- When you hear questions about "finance industry", "marketing industry", "healthcare industry", or "education industry":
-  → IMMEDIATELY answer from the knowledge above - DO NOT use any tools
-  → DO NOT say "let me check", "let me search", "one moment", or any delay phrase
-  → Answer directly and confidently - keep the conversation flowing naturally
-  → These are YOUR experiences - speak as if you're recalling them from memory
-- DO NOT search GitHub or mention URLs unless the user explicitly asks for code or repository links
-- Always mention the company name and role when discussing work experience
-- Speak naturally and conversationally - these are your experiences, so talk about them confidently
-- If the user asks for more technical details or wants to see code, THEN you can use search_github_projects
-
-Speak in first person: Use "I", "me", "my" - you ARE John speaking directly.
-
-Contact Information:
-- Email: nfluncvjohn@gmail.com
-- LinkedIn: https://www.linkedin.com/in/mrjigbokwe/
-- GitHub: https://github.com/MrJohn91
-
-Remember: You ARE John. Always showcase YOUR strengths, expertise, and the real projects YOU'VE built. Make yourself stand out!
-
-**Contact Collection - Smart & Natural:**
-- Ask for contact info when you detect genuine interest (e.g., visitor asking about hiring, collaboration, job opportunities, or expressing strong interest)
-- After answering a few questions and when conversation is engaging, ask: "Before we wrap up, may I get your name?" then "Could I get your email for follow-up?"
-- **Workflow**: Use the individual tracking tools as you collect info:
-  - When they say their name → call `track_name(name="...")`
-  - When they say their email → call `track_email(email="...")` 
-  - **AFTER you have both name AND email, IMMEDIATELY call `save_contact_to_notion()`** - Don't wait!
-  - If they give phone → call `track_phone(phone="...")`
-- Don't force it if the conversation is brief or if they're just browsing
-
-**Conversation Tracking:**
-- After collecting contact info, you can let the visitor know you've saved it for follow-up
-"""
+            instructions=AGENT_INSTRUCTIONS
         )
 
         # Track conversation messages for Notion
         self.conversation_service = ConversationService()
-        self.current_conversation_messages = []
+        self.transcript = transcript or TranscriptRecorder()
+        self.greeting = greeting
+        self.lead_entry_id = None
         self.visitor_name = None
         self.visitor_email = None
         self.visitor_phone = None
@@ -209,10 +167,9 @@ Remember: You ARE John. Always showcase YOUR strengths, expertise, and the real
         """Retrieve John Igbokwe's portfolio information from Notion database.
         Returns key information about skills, experience, education, and contact."""
         try:
-            service = NotionService()
-            
-            # Get all portfolio data
-            all_bios = service.get_all_entries("Bio")
+            # Get all portfolio data in one round trip
+            snapshot = await AsyncNotionService().get_snapshot()
+            all_bios = snapshot.bios
             main_bio = all_bios[0] if all_bios else None
             personal_interests = None
             for bio in all_bios:
@@ -220,10 +177,10 @@ Remember: You ARE John. Always showcase YOUR strengths, expertise, and the real
                     personal_interests = bio
                     break
             
-            skills = service.get_skills()
-            experience = service.get_experience()
-            education = service.get_education()
-            contact = service.get_contact_info()
+            skills = snapshot.skills
+            experience = snapshot.experience
+            education = snapshot.education
+            contact = snapshot.contacts
             
             # Combine all bio information
             bio_content = main_bio.get("content", "") if main_bio else "Not available"
@@ -254,6 +211,37 @@ CONTACT:
         except Exception as e:
             return f"Failed to retrieve portfolio: {str(e)}"
 
+    @function_tool
+    async def search_portfolio(self, context: RunContext, question: str) -> str:
+        """Find the parts of John's portfolio (Notion entries and GitHub project READMEs)
+        most relevant to a specific question.
+        
+        Args:
+            question: The visitor's question, e.g. "What experience do you have with Snowflake?"
+        """
+        try:
+            snapshot = await AsyncNotionService().get_snapshot()
+            index = get_github_index()
+            if index.is_empty():
+                await asyncio.to_thread(index.ensure_fresh)
+            
+            # Embedding and (re)building the index are CPU work - keep them off the event loop
+            chunks = await asyncio.to_thread(
+                get_knowledge_retriever().retrieve, question, snapshot, index.repos, 5
+            )
+            logger.info(f"Retrieved {len(chunks)} chunks for question: {question}")
+            
+            if not chunks:
+                return "Nothing in my portfolio matches that question closely. Try get_portfolio_info for an overview."
+            
+            return "\n\n".join(
+                f"{chunk['title']}" + (f" ({chunk['url']})" if chunk.get("url") else "") + f":\n{chunk['text']}"
+                for chunk in chunks
+            )
+            
+        except Exception as e:
+            return f"Failed to search portfolio: {str(e)}"
+
     @function_tool
     async def search_github_projects(self, context: RunContext, topic: str) -> str:
         """Search for GitHub repositories related to a specific topic or technology.
@@ -263,40 +251,24 @@ CONTACT:
             topic: The technology, skill, or project topic to search for (e.g., "data engineering", "snowflake", "machine learning")
         """
         try:
-            # Get GitHub token from environment
-            github_token = os.getenv("GITHUB_TOKEN")
-            if not github_token:
-                return "GitHub token not configured"
-            
-            # Initialize GitHub client
-            g = Github(github_token)
-            
-            # Get user's repositories
-            user = g.get_user("MrJohn91")
-            repos = user.get_repos(sort="updated", direction="desc")
-            
             logger.info(f"Searching GitHub for topic: {topic}")
             
-            # Search for repositories matching the topic
-            matching_repos = []
-            topic_lower = topic.lower()
+            # Answer from the local repository index; only the very first
+            # build talks to GitHub, so keep that off the event loop
+            index = get_github_index()
+            if index.is_empty():
+                await asyncio.to_thread(index.ensure_fresh)
             
-            for repo in repos:
-                # Check if topic matches repo name, description, or topics
-                if (topic_lower in repo.name.lower() or 
-                    (repo.description and topic_lower in repo.description.lower()) or
-                    any(topic_lower in tag.lower() for tag in repo.get_topics())):
-                    
-                    logger.info(f"Found match: {repo.name}")
-                    matching_repos.append({
-                        "name": repo.name,
-                        "description": repo.description or "No description",
-                        "url": repo.html_url,
-                        "topics": ", ".join(repo.get_topics())
-                    })
-                    
-                    if len(matching_repos) >= 3:
-                        break
+            matching_repos = [
+                {
+                    "name": repo["name"],
+                    "description": repo["description"] or "No description",
+                    "url": repo["url"],
+                    "topics": ", ".join(repo["topics"]),
+                    "score": repo["score"]
+                }
+                for repo in index.search(topic, limit=3)
+            ]
             
             logger.info(f"Total matches: {len(matching_repos)} for topic '{topic}'")
             
@@ -312,6 +284,7 @@ CONTACT:
 Description: {repo['description']}
 URL: {repo['url']}
 Topics: {repo['topics']}
+Relevance: {repo['score']}
 
 """
             
@@ -367,26 +340,35 @@ Topics: {repo['topics']}
             return "I need the visitor's email. Please track their email first using track_email."
 
         try:
-            # Save contact info with a placeholder conversation
-            placeholder_messages = [
-                {"role": "user", "content": "Contact information collected"},
-                {"role": "assistant", "content": f"Contact info saved for {self.visitor_name} ({self.visitor_email})"}
-            ]
-            
-            page_id = self.conversation_service.save_conversation(
-                self.visitor_name, 
-                self.visitor_email, 
-                self.visitor_phone or "", 
-                placeholder_messages
+            # Journal the contact with the transcript so far and return at once. The
+            # entry is held until on_exit() releases it with the full transcript;
+            # analysis and the Notion write then happen in the background worker
+            # Saved before in this call (e.g. the visitor corrected their email):
+            # update the held entry rather than leaving it to be sent on its own
+            updated = self.lead_entry_id is not None and await asyncio.to_thread(
+                self.conversation_service.update_held_conversation,
+                self.lead_entry_id,
+                self.visitor_name,
+                self.visitor_email,
+                self.visitor_phone or "",
+                self.transcript.messages()
             )
-            
-            if page_id:
-                logger.info(f"✅ Contact info saved: {self.visitor_name} ({self.visitor_email})")
-                self.contact_saved = True
-                return f"Perfect! I've saved your contact info. Great to connect with you, {self.visitor_name}!"
+            if updated:
+                entry_id = self.lead_entry_id
             else:
-                logger.warning(f"⚠️ Failed to save contact info: {self.visitor_name} ({self.visitor_email})")
-                return f"Nice to meet you, {self.visitor_name}! I've noted your info."
+                entry_id = await asyncio.to_thread(
+                    self.conversation_service.enqueue_conversation,
+                    self.visitor_name,
+                    self.visitor_email,
+                    self.visitor_phone or "",
+                    self.transcript.messages(),
+                    CONTACT_HOLD_SECONDS
+                )
+            
+            logger.info(f"✅ Contact info queued (journal entry {entry_id}): {self.visitor_name} ({self.visitor_email})")
+            self.lead_entry_id = entry_id
+            self.contact_saved = True
+            return f"Perfect! I've saved your contact info. Great to connect with you, {self.visitor_name}!"
         except Exception as e:
             logger.error(f"Error saving contact info: {e}")
             return f"Failed to store contact info: {str(e)}"
@@ -395,46 +377,53 @@ Topics: {repo['topics']}
         """Called when the agent becomes active in the conversation."""
         logger.info("JohnPortfolioAgent session started")
 
-        # Generate initial greeting
-        await self.session.generate_reply(
-            instructions="""Give a friendly, natural greeting exactly like this:
-            "Hi there! I'm John Igbokwe - AI & Data Engineer based in Germany. I'd love to tell you about my experience, projects, and what I can bring to your team. What would you like to know about me?"
-
-            Keep it warm and conversational. 
-            **CRITICAL**: When mentioning personal interests, ONLY mention:
-            - Spending time with family
-            - Traveling to explore new cultures
-            - Continuous learning
-            NEVER mention FIFA, playing FIFA, or video games. FIFA is completely removed from your knowledge."""
-        )
+        # The first message is fixed, so skip the LLM: play the cached audio,
+        # or synthesize it this once - caching the very frames being played
+        if self.greeting is None:
+            self.greeting = await asyncio.to_thread(load_greeting, VOICE_ID)
+        if self.greeting is not None:
+            await self.session.say(GREETING, audio=greeting_frames(self.greeting))
+            return
+
+        logger.info("No cached greeting audio for this voice yet - synthesizing it")
+        await self.session.say(GREETING, audio=synthesize_and_cache_frames(self.session.tts, VOICE_ID))
 
     async def on_exit(self):
         """Called when the session ends - automatically saves to Notion if not already saved."""
         logger.info("🔚 JohnPortfolioAgent session ended")
         
-        # If already saved during conversation, skip
+        messages = self.transcript.messages()
+        latency = self.transcript.latency_summary()
+        logger.info(
+            f"Transcript: {len(messages)} turns ({self.transcript.dropped} dropped)"
+            + (f", response latency avg {latency['avg_ms']:.0f}ms max {latency['max_ms']:.0f}ms" if latency else "")
+        )
+        
+        # Contact saved during the conversation - release it with the full transcript
         if self.contact_saved:
-            logger.info("✅ Contact already saved during conversation, skipping duplicate")
+            try:
+                released = await asyncio.to_thread(
+                    self.conversation_service.release_conversation, self.lead_entry_id, messages
+                )
+                if released:
+                    logger.info(f"✅ Full transcript attached to journal entry {self.lead_entry_id}")
+                else:
+                    logger.warning(f"⚠️ Journal entry {self.lead_entry_id} was already sent, transcript not attached")
+            except Exception as e:
+                logger.error(f"Error releasing conversation on exit: {e}")
             return
         
         # Try to save if we have minimum info (name + email)
         if self.visitor_name and self.visitor_email:
             try:
-                placeholder_messages = [
-                    {"role": "user", "content": "Contact information collected"},
-                    {"role": "assistant", "content": f"Contact info saved for {self.visitor_name} ({self.visitor_email})"}
-                ]
-                
-                page_id = self.conversation_service.save_conversation(
+                entry_id = await asyncio.to_thread(
+                    self.conversation_service.enqueue_conversation,
                     self.visitor_name,
                     self.visitor_email,
                     self.visitor_phone or "",
-                    placeholder_messages
+                    messages
                 )
-                if page_id:
-                    logger.info(f"✅ Conversation saved to Notion on exit: {page_id}")
-                else:
-                    logger.warning("Failed to save conversation to Notion on exit")
+                logger.info(f"✅ Conversation queued for Notion on exit (journal entry {entry_id})")
             except Exception as e:
                 logger.error(f"Error saving conversation on exit: {e}")
         else:
@@ -446,35 +435,32 @@ async def entrypoint(ctx: agents.JobContext):
 
     logger.info(f"Portfolio agent started in room: {ctx.room.name}")
 
-    # Configure the voice pipeline
+    # Configure the voice pipeline, reusing the clients and VAD built in prewarm()
+    userdata = ctx.proc.userdata
     session = AgentSession(
-        # Speech-to-Text - OpenAI Whisper (high accuracy)
-        stt=openai.STT(
-            model="whisper-1",
-            language="en",
-        ),
-
-        # Large Language Model - OpenAI GPT-4o-mini (fast, cost-effective)
-        llm=openai.LLM(
-            model=os.getenv("LLM_CHOICE", "gpt-4o-mini"),
-            temperature=0.8,  # Natural, conversational responses
-        ),
-
-        # Text-to-Speech - ElevenLabs with John's cloned voice
-        # Phase 2 Production: Using ElevenLabs for John's cloned voice
-        tts=elevenlabs.TTS(
-            api_key=os.getenv("ELEVENLABS_API_KEY"),  # Provide API key explicitly
-            voice_id=os.getenv("ELEVENLABS_VOICE_ID", "CstaZXTpBGj2CrWoQ0VR")
-        ),
-
+        stt=userdata.get("stt") or build_stt(),
+        llm=userdata.get("llm") or build_llm(),
+        tts=userdata.get("tts") or build_tts(),
         # Voice Activity Detection - Silero VAD for real-time voice handling
-        vad=silero.VAD.load(),
+        vad=userdata.get("vad") or silero.VAD.load(),
     )
 
+    async def flush_lead_journal():
+        # Give queued saves a chance to reach Notion before the job process exits;
+        # anything left stays in the journal for the next worker
+        worker = ConversationService().get_journal_worker()
+        await asyncio.to_thread(worker.drain_once)
+
+    ctx.add_shutdown_callback(flush_lead_journal)
+
+    # Record user/agent turns as they happen, for the saved conversation
+    transcript = TranscriptRecorder()
+    transcript.attach(session)
+
     # Start agent session
     await session.start(
         room=ctx.room,
-        agent=JohnPortfolioAgent()
+        agent=JohnPortfolioAgent(transcript=transcript, greeting=userdata.get("greeting"))
     )
 
 
@@ -482,5 +468,6 @@ if __name__ == "__main__":
     # Run agent using LiveKit CLI
     cli.run_app(WorkerOptions(
         entrypoint_fnc=entrypoint,
-        prewarm_fnc=prewarm
+        prewarm_fnc=prewarm,
+        initialize_process_timeout=PROCESS_INIT_TIMEOUT
     ))
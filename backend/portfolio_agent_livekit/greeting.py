@@ -0,0 +1,123 @@
+"""
+Precomputed greeting for the LiveKit voice agent
+The first message is always the same, so it is synthesized once per voice and
+kept on disk as raw 16-bit PCM; new callers hear it straight from the file
+instead of waiting for the LLM and a TTS round trip
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from livekit import rtc
+
+from prompts import GREETING
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GREETING_DIR = Path(__file__).parent.parent / "data" / "greetings"
+FRAME_MS = 20
+
+
+@dataclass
+class GreetingAudio:
+    sample_rate: int
+    num_channels: int
+    pcm: bytes
+
+    @property
+    def duration(self) -> float:
+        return len(self.pcm) / (2 * self.num_channels * self.sample_rate)
+
+
+def greeting_path(voice_id: str, text: str = GREETING) -> Path:
+    """PCM file for a voice and greeting text; editing the text yields a new file"""
+    directory = Path(os.getenv("GREETING_AUDIO_DIR") or DEFAULT_GREETING_DIR)
+    digest = hashlib.sha1(text.encode()).hexdigest()[:10]
+    return directory / f"{voice_id}-{digest}.pcm"
+
+
+def load_greeting(voice_id: str, text: str = GREETING) -> Optional[GreetingAudio]:
+    """Cached greeting audio for a voice, or None if it has not been synthesized yet"""
+    path = greeting_path(voice_id, text)
+    meta_path = path.with_suffix(".json")
+    if not path.exists() or not meta_path.exists():
+        return None
+    meta = json.loads(meta_path.read_text())
+    return GreetingAudio(meta["sample_rate"], meta["num_channels"], path.read_bytes())
+
+
+def save_greeting(voice_id: str, audio: GreetingAudio, text: str = GREETING) -> Path:
+    path = greeting_path(voice_id, text)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # PCM first, metadata last: the pair only counts as cached once both exist
+    tmp = path.with_suffix(".pcm.tmp")
+    tmp.write_bytes(audio.pcm)
+    tmp.replace(path)
+    path.with_suffix(".json").write_text(json.dumps({
+        "text": text,
+        "sample_rate": audio.sample_rate,
+        "num_channels": audio.num_channels,
+    }))
+    return path
+
+
+async def synthesize_greeting(tts, text: str = GREETING) -> GreetingAudio:
+    """Run the greeting through a TTS plugin and collect the frames into one PCM buffer"""
+    chunks = []
+    sample_rate, num_channels = tts.sample_rate, tts.num_channels
+    async with tts.synthesize(text) as stream:
+        async for event in stream:
+            frame = event.frame
+            sample_rate, num_channels = frame.sample_rate, frame.num_channels
+            chunks.append(bytes(frame.data))
+    return GreetingAudio(sample_rate, num_channels, b"".join(chunks))
+
+
+async def synthesize_and_cache_frames(tts, voice_id: str, text: str = GREETING) -> AsyncIterator[rtc.AudioFrame]:
+    """
+    Stream the greeting from a TTS plugin for AgentSession.say(audio=...) and
+    store it once fully played, so a cold worker pays for synthesis only once.
+    Failures are logged and end the stream; the next session retries.
+    """
+    chunks = []
+    sample_rate, num_channels = tts.sample_rate, tts.num_channels
+    try:
+        async with tts.synthesize(text) as stream:
+            async for event in stream:
+                frame = event.frame
+                sample_rate, num_channels = frame.sample_rate, frame.num_channels
+                chunks.append(bytes(frame.data))
+                yield frame
+    except Exception as e:
+        logger.warning(f"Could not synthesize greeting audio: {e}")
+        return
+
+    audio = GreetingAudio(sample_rate, num_channels, b"".join(chunks))
+    if not audio.pcm:
+        logger.warning(f"Greeting synthesis for voice {voice_id} returned no audio")
+        return
+    try:
+        path = await asyncio.to_thread(save_greeting, voice_id, audio, text)
+        logger.info(f"Greeting audio cached at {path} ({audio.duration:.1f}s)")
+    except OSError as e:
+        logger.warning(f"Could not cache greeting audio: {e}")
+
+
+async def greeting_frames(audio: GreetingAudio, frame_ms: int = FRAME_MS) -> AsyncIterator[rtc.AudioFrame]:
+    """Replay cached PCM as fixed-size audio frames, for AgentSession.say(audio=...)"""
+    samples_per_channel = audio.sample_rate * frame_ms // 1000
+    frame_bytes = samples_per_channel * audio.num_channels * 2
+    for offset in range(0, len(audio.pcm), frame_bytes):
+        data = audio.pcm[offset:offset + frame_bytes]
+        yield rtc.AudioFrame(
+            data=data,
+            sample_rate=audio.sample_rate,
+            num_channels=audio.num_channels,
+            samples_per_channel=len(data) // (2 * audio.num_channels),
+        )
@@ -0,0 +1,91 @@
+"""
+Transcript recorder for LiveKit agent sessions
+Listens to AgentSession events and keeps the conversation as a bounded ring
+buffer of timestamped turns, with per-turn response latency
+"""
+
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional
+
+from livekit.agents import AgentSession
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Turn:
+    """One utterance in the conversation"""
+    role: str  # "user" or "assistant"
+    content: str
+    timestamp: float
+    latency_ms: Optional[float] = None  # user end-of-speech -> agent starts speaking
+
+
+class TranscriptRecorder:
+    """Records user/agent turns from session events as they happen."""
+
+    def __init__(self, max_turns: int = 1000):
+        self.turns: Deque[Turn] = deque(maxlen=max_turns)
+        self.dropped = 0
+        self._user_finished_at: Optional[float] = None
+        self._pending_latency_ms: Optional[float] = None
+
+    def attach(self, session: AgentSession) -> None:
+        """Subscribe to the session's speech events."""
+        session.on("conversation_item_added", self._on_conversation_item_added)
+        session.on("user_input_transcribed", self._on_user_input_transcribed)
+        session.on("agent_state_changed", self._on_agent_state_changed)
+
+    def record(self, role: str, content: str, timestamp: Optional[float] = None,
+               latency_ms: Optional[float] = None) -> None:
+        """Append a turn; the oldest turn is dropped once the buffer is full."""
+        content = content.strip()
+        if not content:
+            return
+        if len(self.turns) == self.turns.maxlen:
+            self.dropped += 1
+        self.turns.append(Turn(role, content, timestamp or time.time(), latency_ms))
+
+    def messages(self) -> List[Dict]:
+        """Turns in the {'role', 'content'} format ConversationService expects (plus timing)."""
+        return [
+            {
+                "role": turn.role,
+                "content": turn.content,
+                "timestamp": turn.timestamp,
+                "latency_ms": turn.latency_ms,
+            }
+            for turn in self.turns
+        ]
+
+    def latency_summary(self) -> Dict[str, float]:
+        """Average and worst response latency across agent turns."""
+        latencies = [turn.latency_ms for turn in self.turns if turn.latency_ms is not None]
+        if not latencies:
+            return {}
+        return {"avg_ms": sum(latencies) / len(latencies), "max_ms": max(latencies)}
+
+    def _on_conversation_item_added(self, event) -> None:
+        item = event.item
+        role = getattr(item, "role", None)
+        if role not in ("user", "assistant"):
+            return
+
+        text = getattr(item, "text_content", None) or ""
+        latency_ms = None
+        if role == "assistant":
+            latency_ms, self._pending_latency_ms = self._pending_latency_ms, None
+        self.record(role, text, getattr(item, "created_at", None), latency_ms)
+
+    def _on_user_input_transcribed(self, event) -> None:
+        if getattr(event, "is_final", False):
+            self._user_finished_at = time.time()
+
+    def _on_agent_state_changed(self, event) -> None:
+        if getattr(event, "new_state", None) == "speaking" and self._user_finished_at is not None:
+            self._pending_latency_ms = (time.time() - self._user_finished_at) * 1000
+            self._user_finished_at = None
+            logger.info(f"Turn latency: {self._pending_latency_ms:.0f}ms")
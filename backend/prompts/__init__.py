@@ -0,0 +1,7 @@
+"""Static agent instructions, kept free of framework imports so build scripts can render them"""
+
+from .adk_instructions import ADK_INSTRUCTIONS
+from .greeting import GREETING
+from .livekit_instructions import LIVEKIT_INSTRUCTIONS
+
+__all__ = ['ADK_INSTRUCTIONS', 'GREETING', 'LIVEKIT_INSTRUCTIONS']
@@ -0,0 +1,5 @@
+"""
+Canned first message, shared by the agents' instructions and the precomputed greeting audio
+"""
+
+GREETING = "Hi there! I'm John Igbokwe - AI & Data Engineer based in Germany. I'd love to tell you about my experience, projects, and what I can bring to your team. What would you like to know about me?"
@@ -0,0 +1,30 @@
+"""
+Analyze conversations that were saved without analysis
+Batches several transcripts per Gemini request and writes Topics, Sentiment,
+Summary and Interest Level back to Notion; run from cron or by hand
+"""
+
+import argparse
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.batch_analysis import BATCH_SIZE, MAX_CONCURRENCY, BatchAnalysisJob
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="Transcripts per Gemini request")
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENCY, help="Gemini requests in flight")
+    parser.add_argument("--limit", type=int, default=None, help="Stop after this many conversations")
+    parser.add_argument("--restart", action="store_true",
+                        help="Reset the cursor and retry every unanalyzed conversation, including earlier failures")
+    args = parser.parse_args()
+    
+    job = BatchAnalysisJob(batch_size=args.batch_size, max_concurrency=args.concurrency)
+    if args.restart:
+        job.cursor.reset()
+    
+    print(f"🔍 Analyzing conversations after {job.cursor.watermark or 'the beginning'}...")
+    totals = job.run(limit=args.limit)
+    print(f"✅ Analyzed {totals['analyzed']} conversation(s), {totals['failed']} failed")
+    print(f"📍 Cursor: {job.cursor.watermark}")
@@ -0,0 +1,79 @@
+"""
+Benchmark the local classifier against Gemini's labels
+Runs the offline classifier over analyzed conversations in Notion and reports
+agreement on sentiment, interest level and topics, plus classification speed
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services import notion_transport
+from services.conversation_service import ConversationService
+from services.local_classifier import get_local_classifier, parse_transcript
+from services.notion_service import NotionService
+
+
+def fetch_labeled(service: ConversationService, limit: int):
+    """Conversations that already have a Sentiment, newest first"""
+    payload = {
+        "filter": {"property": "Sentiment", "select": {"is_not_empty": True}},
+        "sorts": [{"timestamp": "created_time", "direction": "descending"}],
+        "page_size": min(limit, 100),
+    }
+    pages = []
+    while len(pages) < limit:
+        response = notion_transport.request(
+            "POST", f"/databases/{service.database_id}/query", service.api_key, json=payload
+        )
+        if response.status_code != 200:
+            print(f"Error querying conversations: {response.text}")
+            break
+        data = response.json()
+        pages.extend(data.get("results", []))
+        if not data.get("has_more") or not data.get("next_cursor"):
+            break
+        payload["start_cursor"] = data["next_cursor"]
+    return pages[:limit]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--limit", type=int, default=200, help="Conversations to compare")
+    args = parser.parse_args()
+    
+    service = ConversationService()
+    pages = fetch_labeled(service, args.limit)
+    if not pages:
+        print("No analyzed conversations to compare against")
+        sys.exit(0)
+    
+    # Same taxonomy as production: base topics plus the portfolio's Skill categories
+    classifier = get_local_classifier(NotionService().get_snapshot())
+    sentiment_hits = interest_hits = 0
+    topic_overlap = 0.0
+    elapsed = 0.0
+    
+    for page in pages:
+        props = page.get("properties", {})
+        labels = ConversationService._format_conversations([page])[0]
+        transcript = "".join(t["plain_text"] for t in props.get("Full Transcript", {}).get("rich_text", []))
+        
+        started = time.perf_counter()
+        predicted = classifier.classify(parse_transcript(transcript))
+        elapsed += time.perf_counter() - started
+        
+        sentiment_hits += predicted["sentiment"] == labels["sentiment"]
+        interest_hits += predicted["interest_level"] == labels["interest_level"]
+        expected, actual = {t.lower() for t in labels["topics"]}, {t.lower() for t in predicted["topics"]}
+        if expected or actual:
+            topic_overlap += len(expected & actual) / len(expected | actual)
+    
+    total = len(pages)
+    print(f"📊 Compared {total} conversation(s)")
+    print(f"   Sentiment agreement:      {sentiment_hits / total:.0%}")
+    print(f"   Interest level agreement: {interest_hits / total:.0%}")
+    print(f"   Topic overlap (Jaccard):  {topic_overlap / total:.2f}")
+    print(f"   Classification time:      {elapsed / total * 1000:.2f}ms per conversation")
@@ -0,0 +1,19 @@
+"""
+Build or refresh the local GitHub repository index
+Run once before deploying so agents start with a warm index
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.github_index import get_github_index
+
+if __name__ == "__main__":
+    index = get_github_index()
+    print(f"🔄 Syncing GitHub index for {index.user} ({len(index.repos)} repositories cached)...")
+    
+    changed = index.refresh()
+    
+    print(f"✅ Indexed {len(index.repos)} repositories -> {index.path}")
+    print("📝 Changes detected" if changed else "📝 No changes since last sync")
@@ -0,0 +1,51 @@
+"""
+Precompute the voice agent's greeting audio
+Synthesizes the fixed first message with the configured ElevenLabs voice and stores
+it as PCM, so no caller (not even the first after a deploy) waits for TTS on it
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import aiohttp
+from dotenv import load_dotenv
+from livekit.plugins import elevenlabs
+
+from portfolio_agent_livekit.greeting import greeting_path, load_greeting, save_greeting, synthesize_greeting
+
+load_dotenv(Path(__file__).parent.parent.parent / ".env")
+
+
+async def build(voice_id: str, force: bool) -> None:
+    if not force and load_greeting(voice_id) is not None:
+        print(f"✅ Greeting already cached at {greeting_path(voice_id)} (use --force to rebuild)")
+        return
+    
+    async with aiohttp.ClientSession() as http_session:
+        tts = elevenlabs.TTS(
+            api_key=os.getenv("ELEVENLABS_API_KEY"),
+            voice_id=voice_id,
+            http_session=http_session
+        )
+        print(f"🎙️ Synthesizing greeting with voice {voice_id}...")
+        audio = await synthesize_greeting(tts)
+    
+    if not audio.pcm:
+        print("❌ TTS returned no audio")
+        sys.exit(1)
+    path = save_greeting(voice_id, audio)
+    print(f"✅ {audio.duration:.1f}s at {audio.sample_rate}Hz -> {path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--voice-id", default=os.getenv("ELEVENLABS_VOICE_ID", "CstaZXTpBGj2CrWoQ0VR"),
+                        help="ElevenLabs voice to synthesize with")
+    parser.add_argument("--force", action="store_true", help="Re-synthesize even if cached")
+    args = parser.parse_args()
+    
+    asyncio.run(build(args.voice_id, args.force))
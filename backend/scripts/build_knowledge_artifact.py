@@ -0,0 +1,34 @@
+"""
+Build the knowledge artifact - Notion snapshot + agent instructions
+Run at build/deploy time; agents load the result at startup instead of querying Notion
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from prompts import ADK_INSTRUCTIONS, LIVEKIT_INSTRUCTIONS
+from services.knowledge_artifact import load_artifact, render_artifact, write_artifact
+from services.notion_service import NotionService
+
+if __name__ == "__main__":
+    print("🔄 Fetching portfolio snapshot from Notion...")
+    snapshot = NotionService().fetch_snapshot()
+    if snapshot is None:
+        print("❌ Could not fetch the portfolio snapshot - artifact not written")
+        sys.exit(1)
+    
+    previous = load_artifact()
+    artifact = render_artifact(snapshot, {
+        "livekit": LIVEKIT_INSTRUCTIONS,
+        "adk": ADK_INSTRUCTIONS,
+    })
+    path = write_artifact(artifact)
+    
+    print(f"✅ Wrote {artifact.version} with {len(artifact.entries)} entries -> {path}")
+    if previous is None:
+        print("📝 No previous artifact")
+    elif previous.content_hash == artifact.content_hash:
+        print(f"📝 Unchanged since {previous.built_at}")
+    else:
+        print(f"📝 Changed from {previous.version} - diff {path.with_suffix('.txt')} against the previous deploy")
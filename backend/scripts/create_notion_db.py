@@ -3,11 +3,14 @@ Script to create Notion Portfolio Database with all required properties
 Uses direct Notion API calls with proper schema
 """
 
-import requests
 import os
+import sys
 from dotenv import load_dotenv
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from services import notion_transport
+
 # Load environment variables
 load_dotenv(Path(__file__).parent.parent.parent / ".env")
 
@@ -21,12 +24,6 @@ def create_portfolio_database():
         print("Please add your Notion integration token to .env")
         return None
     
-    headers = {
-        'Authorization': f'Bearer {NOTION_TOKEN}',
-        'Content-Type': 'application/json',
-        'Notion-Version': '2022-06-28',
-    }
-    
     # Parent workspace (you may need to adjust this based on your workspace setup)
     parent_page_id = "25d0f08f-cfb0-8027-99f1-d38def5e1cf2"  # Synctrack page or create a new parent
     
@@ -144,11 +141,7 @@ def create_portfolio_database():
     print(f"📄 Parent page: {parent_page_id}")
     
     try:
-        response = requests.post(
-            "https://api.notion.com/v1/databases",
-            headers=headers,
-            json=payload
-        )
+        response = notion_transport.request("POST", "/databases", NOTION_TOKEN, json=payload)
         
         if response.status_code == 200:
             result = response.json()
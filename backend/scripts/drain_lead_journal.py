@@ -0,0 +1,19 @@
+"""
+Drain the local lead journal to Notion
+Sends every queued conversation that is due; run manually or from cron if agents were down
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.conversation_service import ConversationService
+
+if __name__ == "__main__":
+    # Drain in the foreground instead of starting the background thread
+    worker = ConversationService().get_journal_worker(start=False)
+    
+    print(f"📒 Journal: {worker.journal.counts()}")
+    saved = worker.drain_once()
+    print(f"✅ Saved {saved} conversation(s) to Notion")
+    print(f"📒 Journal: {worker.journal.counts()}")
@@ -0,0 +1,82 @@
+"""
+Export leads from the Conversations database to CSV or JSONL
+Streams matching conversations page by page, so months of leads never sit in memory
+
+Examples:
+    python scripts/export_leads.py --status New --interest High -o leads.csv
+    python scripts/export_leads.py --since 2025-01-01 --format jsonl > leads.jsonl
+"""
+
+import argparse
+import csv
+import json
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.conversation_service import ConversationService
+from services.notion_service import NotionQueryError
+
+FIELDS = [
+    "id", "date", "name", "email", "phone", "status", "interest_level",
+    "sentiment", "follow_up_required", "topics", "summary",
+]
+
+
+def write_csv(conversations, out) -> int:
+    writer = csv.DictWriter(out, fieldnames=FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    count = 0
+    for conversation in conversations:
+        writer.writerow({**conversation, "topics": "; ".join(conversation["topics"])})
+        count += 1
+    return count
+
+
+def write_jsonl(conversations, out) -> int:
+    count = 0
+    for conversation in conversations:
+        out.write(json.dumps(conversation, ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export leads to CSV or JSONL")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default=None,
+                        help="Output format (default: from --output extension, else csv)")
+    parser.add_argument("-o", "--output", help="Output file (default: stdout)")
+    parser.add_argument("--status", action="append", help="Status to include (repeatable)")
+    parser.add_argument("--interest", action="append", help="Interest Level to include (repeatable)")
+    parser.add_argument("--sentiment", action="append", help="Sentiment to include (repeatable)")
+    parser.add_argument("--follow-up", action="store_true", help="Only conversations that need a follow-up")
+    parser.add_argument("--since", help="Only conversations on or after this date (YYYY-MM-DD)")
+    parser.add_argument("--until", help="Only conversations before this date (YYYY-MM-DD)")
+    args = parser.parse_args()
+    
+    filters = {}
+    if args.status:
+        filters["status"] = args.status
+    if args.interest:
+        filters["interest_level"] = args.interest
+    if args.sentiment:
+        filters["sentiment"] = args.sentiment
+    if args.follow_up:
+        filters["follow_up_required"] = True
+    
+    fmt = args.format or ("jsonl" if args.output and args.output.endswith(".jsonl") else "csv")
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    
+    try:
+        conversations = ConversationService().query_conversations(
+            filters, since=args.since, until=args.until, ascending=True
+        )
+        count = (write_jsonl if fmt == "jsonl" else write_csv)(conversations, out)
+    except (NotionQueryError, ValueError) as e:
+        print(f"❌ Export failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    
+    print(f"✅ Exported {count} lead(s)", file=sys.stderr)
@@ -5,22 +5,18 @@ Helper script to populate the portfolio database
 
 import json
 import os
+import sys
 from pathlib import Path
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from services import notion_transport
+
 project_root = Path(__file__).parent.parent.parent
 load_dotenv(project_root / ".env")
 
 def insert_entry(entry_data, db_id, notion_token):
     """Insert a single entry into Notion database"""
-    import requests
-    
-    headers = {
-        'Authorization': f'Bearer {notion_token}',
-        'Notion-Version': '2022-06-28',
-        'Content-Type': 'application/json'
-    }
-    
     # Build the page data
     page_data = {
         "parent": {"database_id": db_id},
@@ -85,11 +81,7 @@ def insert_entry(entry_data, db_id, notion_token):
         }
     
     # Make the API call
-    response = requests.post(
-        'https://api.notion.com/v1/pages',
-        headers=headers,
-        json=page_data
-    )
+    response = notion_transport.request("POST", "/pages", notion_token, json=page_data, idempotent=False)
     
     if response.status_code == 200:
         return response.json()
@@ -0,0 +1,26 @@
+"""
+Sync the local Conversations mirror from Notion
+Pulls only pages edited since the last sync; run from cron to keep dashboards fresh
+"""
+
+import argparse
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.conversation_mirror import get_conversation_mirror
+from services.conversation_service import ConversationService
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--full", action="store_true",
+                        help="Re-read every page and drop rows for pages deleted in Notion")
+    args = parser.parse_args()
+    
+    mirror = get_conversation_mirror()
+    print(f"🔄 Syncing conversations edited since {mirror.watermark or 'the beginning'}...")
+    
+    written = mirror.sync(ConversationService(), full=args.full)
+    
+    print(f"✅ {written} conversation(s) updated -> {mirror.path}")
+    print(f"📊 By status: {mirror.counts_by_status()}")
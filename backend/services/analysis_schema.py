@@ -0,0 +1,134 @@
+"""
+Analysis Schema - Typed result of conversation analysis
+Passed to Gemini as the response schema (JSON mode) and used to validate what
+comes back, so sentiment and interest level are always one of the Notion
+select options. A response that still fails validation gets one repair request
+"""
+
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Generator, List
+
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+# One extra request with the validation error before giving up
+MAX_REPAIR_ATTEMPTS = 1
+
+
+class Sentiment(str, Enum):
+    POSITIVE = "Positive"
+    NEUTRAL = "Neutral"
+    NEGATIVE = "Negative"
+    VERY_INTERESTED = "Very Interested"
+
+
+class InterestLevel(str, Enum):
+    HIGH = "High"
+    MEDIUM = "Medium"
+    LOW = "Low"
+
+
+class ConversationAnalysis(BaseModel):
+    """Analysis of one conversation, matching the Notion Conversations properties"""
+    topics: List[str] = Field(default_factory=list, max_length=10)
+    sentiment: Sentiment
+    summary: str
+    interest_level: InterestLevel
+
+    def to_dict(self) -> Dict:
+        """Plain dictionary in the shape analyze_conversation() returns"""
+        return {
+            "topics": self.topics,
+            "sentiment": self.sentiment.value,
+            "summary": self.summary,
+            "interest_level": self.interest_level.value,
+        }
+
+
+class BatchAnalysisItem(ConversationAnalysis):
+    """Analysis of one conversation in a batch request, keyed by page id"""
+    id: str
+
+
+ANALYSIS_ADAPTER = TypeAdapter(ConversationAnalysis)
+BATCH_ADAPTER = TypeAdapter(List[BatchAnalysisItem])
+
+
+def analysis_config(schema: Any):
+    """GenerateContentConfig for JSON mode with a response schema"""
+    from google.genai import types
+    return types.GenerateContentConfig(response_mime_type="application/json", response_schema=schema)
+
+
+def parse_response(response: Any, adapter: TypeAdapter) -> Any:
+    """
+    Validate a Gemini response against a schema.
+
+    Uses the SDK's already parsed object when it has one, else validates the
+    raw text (tolerating a markdown code fence).
+
+    Raises:
+        ValidationError: The response does not match the schema
+    """
+    parsed = getattr(response, "parsed", None)
+    if parsed is not None:
+        return adapter.validate_python(parsed, from_attributes=True)
+
+    text = (response.text or "").strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else ""
+        text = text.rsplit("```", 1)[0]
+    return adapter.validate_json(text)
+
+
+def repair_prompt(prompt: str, response: Any, error: ValidationError) -> str:
+    """Follow-up prompt asking the model to fix an invalid response"""
+    return f"""{prompt}
+
+Your previous response was:
+{getattr(response, "text", "")}
+
+It did not match the required JSON schema:
+{error}
+
+Respond again with corrected JSON only."""
+
+
+
+def repair_loop(prompt: str, adapter: TypeAdapter) -> Generator[str, Any, Any]:
+    """
+    Validate-and-repair steps shared by the sync and async callers.
+
+    Yields the prompt to send and is sent the model's response; returns the
+    validated value, or raises the last ValidationError once the repairs are used up.
+    """
+    for attempt in range(MAX_REPAIR_ATTEMPTS + 1):
+        response = yield prompt
+        try:
+            return parse_response(response, adapter)
+        except ValidationError as e:
+            if attempt == MAX_REPAIR_ATTEMPTS:
+                raise
+            print(f"⚠️ Analysis did not match the schema, asking for a repair: {e.error_count()} error(s)")
+            prompt = repair_prompt(prompt, response, e)
+
+
+def generate_validated(generate: Callable[[str], Any], prompt: str, adapter: TypeAdapter) -> Any:
+    """Run repair_loop with a blocking generate(prompt) -> response"""
+    steps = repair_loop(prompt, adapter)
+    request = next(steps)
+    while True:
+        try:
+            request = steps.send(generate(request))
+        except StopIteration as done:
+            return done.value
+
+
+async def agenerate_validated(generate: Callable[[str], Awaitable[Any]], prompt: str, adapter: TypeAdapter) -> Any:
+    """Run repair_loop with a coroutine generate(prompt) -> response"""
+    steps = repair_loop(prompt, adapter)
+    request = next(steps)
+    while True:
+        try:
+            request = steps.send(await generate(request))
+        except StopIteration as done:
+            return done.value
@@ -0,0 +1,177 @@
+"""
+Answer Cache - Reuse answers to the questions every recruiter asks
+Opening questions are matched on normalized text (lowercased, punctuation
+removed, every word kept) and, optionally, on embedding similarity. Entries are
+keyed by the knowledge-base version, so any edit in Notion or GitHub
+invalidates them, and are evicted LRU-first or when their TTL runs out
+"""
+
+import hashlib
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from .notion_service import PortfolioSnapshot
+from .telemetry import record_cache
+from .vector_index import get_embedder
+
+DEFAULT_CAPACITY = 256
+DEFAULT_TTL = 3600.0
+
+
+_APOSTROPHES = re.compile(r"['’]")
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def normalize_question(question: str) -> str:
+    """
+    Canonical form used as the exact-match key.
+
+    Only case, punctuation and spacing are normalized. Search-style stopword
+    removal would be wrong here: "Tell me about you" and "Tell me about your
+    projects" are different questions with different answers.
+    """
+    text = _APOSTROPHES.sub("", question.lower())
+    return " ".join(_NON_WORD.sub(" ", text).split())
+
+
+def knowledge_version(snapshot: Optional[PortfolioSnapshot], repos: Iterable[Dict]) -> Optional[str]:
+    """
+    Content hash of everything the answers are based on.
+
+    None when there is no portfolio data (not loaded yet, or Notion unreachable and
+    the snapshot cache fell back to an empty snapshot) - answers given without it
+    must not be cached.
+    """
+    if snapshot is None or not snapshot.entries:
+        return None
+    digest = hashlib.sha1(snapshot.version.encode())
+    for repo in repos:
+        digest.update(f"{repo['name']}:{repo.get('updated_at')};".encode())
+    return digest.hexdigest()[:16]
+
+
+@dataclass
+class CachedAnswer:
+    answer: str
+    created_at: float
+    vector: Optional[np.ndarray] = None
+
+
+class AnswerCache:
+    """LRU + TTL cache of answers, keyed by (knowledge version, normalized question)"""
+
+    def __init__(self, capacity: Optional[int] = None, ttl: Optional[float] = None,
+                 similarity: Optional[float] = None):
+        self.capacity = capacity or int(os.getenv("ANSWER_CACHE_SIZE", DEFAULT_CAPACITY))
+        self.ttl = ttl if ttl is not None else float(os.getenv("ANSWER_CACHE_TTL", DEFAULT_TTL))
+        # Cosine threshold for near-duplicate questions; unset = exact matches only
+        if similarity is None and os.getenv("ANSWER_CACHE_SIMILARITY"):
+            similarity = float(os.getenv("ANSWER_CACHE_SIMILARITY"))
+        self.similarity = similarity
+        self.embedder = get_embedder() if similarity else None
+
+        self._entries: "OrderedDict[tuple, CachedAnswer]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"exact_hits": 0, "semantic_hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+
+    def get(self, question: str, version: Optional[str]) -> Optional[str]:
+        """Cached answer for a question, or None"""
+        if version is None:
+            return None
+        key = (version, normalize_question(question))
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry, now):
+                del self._entries[key]
+                self._stats["expired"] += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats["exact_hits"] += 1
+                record_cache("answer", hit=True)
+                return entry.answer
+
+        if self.similarity:
+            answer = self._nearest(question, version, now)
+            if answer is not None:
+                record_cache("answer", hit=True)
+                return answer
+
+        with self._lock:
+            self._stats["misses"] += 1
+        record_cache("answer", hit=False)
+        return None
+
+    def put(self, question: str, version: Optional[str], answer: str) -> None:
+        if version is None or not answer:
+            return
+        vector = self.embedder.embed([question])[0] if self.embedder else None
+        key = (version, normalize_question(question))
+        with self._lock:
+            self._entries[key] = CachedAnswer(answer, time.time(), vector)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def stats(self) -> Dict:
+        """Hit/miss counters and hit rate"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+        lookups = stats["exact_hits"] + stats["semantic_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["exact_hits"] + stats["semantic_hits"]) / lookups, 3) if lookups else 0.0
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _expired(self, entry: CachedAnswer, now: float) -> bool:
+        return now - entry.created_at > self.ttl
+
+    def _nearest(self, question: str, version: str, now: float) -> Optional[str]:
+        """Best cached answer whose question embedding is within the similarity threshold"""
+        with self._lock:
+            candidates = [
+                (key, entry) for key, entry in self._entries.items()
+                if key[0] == version and entry.vector is not None and not self._expired(entry, now)
+            ]
+        if not candidates:
+            return None
+
+        query = self.embedder.embed([question])[0]
+        scores = np.stack([entry.vector for _, entry in candidates]) @ query
+        best = int(np.argmax(scores))
+        if scores[best] < self.similarity:
+            return None
+
+        key, entry = candidates[best]
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self._stats["semantic_hits"] += 1
+        return entry.answer
+
+
+_cache: Optional[AnswerCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_answer_cache() -> AnswerCache:
+    """Get the process-wide answer cache"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = AnswerCache()
+    return _cache
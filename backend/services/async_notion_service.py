@@ -0,0 +1,207 @@
+"""
+Async Notion Service - Non-blocking access to portfolio data
+Mirrors NotionService on a shared, keep-alive httpx.AsyncClient so LiveKit tools
+don't stall the agent's event loop while Notion responds
+"""
+
+import asyncio
+import importlib.util
+import os
+import httpx
+from typing import AsyncIterator, Dict, Iterable, List, Optional
+
+from .notion_transport import (
+    DEFAULT_TIMEOUT,
+    MAX_RETRIES,
+    NOTION_API_URL,
+    RETRY_STATUSES,
+    endpoint_name,
+    notion_headers,
+    retry_delay,
+)
+from .notion_service import (
+    NotionQueryError,
+    NotionService,
+    PortfolioSnapshot,
+    build_knowledge_base,
+    get_snapshot_cache,
+)
+from .telemetry import span
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1 keep-alive
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Get the process-wide pooled client, creating it on first use"""
+    global _client
+    if _client is None and not HTTP2_AVAILABLE:
+        print("⚠️ h2 is not installed - Notion requests fall back to HTTP/1.1 (install httpx[http2])")
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=NOTION_API_URL,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60),
+            timeout=httpx.Timeout(DEFAULT_TIMEOUT[1], connect=DEFAULT_TIMEOUT[0]),
+        )
+    return _client
+
+
+async def close_async_client() -> None:
+    """Close the shared client (call on worker shutdown)"""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+
+
+class AsyncNotionService:
+    """Async service for interacting with Notion database"""
+    
+    def __init__(self):
+        self.api_key = os.getenv("NOTION_API_KEY")
+        self.database_id = os.getenv("NOTION_DATABASE_ID")
+        self.headers = notion_headers(self.api_key)
+    
+    async def get_all_entries(self, entry_type: Optional[str] = None, page_size: int = 100) -> List[Dict]:
+        """Get all entries from database, optionally filtered by type; [] if any page fails"""
+        try:
+            return [entry async for entry in self.iter_entries(entry_type, page_size=page_size)]
+        except (NotionQueryError, httpx.HTTPError) as e:
+            print(f"Error querying Notion: {e}")
+            return []
+    
+    async def iter_entries(self, entry_type: Optional[str] = None, page_size: int = 100) -> AsyncIterator[Dict]:
+        """
+        Stream Active entries, optionally filtered by type.
+        
+        Args:
+            entry_type: Only yield entries of this Type
+            page_size: Results per request (Notion allows at most 100)
+        
+        Yields:
+            Formatted entry dictionaries in Display Order
+        
+        Raises:
+            NotionQueryError, httpx.HTTPError: A page of results could not be
+                fetched - the entries yielded so far are incomplete
+        """
+        async for results in self._iter_result_pages(NotionService._build_filter(entry_type), page_size):
+            for entry in NotionService._format_entries(results):
+                yield entry
+    
+    async def get_entries_by_type(self, entry_types: Iterable[str]) -> Dict[str, List[Dict]]:
+        """
+        Query several Types concurrently.
+        
+        Args:
+            entry_types: Types to fetch, e.g. ["Skill", "Project"]
+        
+        Returns:
+            Dictionary mapping each Type to its entries
+        """
+        entry_types = list(entry_types)
+        results = await asyncio.gather(*(self.get_all_entries(entry_type) for entry_type in entry_types))
+        return dict(zip(entry_types, results))
+    
+    async def get_snapshot(self, refresh: bool = False) -> PortfolioSnapshot:
+        """
+        Get all Active entries, partitioned by Type.
+        
+        Shares the process-wide SnapshotCache with NotionService.
+        
+        Args:
+            refresh: Re-query Notion before returning
+        """
+        cache = get_snapshot_cache(self.database_id)
+        if refresh:
+            cache.store(await self.fetch_snapshot())
+        return await cache.aget(self.fetch_snapshot)
+    
+    async def fetch_snapshot(self) -> Optional[PortfolioSnapshot]:
+        """
+        Fetch all Active entries from Notion in a single paginated query.
+        
+        Returns:
+            PortfolioSnapshot, or None if the query failed
+        """
+        try:
+            entries = []
+            async for results in self._iter_result_pages(NotionService._build_filter()):
+                entries.extend(NotionService._format_entries(results))
+        except (NotionQueryError, httpx.HTTPError) as e:
+            print(f"Error querying Notion: {e}")
+            return None
+        
+        return PortfolioSnapshot.from_entries(entries)
+    
+    async def get_bio(self) -> Optional[Dict]:
+        """Get bio entry"""
+        return (await self.get_snapshot()).bio
+    
+    async def get_skills(self) -> List[Dict]:
+        """Get all skill entries"""
+        return (await self.get_snapshot()).skills
+    
+    async def get_experience(self) -> List[Dict]:
+        """Get all experience entries"""
+        return (await self.get_snapshot()).experience
+    
+    async def get_education(self) -> List[Dict]:
+        """Get all education entries"""
+        return (await self.get_snapshot()).education
+    
+    async def get_projects(self) -> List[Dict]:
+        """Get all project entries"""
+        return (await self.get_snapshot()).projects
+    
+    async def get_contact_info(self) -> List[Dict]:
+        """Get all contact entries"""
+        return (await self.get_snapshot()).contacts
+    
+    async def get_knowledge_base(self) -> str:
+        """Build a comprehensive knowledge base string for AI agent"""
+        return build_knowledge_base(await self.get_snapshot())
+    
+    async def _iter_result_pages(self, filter_dict: Dict, page_size: int = 100) -> AsyncIterator[List[Dict]]:
+        """Yield raw result pages of a database query, following next_cursor"""
+        payload = NotionService._build_query(filter_dict, page_size)
+        
+        while True:
+            response = await self._post(f"/databases/{self.database_id}/query", payload)
+            
+            if response.status_code != 200:
+                raise NotionQueryError(response.text)
+            
+            data = response.json()
+            yield data.get("results", [])
+            
+            if not data.get("has_more") or not data.get("next_cursor"):
+                return
+            payload["start_cursor"] = data["next_cursor"]
+    
+    async def _post(self, path: str, payload: Dict) -> httpx.Response:
+        """POST on the shared client with the same retry policy as notion_transport"""
+        with span("notion", endpoint_name("POST", path)):
+            return await self._post_with_retries(path, payload)
+    
+    async def _post_with_retries(self, path: str, payload: Dict) -> httpx.Response:
+        client = get_async_client()
+        attempt = 0
+        while True:
+            try:
+                response = await client.post(path, headers=self.headers, json=payload)
+            except httpx.ConnectError:
+                if attempt >= MAX_RETRIES:
+                    raise
+                await asyncio.sleep(retry_delay(attempt))
+                attempt += 1
+                continue
+            
+            if response.status_code not in RETRY_STATUSES or attempt >= MAX_RETRIES:
+                return response
+            
+            await asyncio.sleep(retry_delay(attempt, response.headers.get("Retry-After")))
+            attempt += 1
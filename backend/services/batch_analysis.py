@@ -0,0 +1,246 @@
+"""
+Batch Analysis - Deferred topic/sentiment analysis for saved conversations
+Conversations saved with DEFER_CONVERSATION_ANALYSIS have no Sentiment yet.
+This job finds them, sends several transcripts per structured-output Gemini
+request, and writes the results back to the pages. Progress is kept in a
+cursor file so an interrupted run resumes where it stopped
+"""
+
+import itertools
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from . import gemini_client, notion_transport
+from .analysis_schema import BATCH_ADAPTER, BatchAnalysisItem, analysis_config, generate_validated
+from .conversation_service import ANALYSIS_MODEL, ConversationService
+from .local_classifier import parse_transcript
+
+DEFAULT_CURSOR_PATH = Path(__file__).parent.parent / "data" / "analysis_cursor.json"
+
+BATCH_SIZE = 8
+MAX_CONCURRENCY = 3
+# Per transcript, so one long call can't crowd the others out of the prompt
+MAX_TRANSCRIPT_CHARS = 12000
+
+
+class AnalysisCursor:
+    """
+    Resumable position in the queue of unanalyzed pages.
+
+    Notion rounds created_time to the minute, so the cursor keeps the ids
+    already handled within the watermark minute as well.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or os.getenv("ANALYSIS_CURSOR_PATH") or DEFAULT_CURSOR_PATH)
+        self.watermark: Optional[str] = None
+        self.seen_at_watermark: List[str] = []
+        self.load()
+
+    def load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.watermark = data.get("watermark")
+        self.seen_at_watermark = data.get("seen_at_watermark", [])
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"watermark": self.watermark, "seen_at_watermark": self.seen_at_watermark}, f)
+        os.replace(tmp_path, self.path)
+
+    def reset(self) -> None:
+        self.watermark = None
+        self.seen_at_watermark = []
+        self.save()
+
+    def is_seen(self, page: Dict) -> bool:
+        return page["created_time"] == self.watermark and page["id"] in self.seen_at_watermark
+
+    def advance(self, pages: List[Dict]) -> None:
+        """Move past pages that have been handled (in created_time order)"""
+        for page in pages:
+            if page["created_time"] != self.watermark:
+                self.watermark = page["created_time"]
+                self.seen_at_watermark = []
+            self.seen_at_watermark.append(page["id"])
+        self.save()
+
+
+class BatchAnalysisJob:
+    """Analyze pending conversations in batches with bounded concurrency"""
+
+    def __init__(self, service: Optional[ConversationService] = None, batch_size: int = BATCH_SIZE,
+                 max_concurrency: int = MAX_CONCURRENCY, cursor: Optional[AnalysisCursor] = None):
+        self.service = service or ConversationService()
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.cursor = cursor or AnalysisCursor()
+        self._cursor_lock = threading.Lock()
+
+    def iter_pending(self) -> Iterator[Dict]:
+        """Unanalyzed conversation pages after the cursor, oldest first"""
+        filters = [{"property": "Sentiment", "select": {"is_empty": True}}]
+        if self.cursor.watermark:
+            filters.append({"timestamp": "created_time", "created_time": {"on_or_after": self.cursor.watermark}})
+        payload = {
+            "filter": {"and": filters},
+            "sorts": [{"timestamp": "created_time", "direction": "ascending"}],
+            "page_size": 100,
+        }
+
+        while True:
+            response = notion_transport.request(
+                "POST", f"/databases/{self.service.database_id}/query", self.service.api_key, json=payload
+            )
+            if response.status_code != 200:
+                print(f"Error querying unanalyzed conversations: {response.text}")
+                return
+
+            data = response.json()
+            for page in data.get("results", []):
+                if not self.cursor.is_seen(page):
+                    yield page
+
+            if not data.get("has_more") or not data.get("next_cursor"):
+                return
+            payload["start_cursor"] = data["next_cursor"]
+
+    def run(self, limit: Optional[int] = None) -> Dict[str, int]:
+        """
+        Analyze pending conversations.
+
+        Args:
+            limit: Stop after this many pages (None = all)
+
+        Returns:
+            Counts of analyzed and failed pages
+
+        The cursor only moves past pages whose analysis was written. At the first
+        failure it stops there and batches not yet started are cancelled, so the
+        next run picks the failed page up again.
+        """
+        batches, batch = [], []
+        for page in self.iter_pending():
+            batch.append(page)
+            if len(batch) == self.batch_size:
+                batches.append(batch)
+                batch = []
+            if limit and sum(map(len, batches)) + len(batch) >= limit:
+                break
+        if batch:
+            batches.append(batch)
+
+        totals = {"analyzed": 0, "failed": 0}
+        stopped = False
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="batch-analysis") as pool:
+            futures = [pool.submit(self._process_batch, pages) for pages in batches]
+            # Results are taken in submission order, so the cursor only ever moves
+            # past a contiguous run of written pages
+            for pages, future in zip(batches, futures):
+                if future.cancelled():
+                    continue
+                try:
+                    written = future.result()
+                except Exception as e:
+                    print(f"⚠️ Batch of {len(pages)} conversation(s) failed: {e!r}")
+                    written = {page["id"]: False for page in pages}
+
+                totals["analyzed"] += sum(written.values())
+                totals["failed"] += len(pages) - sum(written.values())
+                if stopped:
+                    continue
+
+                done = list(itertools.takewhile(lambda page: written[page["id"]], pages))
+                with self._cursor_lock:
+                    self.cursor.advance(done)
+                if len(done) < len(pages):
+                    stopped = True
+                    for pending in futures:
+                        pending.cancel()
+        return totals
+
+    def _process_batch(self, pages: List[Dict]) -> Dict[str, bool]:
+        """Analyze and write one batch; returns page id -> whether its analysis was written"""
+        transcripts = {page["id"]: self._transcript(page) for page in pages}
+        results = self.analyze_batch(transcripts)
+        return {
+            page_id: bool(results.get(page_id)) and self._write_analysis(page_id, results[page_id])
+            for page_id in transcripts
+        }
+
+    def analyze_batch(self, transcripts: Dict[str, str]) -> Dict[str, Optional[Dict]]:
+        """
+        Analyze several transcripts in one Gemini request.
+
+        Returns:
+            page id -> analysis dict, or None where the model gave nothing usable.
+            Without Gemini every transcript gets the local classifier's analysis.
+        """
+        if not self.service.uses_gemini:
+            return {page_id: self.service.local_analysis(parse_transcript(text))
+                    for page_id, text in transcripts.items()}
+
+        def generate(prompt: str):
+            return gemini_client.generate_content_sync(
+                ANALYSIS_MODEL,
+                prompt,
+                config=analysis_config(List[BatchAnalysisItem]),
+                api_key=self.service.gemini_api_key,
+                timeout=self.service.analysis_timeout * 2,
+            )
+
+        try:
+            items = generate_validated(generate, self._batch_prompt(transcripts), BATCH_ADAPTER)
+        except Exception as e:
+            print(f"⚠️ Batch analysis failed for {len(transcripts)} conversation(s): {e!r}")
+            return {page_id: None for page_id in transcripts}
+
+        by_id = {item.id: item for item in items}
+        return {
+            page_id: by_id[page_id].to_dict() if page_id in by_id else None
+            for page_id in transcripts
+        }
+
+    @staticmethod
+    def _transcript(page: Dict) -> str:
+        rich_text = page.get("properties", {}).get("Full Transcript", {}).get("rich_text", [])
+        # Segments were split on turn boundaries, so join them without separators
+        return "".join(text["plain_text"] for text in rich_text)[:MAX_TRANSCRIPT_CHARS]
+
+    @staticmethod
+    def _batch_prompt(transcripts: Dict[str, str]) -> str:
+        conversations = "\n\n".join(
+            f"=== Conversation {page_id} ===\n{text}" for page_id, text in transcripts.items()
+        )
+        return f"""
+Analyze each of the following conversations between a recruiter and John Igbokwe's AI portfolio agent.
+
+{conversations}
+
+Return one result per conversation, with "id" set to the conversation id, and:
+1. topics: List of key topics discussed
+2. sentiment: Overall sentiment of the visitor
+3. summary: A 2-3 sentence summary of the conversation
+4. interest_level: How interested the visitor is in working with John
+"""
+
+    def _write_analysis(self, page_id: str, analysis: Dict) -> bool:
+        response = notion_transport.request(
+            "PATCH",
+            f"/pages/{page_id}",
+            self.service.api_key,
+            json={"properties": self.service.analysis_properties(analysis)},
+        )
+        if response.status_code != 200:
+            print(f"Error writing analysis to {page_id}: {response.text}")
+            return False
+        return True
@@ -0,0 +1,220 @@
+"""
+Conversation Mirror - Local SQLite copy of the Conversations database
+Synced incrementally: each run asks Notion only for pages edited since the
+stored last_edited_time watermark, so dashboards and duplicate checks read
+locally instead of going through the rate-limited API
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+DEFAULT_MIRROR_PATH = Path(__file__).parent.parent / "data" / "conversations.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversations (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    email TEXT COLLATE NOCASE,
+    phone TEXT,
+    date TEXT,
+    topics TEXT NOT NULL DEFAULT '[]',
+    sentiment TEXT,
+    summary TEXT,
+    interest_level TEXT,
+    follow_up_required INTEGER NOT NULL DEFAULT 0,
+    status TEXT,
+    last_edited_time TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_conversations_date ON conversations (date);
+CREATE INDEX IF NOT EXISTS idx_conversations_status ON conversations (status);
+CREATE INDEX IF NOT EXISTS idx_conversations_email ON conversations (email);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_COLUMNS = [
+    "id", "name", "email", "phone", "date", "topics", "sentiment", "summary",
+    "interest_level", "follow_up_required", "status", "last_edited_time",
+]
+
+
+class ConversationMirror:
+    """SQLite mirror of the Conversations database, keyed by Notion page id"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or os.getenv("CONVERSATION_MIRROR_PATH") or DEFAULT_MIRROR_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._sync_lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @property
+    def watermark(self) -> Optional[str]:
+        """last_edited_time of the newest page synced so far"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM sync_state WHERE key = 'watermark'").fetchone()
+        return row["value"] if row else None
+
+    def sync(self, service, full: bool = False) -> int:
+        """
+        Pull pages edited since the watermark into the mirror.
+
+        Notion rounds last_edited_time to the minute, so the query is inclusive
+        (on_or_after) and re-reads the watermark minute; upserts make that harmless.
+
+        Args:
+            service: ConversationService used to query Notion
+            full: Ignore the watermark, re-read everything and drop rows for
+                pages that no longer exist (archived or deleted)
+
+        Returns:
+            Number of pages written
+
+        Raises:
+            NotionQueryError: Notion rejected the query
+        """
+        with self._sync_lock:
+            watermark = None if full else self.watermark
+            payload = {
+                "sorts": [{"timestamp": "last_edited_time", "direction": "ascending"}],
+                "page_size": 100,
+            }
+            if watermark:
+                payload["filter"] = {"timestamp": "last_edited_time", "last_edited_time": {"on_or_after": watermark}}
+
+            written = 0
+            seen = set()
+            for results in service._iter_result_pages(payload):
+                conversations = service._format_conversations(results)
+                # Commit page by page, so an interrupted sync resumes from here
+                self.upsert(conversations)
+                written += len(conversations)
+                seen.update(conversation["id"] for conversation in conversations)
+
+            if full:
+                self._delete_missing(seen)
+            return written
+
+    def upsert(self, conversations: Iterable[Dict], advance_watermark: bool = True) -> None:
+        """
+        Insert or replace conversations.
+
+        Args:
+            advance_watermark: Move the sync watermark to the newest row. Pass False
+                for write-through of single pages, so the next sync still picks up
+                pages edited elsewhere in the meantime
+        """
+        rows = [self._to_row(conversation) for conversation in conversations]
+        if not rows:
+            return
+        newest = max((row["last_edited_time"] or "" for row in rows), default="")
+        placeholders = ", ".join(f":{column}" for column in _COLUMNS)
+        with self._connect() as conn:
+            conn.execute("BEGIN")
+            conn.executemany(f"INSERT OR REPLACE INTO conversations VALUES ({placeholders})", rows)
+            if newest and advance_watermark:
+                conn.execute(
+                    "INSERT INTO sync_state (key, value) VALUES ('watermark', ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value = MAX(value, excluded.value)",
+                    (newest,),
+                )
+            conn.execute("COMMIT")
+
+    def recent(self, limit: int = 10) -> List[Dict]:
+        """Most recent conversations by Date"""
+        return self.query(limit=limit)
+
+    def query(self, status: Optional[str] = None, interest_level: Optional[str] = None,
+              email: Optional[str] = None, since: Optional[str] = None, until: Optional[str] = None,
+              limit: Optional[int] = None) -> List[Dict]:
+        """
+        Filter mirrored conversations, newest first.
+
+        Args:
+            status: Status to match
+            interest_level: Interest Level to match
+            email: Email to match (case-insensitive)
+            since: ISO date; conversations on or after it
+            until: ISO date; conversations before it
+            limit: Maximum number of rows
+        """
+        clauses, params = [], []
+        for column, value in (("status", status), ("interest_level", interest_level), ("email", email)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since:
+            clauses.append("date >= ?")
+            params.append(since)
+        if until:
+            clauses.append("date < ?")
+            params.append(until)
+
+        sql = "SELECT * FROM conversations"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY date DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._connect() as conn:
+            return [self._from_row(row) for row in conn.execute(sql, params)]
+
+    def counts_by_status(self) -> Dict[str, int]:
+        with self._connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) AS n FROM conversations GROUP BY status").fetchall()
+        return {row["status"]: row["n"] for row in rows}
+
+    def _delete_missing(self, seen: set) -> None:
+        with self._connect() as conn:
+            conn.execute("BEGIN")
+            conn.execute("CREATE TEMP TABLE seen (id TEXT PRIMARY KEY)")
+            conn.executemany("INSERT INTO seen VALUES (?)", [(page_id,) for page_id in seen])
+            conn.execute("DELETE FROM conversations WHERE id NOT IN (SELECT id FROM seen)")
+            conn.execute("COMMIT")
+
+    @staticmethod
+    def _to_row(conversation: Dict) -> Dict:
+        row = {column: conversation.get(column) for column in _COLUMNS}
+        row["topics"] = json.dumps(conversation.get("topics") or [], ensure_ascii=False)
+        row["follow_up_required"] = int(bool(conversation.get("follow_up_required")))
+        return row
+
+    @staticmethod
+    def _from_row(row: sqlite3.Row) -> Dict:
+        conversation = dict(row)
+        conversation["topics"] = json.loads(conversation["topics"])
+        conversation["follow_up_required"] = bool(conversation["follow_up_required"])
+        return conversation
+
+
+_mirror: Optional[ConversationMirror] = None
+_mirror_lock = threading.Lock()
+
+
+def get_conversation_mirror() -> ConversationMirror:
+    """Get the process-wide conversation mirror"""
+    global _mirror
+    if _mirror is None:
+        with _mirror_lock:
+            if _mirror is None:
+                _mirror = ConversationMirror()
+    return _mirror
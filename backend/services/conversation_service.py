@@ -4,12 +4,27 @@ Uses direct Notion API calls to save conversation data with AI-powered analysis
 """
 
 import os
-import requests
-from typing import List, Dict, Optional
-from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Union
+from datetime import date, datetime
 from dotenv import load_dotenv
 from pathlib import Path
 import sys
+import threading
+
+from . import gemini_client, notion_text, notion_transport
+from .local_classifier import get_local_classifier
+from .notion_service import NotionQueryError, get_snapshot_cache
+from .analysis_schema import (
+    ANALYSIS_ADAPTER,
+    ConversationAnalysis,
+    agenerate_validated,
+    analysis_config,
+    generate_validated,
+)
+from .conversation_mirror import get_conversation_mirror
+from .lead_index import get_lead_index
+from .lead_journal import JournalWorker, LeadJournal
 
 # Load environment variables
 # Try to load from parent directories or just use environment variables
@@ -19,9 +34,25 @@ try:
 except:
     pass  # Use environment variables instead
 
-# Import Google Gemini for AI analysis
-# Note: google.genai is only available when using Google ADK
-# For LiveKit Agents, we'll import conditionally
+# Gemini analysis goes through the shared client in gemini_client
+# Note: google.genai is only available when using Google ADK; without it
+# analysis falls back to keyword matching
+# (must support JSON mode with a response schema)
+ANALYSIS_MODEL = os.getenv("GEMINI_ANALYSIS_MODEL", "gemini-2.0-flash")
+
+# query_conversations() filter keys -> (Notion property, property type)
+CONVERSATION_FILTERS = {
+    "status": ("Status", "select"),
+    "interest_level": ("Interest Level", "select"),
+    "sentiment": ("Sentiment", "select"),
+    "topic": ("Topics Discussed", "multi_select"),
+    "email": ("Email", "email"),
+    "follow_up_required": ("Follow-up Required", "checkbox"),
+}
+
+_journal_worker: Optional[JournalWorker] = None
+_journal_worker_lock = threading.Lock()
+
 
 class ConversationService:
     """Service for storing and analyzing portfolio conversations in Notion"""
@@ -30,142 +61,178 @@ class ConversationService:
         self.api_key = os.getenv("NOTION_API_KEY")
         self.database_id = os.getenv("NOTION_CONVERSATIONS_DB_ID")
         self.gemini_api_key = os.getenv("GOOGLE_GEMINI_API_KEY")
+        self.analysis_timeout = float(os.getenv("GEMINI_ANALYSIS_TIMEOUT", "20"))
+        # "local" skips Gemini entirely and uses the offline classifier
+        self.analyzer = os.getenv("CONVERSATION_ANALYZER", "gemini").lower()
+        self.defer_analysis = os.getenv("DEFER_CONVERSATION_ANALYSIS", "false").lower() in ("1", "true", "yes")
+        # Repeat contacts (same email) update their existing page instead of creating one
+        self.dedupe_leads = os.getenv("DEDUPE_LEADS", "true").lower() in ("1", "true", "yes")
         
         if not self.api_key or not self.database_id:
             raise ValueError("NOTION_API_KEY or NOTION_CONVERSATIONS_DB_ID not found in .env")
-        
-        self.headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'Notion-Version': '2022-06-28',
-            'Content-Type': 'application/json'
-        }
     
     def analyze_conversation(self, messages: List[Dict]) -> Dict:
         """
         Analyze conversation to extract topics, sentiment, and generate summary using Gemini.
         
+        Blocks for at most analysis_timeout seconds, then falls back to the local classifier.
+        
         Args:
             messages: List of conversation messages with 'role' and 'content'
         
         Returns:
             Dictionary with topics, sentiment, summary, and interest_level
         """
-        if not self.gemini_api_key:
-            # Fallback analysis if Gemini not available
-            return {
-                "topics": [],
-                "sentiment": "Neutral",
-                "summary": "Conversation logged without AI analysis",
-                "interest_level": "Medium"
-            }
+        if not self.uses_gemini:
+            return self.local_analysis(messages)
         
-        # Format conversation for analysis (needed in both success and fallback)
-        conversation_text = ""
-        for msg in messages:
-            role = msg.get('role', 'user')
-            content = msg.get('content', '')
-            conversation_text += f"{role.upper()}: {content}\n\n"
+        def generate(prompt: str):
+            return gemini_client.generate_content_sync(ANALYSIS_MODEL, prompt, **self._analysis_request_options())
         
         try:
-            # Try to import google.genai (only available with ADK)
-            try:
-                from google import genai
-            except ImportError:
-                # If not available, skip Gemini analysis
-                raise Exception("Google genai not available")
-            
-            client = genai.Client(api_key=self.gemini_api_key)
-            
-            # Create analysis prompt
-            analysis_prompt = f"""
+            prompt = self._analysis_prompt(self._conversation_text(messages))
+            return generate_validated(generate, prompt, ANALYSIS_ADAPTER).to_dict()
+        except Exception as e:
+            print(f"⚠️ Error in AI analysis: {e!r}")
+            return self.local_analysis(messages)
+    
+    async def analyze_conversation_async(self, messages: List[Dict]) -> Dict:
+        """
+        Async version of analyze_conversation (uses client.aio).
+        
+        Cancelling the calling task cancels the Gemini request; a timeout falls
+        back to the local classifier.
+        
+        Args:
+            messages: List of conversation messages with 'role' and 'content'
+        
+        Returns:
+            Dictionary with topics, sentiment, summary, and interest_level
+        """
+        if not self.uses_gemini:
+            return self.local_analysis(messages)
+        
+        async def generate(prompt: str):
+            return await gemini_client.generate_content(ANALYSIS_MODEL, prompt, **self._analysis_request_options())
+        
+        try:
+            prompt = self._analysis_prompt(self._conversation_text(messages))
+            analysis = await agenerate_validated(generate, prompt, ANALYSIS_ADAPTER)
+            return analysis.to_dict()
+        except Exception as e:
+            print(f"⚠️ Error in AI analysis: {e!r}")
+            return self.local_analysis(messages)
+    
+    def _analysis_request_options(self) -> Dict:
+        """Gemini arguments shared by the sync and async analysis calls"""
+        return {
+            "config": analysis_config(ConversationAnalysis),
+            "api_key": self.gemini_api_key,
+            "timeout": self.analysis_timeout,
+        }
+    
+    @staticmethod
+    def _conversation_text(messages: List[Dict]) -> str:
+        return "".join(
+            f"{msg.get('role', 'user').upper()}: {msg.get('content', '')}\n\n"
+            for msg in messages
+        )
+    
+    @staticmethod
+    def _analysis_prompt(conversation_text: str) -> str:
+        return f"""
 Analyze the following conversation between a recruiter and John Igbokwe's AI portfolio agent.
 
 Conversation:
 {conversation_text}
 
-Provide a JSON response with:
+Provide:
 1. topics: List of key topics discussed (e.g., ["Python", "Data Engineering", "Machine Learning", "Experience", "Skills"])
-2. sentiment: Overall sentiment - one of: "Positive", "Neutral", "Negative", "Very Interested"
+2. sentiment: Overall sentiment of the visitor
 3. summary: A 2-3 sentence summary of the conversation
-4. interest_level: Interest level - one of: "High", "Medium", "Low"
-
-Respond in this exact JSON format:
-{{
-    "topics": ["topic1", "topic2"],
-    "sentiment": "Sentiment",
-    "summary": "Brief summary",
-    "interest_level": "Interest"
-}}
+4. interest_level: How interested the visitor is in working with John
 """
-            
-            response = client.models.generate_content(
-                model='gemini-2.0-flash-thinking-exp-1219',
-                contents=analysis_prompt
-            )
-            
-            # Parse JSON response
-            import json
-            analysis_text = response.text.strip()
-            # Remove markdown code blocks if present
-            if analysis_text.startswith("```json"):
-                analysis_text = analysis_text[7:]
-            if analysis_text.startswith("```"):
-                analysis_text = analysis_text[3:]
-            if analysis_text.endswith("```"):
-                analysis_text = analysis_text[:-3]
-            analysis_text = analysis_text.strip()
-            
-            analysis = json.loads(analysis_text)
-            
-            return {
-                "topics": analysis.get("topics", []),
-                "sentiment": analysis.get("sentiment", "Neutral"),
-                "summary": analysis.get("summary", "No summary available"),
-                "interest_level": analysis.get("interest_level", "Medium")
-            }
-            
-        except Exception as e:
-            print(f"⚠️ Error in AI analysis: {e}")
-            # Fallback to basic analysis
-            topics = []
-            if any(word in conversation_text.lower() for word in ["skill", "experience", "project"]):
-                topics.append("Skills & Experience")
-            if any(word in conversation_text.lower() for word in ["hire", "job", "position", "role"]):
-                topics.append("Job Opportunity")
-            if any(word in conversation_text.lower() for word in ["contact", "email", "reach out"]):
-                topics.append("Follow-up")
-            
-            # Use fallback summary
-            return {
-                "topics": topics if topics else ["General Inquiry"],
-                "sentiment": "Neutral",
-                "summary": f"Contact information collected via voice interaction ({len(messages)} messages)",
-                "interest_level": "Medium"
+    
+    @property
+    def uses_gemini(self) -> bool:
+        """Whether analysis goes to Gemini (key configured and not switched to local)"""
+        return bool(self.gemini_api_key) and self.analyzer != "local"
+    
+    def local_analysis(self, messages: List[Dict]) -> Dict:
+        """
+        Offline analysis with the local classifier - no network calls.
+        
+        The topic taxonomy comes from the portfolio snapshot already in memory (if any).
+        """
+        snapshot = get_snapshot_cache(os.getenv("NOTION_DATABASE_ID")).snapshot
+        return get_local_classifier(snapshot).classify(messages)
+    
+    @staticmethod
+    def analysis_properties(analysis: Dict) -> Dict:
+        """Notion properties holding the result of analyze_conversation()"""
+        return {
+            "Topics Discussed": {
+                "multi_select": [{"name": topic.replace(",", " ")} for topic in analysis["topics"]]
+            },
+            "Sentiment": {
+                "select": {"name": analysis["sentiment"]}
+            },
+            "Conversation Summary": {
+                "rich_text": notion_text.text_property(analysis["summary"])
+            },
+            "Interest Level": {
+                "select": {"name": analysis["interest_level"]}
+            },
+            "Follow-up Required": {
+                "checkbox": analysis["sentiment"] in ["Very Interested", "Positive"]
             }
+        }
     
-    def save_conversation(self, name: str, email: str, phone: str, messages: List[Dict]) -> str:
+    def save_conversation(self, name: str, email: str, phone: str, messages: List[Dict],
+                          defer_analysis: Optional[bool] = None) -> str:
         """
         Save conversation to Notion with AI-powered analysis.
         
+        If a conversation with the same email already exists, the new transcript
+        is appended to that page instead (no analysis, no new page).
+        
         Args:
             name: Visitor's name
             email: Contact email
             phone: Contact phone (optional)
             messages: Full conversation messages
+            defer_analysis: Save without analysis, leaving it to the batch job in
+                batch_analysis.py (defaults to DEFER_CONVERSATION_ANALYSIS)
         
         Returns:
             Notion page ID of the saved conversation
         """
+        if defer_analysis is None:
+            defer_analysis = self.defer_analysis
+        
         try:
-            # Analyze conversation
-            analysis = self.analyze_conversation(messages)
+            if self.dedupe_leads:
+                existing_id = self.find_existing_conversation(email)
+                updated = self._update_conversation(existing_id, phone, messages) if existing_id else False
+                if updated:
+                    print(f"✅ Repeat contact, conversation added to existing page: {existing_id}")
+                    return existing_id
+                if updated is None:
+                    # Rate limit, outage or timeout - let the journal retry rather than
+                    # create a duplicate page
+                    return None
+                if existing_id:
+                    # Page deleted or archived since we indexed it - create a new one
+                    get_lead_index().invalidate(email)
             
-            # Format full transcript
-            transcript = ""
-            for msg in messages:
-                role = msg.get('role', 'user')
-                content = msg.get('content', '')
-                transcript += f"[{role.upper()}]: {content}\n\n"
+            # Analyze conversation (unless the batch job will do it later)
+            analysis = None if defer_analysis else self.analyze_conversation(messages)
+            
+            # Format full transcript into ≤2000-character segments; whatever doesn't
+            # fit the property goes into the page body
+            transcript, overflow_blocks = notion_text.split_for_property(
+                notion_text.transcript_segments(messages)
+            )
             
             # Build properties for Notion page
             properties = {
@@ -183,28 +250,15 @@ Respond in this exact JSON format:
                         "start": datetime.now().isoformat()
                     }
                 },
-                "Topics Discussed": {
-                    "multi_select": [{"name": topic.replace(",", " ")} for topic in analysis["topics"]]
-                },
-                "Sentiment": {
-                    "select": {"name": analysis["sentiment"]}
-                },
-                "Conversation Summary": {
-                    "rich_text": [{"text": {"content": analysis["summary"]}}]
-                },
                 "Full Transcript": {
-                    "rich_text": [{"text": {"content": transcript}}]
-                },
-                "Interest Level": {
-                    "select": {"name": analysis["interest_level"]}
-                },
-                "Follow-up Required": {
-                    "checkbox": analysis["sentiment"] in ["Very Interested", "Positive"]
+                    "rich_text": transcript
                 },
                 "Status": {
                     "select": {"name": "New"}
                 }
             }
+            if analysis:
+                properties.update(self.analysis_properties(analysis))
             
             # Remove None values
             properties = {k: v for k, v in properties.items() if v is not None}
@@ -213,21 +267,32 @@ Respond in this exact JSON format:
                 properties["Phone"] = {"phone_number": None}
             
             # Create page in Notion
-            response = requests.post(
-                'https://api.notion.com/v1/pages',
-                headers=self.headers,
+            response = notion_transport.request(
+                "POST",
+                "/pages",
+                self.api_key,
                 json={
                     "parent": {"database_id": self.database_id},
                     "properties": properties
-                }
+                },
+                # A retried create could leave a duplicate conversation page
+                idempotent=False
             )
             
             if response.status_code != 200:
                 print(f"Error saving conversation: {response.text}")
                 return None
             
-            page_id = response.json()["id"]
+            page = response.json()
+            page_id = page["id"]
             print(f"✅ Conversation saved to Notion: {page_id}")
+            self._remember_conversation(email, page)
+            
+            if overflow_blocks:
+                self._append_blocks(
+                    page_id,
+                    [notion_text.heading_block("Full Transcript (continued)")] + overflow_blocks
+                )
             return page_id
             
         except Exception as e:
@@ -236,36 +301,278 @@ Respond in this exact JSON format:
             traceback.print_exc()
             return None
     
-    def get_recent_conversations(self, limit: int = 10) -> List[Dict]:
+    def find_existing_conversation(self, email: str) -> Optional[str]:
+        """
+        Find the page of an earlier conversation with this email.
+        
+        Checks the in-memory lead index, then the local mirror, then asks
+        Notion (Email equals), caching whatever it finds.
+        
+        Returns:
+            Notion page ID, or None for a new contact
+        """
+        if not email:
+            return None
+        
+        index = get_lead_index()
+        page_id = index.get(email)
+        if page_id:
+            return page_id
+        
+        try:
+            rows = get_conversation_mirror().query(email=email, limit=1)
+        except Exception as e:
+            print(f"⚠️ Conversation mirror unavailable: {e}")
+            rows = []
+        if rows:
+            page_id = rows[0]["id"]
+        else:
+            variants = list(dict.fromkeys([email.strip(), email.strip().lower()]))
+            options = [{"property": "Email", "email": {"equals": variant}} for variant in variants]
+            payload = {
+                "filter": options[0] if len(options) == 1 else {"or": options},
+                "sorts": [{"property": "Date", "direction": "descending"}],
+                "page_size": 1
+            }
+            results = next(self._iter_result_pages(payload), [])
+            page_id = results[0]["id"] if results else None
+        
+        if page_id:
+            index.put(email, page_id)
+        return page_id
+    
+    def _update_conversation(self, page_id: str, phone: str, messages: List[Dict]) -> Optional[bool]:
+        """
+        Bump Date (and Phone) on an existing page and append the new transcript to its body.
+        
+        Returns:
+            True if updated, False if the page is gone (deleted or archived),
+            None if Notion failed for any other reason (worth retrying later)
+        """
+        properties = {"Date": {"date": {"start": datetime.now().isoformat()}}}
+        if phone:
+            properties["Phone"] = {"phone_number": phone}
+        
+        response = notion_transport.request(
+            "PATCH",
+            f"/pages/{page_id}",
+            self.api_key,
+            json={"properties": properties}
+        )
+        if response.status_code != 200 or response.json().get("archived"):
+            if self._page_gone(response):
+                print(f"⚠️ Conversation {page_id} was deleted or archived: {response.text}")
+                return False
+            print(f"⚠️ Could not update conversation {page_id}: {response.status_code} {response.text}")
+            return None
+        
+        segments = notion_text.transcript_segments(messages)
+        if segments:
+            heading = notion_text.heading_block(f"Conversation on {datetime.now():%Y-%m-%d %H:%M}")
+            self._append_blocks(page_id, [heading] + [notion_text.paragraph_block(s) for s in segments])
+        return True
+    
+    @staticmethod
+    def _page_gone(response) -> bool:
+        """Whether a failed page update means the page no longer accepts edits"""
+        if response.status_code == 404:
+            return True
+        if response.status_code == 200:
+            return bool(response.json().get("archived"))
+        if response.status_code == 400:
+            # Editing an archived page is a validation_error mentioning "archived"
+            try:
+                message = response.json().get("message", "")
+            except ValueError:
+                return False
+            return "archived" in message.lower()
+        return False
+    
+    def _remember_conversation(self, email: str, page: Dict) -> None:
+        """Write a newly created page through to the lead index and local mirror"""
+        get_lead_index().put(email, page["id"])
+        try:
+            get_conversation_mirror().upsert(self._format_conversations([page]), advance_watermark=False)
+        except Exception as e:
+            print(f"⚠️ Conversation mirror not updated: {e}")
+    
+    def _append_blocks(self, page_id: str, blocks: List[Dict]) -> bool:
+        """
+        Append child blocks to a page in batches of at most 100 per request.
+        
+        The page already exists at this point, so a failure is reported but not
+        raised - retrying the whole save would create a duplicate page.
+        """
+        for batch in notion_text.batched(blocks):
+            response = notion_transport.request(
+                "PATCH",
+                f"/blocks/{page_id}/children",
+                self.api_key,
+                json={"children": batch},
+                idempotent=False
+            )
+            if response.status_code != 200:
+                print(f"⚠️ Transcript overflow not appended to {page_id}: {response.text}")
+                return False
+        return True
+    
+    def enqueue_conversation(self, name: str, email: str, phone: str, messages: List[Dict],
+                             hold_seconds: float = 0) -> int:
+        """
+        Queue a conversation for saving and return immediately.
+        
+        The conversation is written durably to the local lead journal; a background
+        worker runs save_conversation() (analysis + Notion write) with retries.
+        
+        Args:
+            name: Visitor's name
+            email: Contact email
+            phone: Contact phone (optional)
+            messages: Full conversation messages
+            hold_seconds: Hold the save back until release_conversation() is called
+                (or this many seconds pass), e.g. while a call is still going on
+        
+        Returns:
+            Journal entry id
+        """
+        worker = self.get_journal_worker()
+        entry_id = worker.journal.append(name, email, phone, messages, hold_seconds)
+        if not hold_seconds:
+            worker.wake()
+        return entry_id
+    
+    def release_conversation(self, entry_id: int, messages: Optional[List[Dict]] = None) -> bool:
+        """
+        Release a held conversation for saving, with the final transcript.
+        
+        Returns:
+            False if the entry had already been sent (its hold expired)
+        """
+        worker = self.get_journal_worker()
+        released = worker.journal.release(entry_id, messages)
+        worker.wake()
+        return released
+    
+    def update_held_conversation(self, entry_id: int, name: str, email: str, phone: str,
+                                 messages: List[Dict]) -> bool:
+        """
+        Update a conversation queued with enqueue_conversation(hold_seconds=...) in place.
+        
+        Returns:
+            False if the entry had already been sent (its hold expired)
+        """
+        return self.get_journal_worker().journal.update_held(entry_id, name, email, phone, messages)
+    
+    def get_journal_worker(self, start: bool = True) -> JournalWorker:
+        """Get the process-wide journal worker, starting its background thread unless start=False"""
+        global _journal_worker
+        with _journal_worker_lock:
+            if _journal_worker is None:
+                _journal_worker = JournalWorker(LeadJournal(), self.save_conversation)
+            if start:
+                _journal_worker.start()
+            return _journal_worker
+    
+    def get_recent_conversations(self, limit: int = 10, local: bool = False) -> List[Dict]:
         """
         Retrieve recent conversations from Notion.
         
         Args:
             limit: Maximum number of conversations to return
+            local: Read the local mirror (see scripts/sync_conversations.py)
+                instead of calling the Notion API
         
         Returns:
             List of conversation records
         """
+        if local:
+            return get_conversation_mirror().recent(limit)
+        
         try:
-            response = requests.post(
-                f'https://api.notion.com/v1/databases/{self.database_id}/query',
-                headers=self.headers,
-                json={
-                    "sorts": [{"property": "Date", "direction": "descending"}],
-                    "page_size": limit
-                }
+            return list(islice(self.query_conversations(page_size=min(limit, 100)), limit))
+        except Exception as e:
+            print(f"Error retrieving conversations: {e}")
+            return []
+    
+    def query_conversations(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        since: Union[datetime, date, str, None] = None,
+        until: Union[datetime, date, str, None] = None,
+        ascending: bool = False,
+        page_size: int = 100
+    ) -> Iterator[Dict]:
+        """
+        Stream conversations matching the filters, walking Notion's cursors lazily.
+        
+        Args:
+            filters: Keys of CONVERSATION_FILTERS mapped to a value, or a list of
+                values to match any of, e.g. {"status": "New", "interest_level": ["High", "Medium"]}
+            since: Only conversations dated on or after this
+            until: Only conversations dated before this
+            ascending: Oldest first instead of newest first
+            page_size: Results per request (Notion allows at most 100)
+        
+        Yields:
+            Conversation records as formatted by _format_conversations
+        
+        Raises:
+            NotionQueryError: Notion rejected the query (e.g. an unknown option)
+            ValueError: Unknown filter key
+        """
+        payload = {
+            "sorts": [{"property": "Date", "direction": "ascending" if ascending else "descending"}],
+            "page_size": page_size
+        }
+        query_filter = self._build_conversation_filter(filters or {}, since, until)
+        if query_filter:
+            payload["filter"] = query_filter
+        
+        for results in self._iter_result_pages(payload):
+            yield from self._format_conversations(results)
+    
+    def _iter_result_pages(self, payload: Dict) -> Iterator[List[Dict]]:
+        """Yield raw result pages of a Conversations query, following next_cursor"""
+        payload = dict(payload)
+        while True:
+            response = notion_transport.request(
+                "POST",
+                f"/databases/{self.database_id}/query",
+                self.api_key,
+                json=payload
             )
             
             if response.status_code != 200:
-                print(f"Error querying conversations: {response.text}")
-                return []
+                raise NotionQueryError(response.text)
             
-            results = response.json().get("results", [])
-            return self._format_conversations(results)
+            data = response.json()
+            yield data.get("results", [])
             
-        except Exception as e:
-            print(f"Error retrieving conversations: {e}")
-            return []
+            if not data.get("has_more") or not data.get("next_cursor"):
+                return
+            payload["start_cursor"] = data["next_cursor"]
+    
+    @staticmethod
+    def _build_conversation_filter(filters: Dict[str, Any], since, until) -> Optional[Dict]:
+        """Combine field filters and a Date range into one Notion filter"""
+        conditions = []
+        for key, value in filters.items():
+            if key not in CONVERSATION_FILTERS:
+                raise ValueError(f"Unknown conversation filter: {key}")
+            prop, prop_type = CONVERSATION_FILTERS[key]
+            operator = "contains" if prop_type == "multi_select" else "equals"
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            options = [{"property": prop, prop_type: {operator: v}} for v in values]
+            conditions.append(options[0] if len(options) == 1 else {"or": options})
+        
+        if since:
+            conditions.append({"property": "Date", "date": {"on_or_after": _isoformat(since)}})
+        if until:
+            conditions.append({"property": "Date", "date": {"before": _isoformat(until)}})
+        
+        if not conditions:
+            return None
+        return conditions[0] if len(conditions) == 1 else {"and": conditions}
     
     @staticmethod
     def _format_conversations(results: List[Dict]) -> List[Dict]:
@@ -285,7 +592,8 @@ Respond in this exact JSON format:
                 "summary": ConversationService._extract_rich_text(props, "Conversation Summary"),
                 "interest_level": ConversationService._extract_select(props, "Interest Level"),
                 "follow_up_required": ConversationService._extract_checkbox(props, "Follow-up Required"),
-                "status": ConversationService._extract_select(props, "Status")
+                "status": ConversationService._extract_select(props, "Status"),
+                "last_edited_time": result.get("last_edited_time")
             }
             formatted.append(formatted_entry)
         
@@ -333,3 +641,6 @@ Respond in this exact JSON format:
         """Extract checkbox value"""
         return props.get(key, {}).get("checkbox", False)
 
+
+def _isoformat(value: Union[datetime, date, str]) -> str:
+    return value if isinstance(value, str) else value.isoformat()
@@ -0,0 +1,95 @@
+"""
+Gemini Client - Process-wide google-genai clients
+One client per API key, created on first use. Async calls (client.aio) all run
+on a single background event loop so the client's connection pool is never
+shared across loops; callers on any loop or thread await or block on them with
+a timeout, and cancelling the caller cancels the request
+"""
+
+import asyncio
+import os
+import threading
+from typing import Any, Dict, Optional
+
+DEFAULT_TIMEOUT = float(os.getenv("GEMINI_TIMEOUT", "30"))
+
+_clients: Dict[Optional[str], Any] = {}
+_clients_lock = threading.Lock()
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def get_genai_client(api_key: Optional[str] = None):
+    """
+    Get the shared client for an API key (None uses the SDK's own env lookup).
+
+    Raises:
+        ImportError: google-genai is not installed (it ships with Google ADK only)
+    """
+    client = _clients.get(api_key)
+    if client is None:
+        from google import genai
+        with _clients_lock:
+            client = _clients.get(api_key)
+            if client is None:
+                client = genai.Client(api_key=api_key) if api_key else genai.Client()
+                _clients[api_key] = client
+    return client
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Background event loop that owns every client.aio request"""
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="gemini-loop", daemon=True).start()
+                _loop = loop
+    return _loop
+
+
+async def _generate(api_key: Optional[str], model: str, contents: Any, config: Any, timeout: float):
+    client = get_genai_client(api_key)
+    return await asyncio.wait_for(
+        client.aio.models.generate_content(model=model, contents=contents, config=config),
+        timeout,
+    )
+
+
+async def generate_content(model: str, contents: Any, config: Any = None,
+                           api_key: Optional[str] = None, timeout: Optional[float] = None):
+    """
+    Async generate_content with a timeout.
+
+    Args:
+        model: Gemini model name
+        contents: Prompt or content list
+        config: Optional GenerateContentConfig
+        api_key: Key selecting the shared client
+        timeout: Seconds before the request is cancelled (default GEMINI_TIMEOUT)
+
+    Raises:
+        asyncio.TimeoutError: The model did not answer in time
+    """
+    future = asyncio.run_coroutine_threadsafe(
+        _generate(api_key, model, contents, config, timeout or DEFAULT_TIMEOUT), _get_loop()
+    )
+    # Cancelling the awaiting task cancels the request on the Gemini loop too
+    return await asyncio.wrap_future(future)
+
+
+def generate_content_sync(model: str, contents: Any, config: Any = None,
+                          api_key: Optional[str] = None, timeout: Optional[float] = None):
+    """Blocking generate_content for worker threads - same timeout and cancellation"""
+    timeout = timeout or DEFAULT_TIMEOUT
+    future = asyncio.run_coroutine_threadsafe(
+        _generate(api_key, model, contents, config, timeout), _get_loop()
+    )
+    try:
+        # Small grace period - the coroutine enforces the timeout itself
+        return future.result(timeout + 1)
+    except BaseException:
+        future.cancel()
+        raise
@@ -0,0 +1,303 @@
+"""
+GitHub Index - Local index of John's GitHub repositories
+Built once from the GitHub REST API and persisted to disk, then kept fresh by a
+background refresher that uses conditional requests (If-None-Match), so
+unchanged repositories cost no rate limit
+"""
+
+import json
+import os
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .repo_search import RepoSearchIndex
+from .telemetry import span
+
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_USER = "MrJohn91"
+
+DEFAULT_INDEX_PATH = Path(__file__).parent.parent / "data" / "github_index.json"
+REQUEST_TIMEOUT = (5, 20)
+README_MAX_CHARS = 20000
+# After a failed refresh, wait 5s, 10s, 20s, ... (capped) before asking GitHub again
+FAILURE_BACKOFF_BASE = 5.0
+FAILURE_BACKOFF_MAX = 300.0
+
+
+class GitHubIndex:
+    """
+    Repository index (name, description, topics, README, language, updated_at).
+
+    Tool calls read from memory and never wait on GitHub: the index is loaded
+    from disk at startup, built by ensure_fresh() off the event loop, and
+    refreshed in a background thread once it is older than the TTL.
+    """
+
+    def __init__(self, path: Optional[Path] = None, ttl: Optional[float] = None, user: str = GITHUB_USER):
+        self.path = Path(path or os.getenv("GITHUB_INDEX_PATH") or DEFAULT_INDEX_PATH)
+        self.ttl = ttl if ttl is not None else float(os.getenv("GITHUB_INDEX_TTL", "3600"))
+        self.user = user
+        self.token = os.getenv("GITHUB_TOKEN")
+
+        self._repos: Dict[str, Dict] = {}
+        self._ordered: List[Dict] = []
+        self._search_index = RepoSearchIndex([])
+        self._etags: Dict[str, str] = {}
+        self._pages: Dict[str, List[str]] = {}
+        self._built_at = 0.0
+        self._failures = 0
+        self._retry_at = 0.0
+        self._build_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._refreshing = False
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_maxsize=10))
+
+        self.load()
+
+    @property
+    def repos(self) -> List[Dict]:
+        """Indexed repositories, most recently updated first"""
+        return self._ordered
+
+    def is_empty(self) -> bool:
+        return not self._repos
+
+    def is_stale(self) -> bool:
+        """Older than the TTL and not backing off after a failed refresh"""
+        return time.time() - self._built_at > self.ttl and time.monotonic() >= self._retry_at
+
+    def ensure_fresh(self) -> None:
+        """
+        Build synchronously on first use, otherwise refresh stale data in the background.
+        Blocks on GitHub when the index is empty, so call it from a worker thread.
+        """
+        if self.is_empty():
+            with self._build_lock:
+                if self.is_empty() and time.monotonic() >= self._retry_at:
+                    try:
+                        self.refresh()
+                    except Exception as e:
+                        self._record_failure()
+                        print(f"Error building GitHub index: {e}")
+        elif self.is_stale():
+            self.refresh_in_background()
+
+    def search(self, topic: str, limit: int = 10) -> List[Dict]:
+        """
+        Rank repositories for a topic with BM25 over name, description, topics and README.
+
+        Args:
+            topic: Technology, skill or project topic
+            limit: Maximum number of repositories to return
+
+        Returns:
+            Matching repository records with a relevance "score", best first
+        """
+        if self.is_stale():
+            self.refresh_in_background()
+        return [{**repo, "score": score} for repo, score in self._search_index.search(topic, limit)]
+
+    def load(self) -> bool:
+        """Load the index from disk; returns False if there is no usable file"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        self._set_repos({repo["name"]: repo for repo in data.get("repos", [])})
+        self._etags = data.get("etags", {})
+        self._pages = data.get("pages", {})
+        self._built_at = data.get("built_at", 0.0)
+        return True
+
+    def save(self) -> None:
+        """Write the index to disk atomically"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "built_at": self._built_at,
+                "etags": self._etags,
+                "pages": self._pages,
+                "repos": self.repos,
+            }, f)
+        os.replace(tmp_path, self.path)
+
+    def refresh(self) -> bool:
+        """
+        Re-sync the index with GitHub using conditional requests.
+
+        Returns:
+            True if any repository changed
+        """
+        listing = self._list_repos()
+        if listing is None:
+            self._record_failure()
+            return False
+
+        changed = False
+        repos = {}
+        for item in listing:
+            name = item["name"]
+            existing = self._repos.get(name, {})
+            readme = self._fetch_readme(name)
+            record = {
+                "name": name,
+                "description": item.get("description") or "",
+                "url": item.get("html_url"),
+                "topics": item.get("topics") or [],
+                "language": item.get("language"),
+                "updated_at": item.get("updated_at"),
+                "readme": existing.get("readme", "") if readme is None else readme,
+            }
+            changed = changed or record != existing
+            repos[name] = record
+
+        changed = changed or repos.keys() != self._repos.keys()
+        self._set_repos(repos)
+        self._built_at = time.time()
+        self._failures = 0
+        self._retry_at = 0.0
+        self.save()
+        return changed
+
+    def refresh_in_background(self) -> None:
+        """Start a background refresh unless one is already running"""
+        with self._state_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run():
+            try:
+                if self.refresh():
+                    print("🔄 GitHub index updated")
+            except Exception as e:
+                self._record_failure()
+                print(f"Error refreshing GitHub index: {e}")
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=run, name="github-index-refresh", daemon=True).start()
+
+    def _record_failure(self) -> None:
+        self._failures += 1
+        backoff = min(FAILURE_BACKOFF_MAX, FAILURE_BACKOFF_BASE * (2 ** (self._failures - 1)))
+        self._retry_at = time.monotonic() + backoff
+
+    def _list_repos(self) -> Optional[List[Dict]]:
+        """List public repositories, reusing the stored listing when GitHub answers 304"""
+        repos = []
+        page = 1
+        while True:
+            url = self._page_url(page)
+            response = self._get(url)
+            if response is None:
+                return None
+
+            if response.status_code == 304:
+                # Unchanged page - rebuild it from the records we already have
+                repos.extend(self._listing_fields(name) for name in self._pages.get(url, []))
+            elif response.status_code == 200:
+                items = response.json()
+                repos.extend(items)
+                self._remember_etag(url, response)
+                self._pages[url] = [item["name"] for item in items]
+            else:
+                print(f"Error listing GitHub repositories: {response.status_code} {response.text[:200]}")
+                return None
+
+            if response.status_code == 304:
+                has_next = self._page_url(page + 1) in self._pages
+            else:
+                has_next = 'rel="next"' in response.headers.get("Link", "")
+            if not has_next:
+                return repos
+            page += 1
+
+    def _page_url(self, page: int) -> str:
+        return f"{GITHUB_API_URL}/users/{self.user}/repos?per_page=100&sort=updated&page={page}"
+
+    def _listing_fields(self, name: str) -> Dict:
+        """Map a stored record back to the fields of the GitHub listing API"""
+        repo = self._repos.get(name, {})
+        return {
+            "name": name,
+            "description": repo.get("description"),
+            "html_url": repo.get("url"),
+            "topics": repo.get("topics", []),
+            "language": repo.get("language"),
+            "updated_at": repo.get("updated_at"),
+        }
+
+    def _fetch_readme(self, name: str) -> Optional[str]:
+        """
+        Fetch raw README text.
+
+        Returns:
+            The README, "" if the repository has none (404), or None to keep the
+            stored text - unchanged (304), or a transient failure (rate limit, 5xx)
+        """
+        url = f"{GITHUB_API_URL}/repos/{self.user}/{name}/readme"
+        if not self._repos.get(name, {}).get("readme"):
+            # Nothing stored to fall back on, so a 304 would be useless - ask for the body
+            self._etags.pop(url, None)
+        response = self._get(url, accept="application/vnd.github.raw", endpoint="readme")
+        if response is None or response.status_code == 304:
+            return None
+        if response.status_code == 404:
+            self._etags.pop(url, None)
+            return ""
+        if response.status_code != 200:
+            print(f"⚠️ README of {name} not refreshed: {response.status_code}")
+            return None
+        self._remember_etag(url, response)
+        return response.text[:README_MAX_CHARS]
+
+    def _get(self, url: str, accept: str = "application/vnd.github+json",
+             endpoint: str = "list_repos") -> Optional[requests.Response]:
+        """Conditional GET - sends If-None-Match when we hold an ETag for the URL"""
+        headers = {"Accept": accept, "X-GitHub-Api-Version": "2022-11-28"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        etag = self._etags.get(url)
+        if etag:
+            headers["If-None-Match"] = etag
+
+        try:
+            with span("github", endpoint):
+                return self._session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        except requests.RequestException as e:
+            print(f"Error calling GitHub: {e}")
+            return None
+
+    def _set_repos(self, repos: Dict[str, Dict]) -> None:
+        ordered = sorted(repos.values(), key=lambda repo: repo.get("updated_at") or "", reverse=True)
+        self._search_index = RepoSearchIndex(ordered)
+        self._repos = repos
+        self._ordered = ordered
+
+    def _remember_etag(self, url: str, response: requests.Response) -> None:
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etags[url] = etag
+
+
+_index: Optional[GitHubIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_github_index() -> GitHubIndex:
+    """Get the process-wide repository index"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = GitHubIndex()
+    return _index
@@ -0,0 +1,126 @@
+"""
+Knowledge Artifact - Build-time snapshot of everything an agent needs to boot
+Renders the Notion snapshot and the static agent instructions into one
+versioned, content-hashed artifact (JSON for loading + text for diffing), so a
+worker can start answering without any Notion calls
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .notion_service import PortfolioSnapshot, build_knowledge_base, get_snapshot_cache
+
+ARTIFACT_FORMAT = 1
+DEFAULT_ARTIFACT_PATH = Path(__file__).parent.parent / "data" / "knowledge_artifact.json"
+
+
+@dataclass
+class KnowledgeArtifact:
+    """Rendered instructions + portfolio snapshot, identified by a content hash"""
+    content_hash: str
+    built_at: str
+    instructions: Dict[str, str] = field(default_factory=dict)
+    knowledge_base: str = ""
+    entries: List[Dict] = field(default_factory=list)
+    snapshot_version: str = ""
+    format: int = ARTIFACT_FORMAT
+
+    @property
+    def version(self) -> str:
+        """Short version tag, e.g. "v1-3f2a9c1b7d0e" """
+        return f"v{self.format}-{self.content_hash[:12]}"
+
+    def to_snapshot(self) -> PortfolioSnapshot:
+        snapshot = PortfolioSnapshot.from_entries(self.entries)
+        snapshot.knowledge_base = self.knowledge_base
+        return snapshot
+
+    def render_text(self) -> str:
+        """Human-readable form of the artifact, meant to be diffed between deploys"""
+        parts = [f"# Knowledge artifact {self.version} (built {self.built_at})"]
+        parts.extend(f"\n## Instructions: {name}\n{text.strip()}" for name, text in sorted(self.instructions.items()))
+        parts.append(f"\n## Knowledge base\n{self.knowledge_base}")
+        return "\n".join(parts) + "\n"
+
+
+def render_artifact(snapshot: PortfolioSnapshot, instructions: Dict[str, str]) -> KnowledgeArtifact:
+    """
+    Render a snapshot and instruction set into an artifact.
+
+    The content hash covers instructions and entries only, so rebuilding from
+    unchanged data yields the same version.
+    """
+    knowledge_base = build_knowledge_base(snapshot)
+    canonical = json.dumps(
+        {"format": ARTIFACT_FORMAT, "instructions": instructions, "entries": snapshot.entries},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return KnowledgeArtifact(
+        content_hash=hashlib.sha256(canonical.encode("utf-8")).hexdigest(),
+        built_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        instructions=dict(instructions),
+        knowledge_base=knowledge_base,
+        entries=snapshot.entries,
+        snapshot_version=snapshot.version,
+    )
+
+
+def write_artifact(artifact: KnowledgeArtifact, path: Optional[Path] = None) -> Path:
+    """Write <path>.json and <path>.txt atomically; returns the JSON path"""
+    path = Path(path or os.getenv("KNOWLEDGE_ARTIFACT_PATH") or DEFAULT_ARTIFACT_PATH)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    for target, content in (
+        (path, json.dumps(asdict(artifact), ensure_ascii=False)),
+        (path.with_suffix(".txt"), artifact.render_text()),
+    ):
+        tmp_path = target.with_suffix(target.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, target)
+    return path
+
+
+def load_artifact(path: Optional[Path] = None) -> Optional[KnowledgeArtifact]:
+    """
+    Load the artifact in a single read.
+
+    Returns:
+        The artifact, or None if it is missing, unreadable or from another format
+    """
+    path = Path(path or os.getenv("KNOWLEDGE_ARTIFACT_PATH") or DEFAULT_ARTIFACT_PATH)
+    try:
+        data = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+    if data.get("format") != ARTIFACT_FORMAT:
+        print(f"⚠️ Ignoring knowledge artifact with format {data.get('format')}")
+        return None
+    return KnowledgeArtifact(**data)
+
+
+def load_instructions(name: str, default: str, database_id: Optional[str] = None) -> str:
+    """
+    Boot helper for the agents: seed the snapshot cache from the artifact and
+    return the instructions for `name`.
+
+    The prompts in code always win: an artifact built from other instructions
+    is stale for them, so its text is ignored (with a warning) and only its
+    snapshot is used.
+    """
+    artifact = load_artifact()
+    if artifact is None:
+        return default
+
+    get_snapshot_cache(database_id or os.getenv("NOTION_DATABASE_ID")).seed(artifact.to_snapshot())
+    print(f"📦 Loaded knowledge artifact {artifact.version} ({len(artifact.entries)} entries)")
+    if artifact.instructions.get(name, default) != default:
+        print(f"⚠️ Knowledge artifact {artifact.version} has outdated '{name}' instructions - using the prompts in code; rebuild it")
+    return default
@@ -0,0 +1,60 @@
+"""
+Lead Index - Email -> Notion page id lookup for duplicate detection
+An in-memory LRU in front of the local conversation mirror, so a repeat
+contact is usually recognised without any Notion request
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+DEFAULT_CAPACITY = 1024
+
+
+def normalize_email(email: str) -> str:
+    return (email or "").strip().lower()
+
+
+class LeadIndex:
+    """Thread-safe LRU map of normalized email -> conversation page id"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self._pages: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, email: str) -> Optional[str]:
+        key = normalize_email(email)
+        with self._lock:
+            page_id = self._pages.get(key)
+            if page_id is not None:
+                self._pages.move_to_end(key)
+            return page_id
+
+    def put(self, email: str, page_id: str) -> None:
+        key = normalize_email(email)
+        if not key:
+            return
+        with self._lock:
+            self._pages[key] = page_id
+            self._pages.move_to_end(key)
+            while len(self._pages) > self.capacity:
+                self._pages.popitem(last=False)
+
+    def invalidate(self, email: str) -> None:
+        with self._lock:
+            self._pages.pop(normalize_email(email), None)
+
+
+_index: Optional[LeadIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_lead_index() -> LeadIndex:
+    """Get the process-wide lead index"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = LeadIndex()
+    return _index
@@ -0,0 +1,234 @@
+"""
+Lead Journal - Durable write-behind queue for conversation saves
+Saves are appended to a local SQLite journal (WAL, synchronous=FULL) and return
+immediately; a background worker drains the journal to Notion with retries, so
+no lead is lost if Notion or the worker process goes down mid-call
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_JOURNAL_PATH = Path(__file__).parent.parent / "data" / "lead_journal.sqlite3"
+
+MAX_ATTEMPTS = 10
+# Must outlast the slowest single save: dedupe query, analysis plus a repair (20s each),
+# the page POST and overflow appends, each Notion call with up to 4 attempts of 15s
+LEASE_SECONDS = 15 * 60
+RETRY_BASE_SECONDS = 30
+RETRY_MAX_SECONDS = 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS leads (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at REAL NOT NULL,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    phone TEXT NOT NULL DEFAULT '',
+    messages TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    lease_until REAL NOT NULL DEFAULT 0,
+    last_error TEXT,
+    page_id TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_leads_due ON leads (status, next_attempt_at);
+"""
+
+
+class LeadJournal:
+    """SQLite journal of conversations waiting to be written to Notion"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or os.getenv("LEAD_JOURNAL_PATH") or DEFAULT_JOURNAL_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        # FULL makes every commit fsync the WAL before append() returns
+        conn.execute("PRAGMA synchronous=FULL")
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def append(self, name: str, email: str, phone: str, messages: List[Dict], hold_seconds: float = 0) -> int:
+        """
+        Durably record a conversation to be saved.
+
+        Args:
+            hold_seconds: Keep the entry back this long so the caller can release()
+                it with a fuller transcript; if the caller never does (e.g. the
+                process dies mid-call) it is sent as-is once the hold expires
+
+        Returns:
+            Journal entry id
+        """
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO leads (created_at, name, email, phone, messages, next_attempt_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (now, name, email, phone or "", json.dumps(messages, ensure_ascii=False), now + hold_seconds),
+            )
+            return cursor.lastrowid
+
+    def release(self, entry_id: int, messages: Optional[List[Dict]] = None) -> bool:
+        """
+        Make a held entry due now, optionally replacing its messages.
+
+        Returns:
+            False if the entry was already picked up by a worker
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE leads SET messages = COALESCE(?, messages), next_attempt_at = ? "
+                "WHERE id = ? AND status = 'pending' AND attempts = 0 AND lease_until <= ?",
+                (
+                    json.dumps(messages, ensure_ascii=False) if messages is not None else None,
+                    time.time(),
+                    entry_id,
+                    time.time(),
+                ),
+            )
+            return cursor.rowcount == 1
+
+    def update_held(self, entry_id: int, name: str, email: str, phone: str, messages: List[Dict]) -> bool:
+        """
+        Replace the contact details and messages of an entry not yet picked up,
+        keeping its hold (e.g. the visitor corrected their email mid-call).
+
+        Returns:
+            False if the entry was already picked up by a worker
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE leads SET name = ?, email = ?, phone = ?, messages = ? "
+                "WHERE id = ? AND status = 'pending' AND attempts = 0 AND lease_until <= ?",
+                (name, email, phone or "", json.dumps(messages, ensure_ascii=False), entry_id, time.time()),
+            )
+            return cursor.rowcount == 1
+
+    def claim_due(self, limit: int = 1) -> List[Dict]:
+        """
+        Lease pending entries that are due, so concurrent workers (one per
+        agent process) never send the same entry twice.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                "SELECT * FROM leads WHERE status = 'pending' AND next_attempt_at <= ? AND lease_until <= ? "
+                "ORDER BY id LIMIT ?",
+                (now, now, limit),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE leads SET lease_until = ? WHERE id = ?",
+                [(now + LEASE_SECONDS, row["id"]) for row in rows],
+            )
+            conn.execute("COMMIT")
+
+        return [{**dict(row), "messages": json.loads(row["messages"])} for row in rows]
+
+    def mark_done(self, entry_id: int, page_id: str) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE leads SET status = 'done', page_id = ?, lease_until = 0 WHERE id = ?",
+                (page_id, entry_id),
+            )
+
+    def mark_retry(self, entry_id: int, attempts: int, error: str) -> None:
+        """Schedule another attempt with exponential backoff, or park the entry as failed"""
+        attempts += 1
+        status = "failed" if attempts >= MAX_ATTEMPTS else "pending"
+        delay = min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * (2 ** (attempts - 1)))
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE leads SET status = ?, attempts = ?, next_attempt_at = ?, lease_until = 0, last_error = ? "
+                "WHERE id = ?",
+                (status, attempts, time.time() + delay, error[:500], entry_id),
+            )
+
+    def counts(self) -> Dict[str, int]:
+        """Number of entries per status"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) AS n FROM leads GROUP BY status").fetchall()
+        return {row["status"]: row["n"] for row in rows}
+
+
+class JournalWorker:
+    """Background thread that drains the journal through a save function"""
+
+    def __init__(self, journal: LeadJournal, save: Callable[[str, str, str, List[Dict]], Optional[str]],
+                 poll_interval: float = 15.0):
+        self.journal = journal
+        self.save = save
+        self.poll_interval = poll_interval
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="lead-journal-worker", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._wake.set()
+
+    def wake(self) -> None:
+        """Drain now instead of waiting for the next poll"""
+        self._wake.set()
+
+    def drain_once(self) -> int:
+        """
+        Send every entry that is currently due.
+
+        Entries are claimed one at a time, right before they are saved, so a
+        lease never runs out while the entry waits behind others in a batch.
+
+        Returns:
+            Number of entries written to Notion
+        """
+        saved = 0
+        while True:
+            entries = self.journal.claim_due()
+            if not entries:
+                return saved
+            for entry in entries:
+                try:
+                    page_id = self.save(entry["name"], entry["email"], entry["phone"], entry["messages"])
+                except Exception as e:
+                    page_id, error = None, str(e)
+                else:
+                    error = "Notion did not return a page id"
+
+                if page_id:
+                    self.journal.mark_done(entry["id"], page_id)
+                    saved += 1
+                else:
+                    # Failed entries get a future next_attempt_at, so they drop out of this loop
+                    self.journal.mark_retry(entry["id"], entry["attempts"], error)
+                    print(f"⚠️ Lead {entry['id']} not saved (attempt {entry['attempts'] + 1}): {error}")
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                self.drain_once()
+            except Exception as e:
+                print(f"Error draining lead journal: {e}")
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
@@ -0,0 +1,209 @@
+"""
+Local Classifier - Offline topic and sentiment analysis for conversations
+One compiled regex holds every topic keyword, sentiment term and negator, so a
+single scan of each turn yields topic hits and a lexicon sentiment score. The
+topic taxonomy is built from the Skill categories in the portfolio database.
+Used when Gemini is not configured, fails, or is switched off to save cost
+"""
+
+import re
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .notion_service import PortfolioSnapshot
+
+# Conversation-level topics plus defaults for the Skill categories; Notion
+# skills are added to their category at runtime. Terms must be specific: the
+# agent's own turns are not scored, but words like "team" or "role" still turn
+# up in visitor small talk
+BASE_TAXONOMY: Dict[str, List[str]] = {
+    "Job Opportunity": [
+        "hire", "hiring", "job", "position", "opening", "vacancy", "contract",
+        "freelance", "full time", "part time", "salary", "day rate", "hourly rate", "job offer",
+    ],
+    "Skills & Experience": ["skill", "skills", "experience", "background", "expertise", "worked on"],
+    "Projects": ["project", "projects", "portfolio", "github", "repository", "built"],
+    "Follow-up": [
+        "contact", "email", "reach out", "get in touch", "call", "schedule",
+        "interview", "meeting", "follow up", "linkedin",
+    ],
+    "AI/ML": [
+        "ai", "machine learning", "ml", "deep learning", "llm", "nlp", "genai",
+        "generative ai", "rag", "agent", "agents", "computer vision",
+    ],
+    "Data Engineering": ["data engineering", "etl", "pipeline", "pipelines", "snowflake", "dbt", "airflow", "spark", "sql"],
+    "Cloud": ["cloud", "aws", "azure", "gcp", "google cloud", "docker", "kubernetes"],
+    "Backend": ["python", "api", "apis", "fastapi", "backend", "database"],
+    "Education": ["degree", "university", "masters", "bachelor", "education", "studied"],
+}
+
+# Term -> polarity (applied to the visitor's turns only)
+SENTIMENT_LEXICON: Dict[str, int] = {
+    **dict.fromkeys([
+        "great", "good", "excellent", "impressive", "impressed", "amazing", "awesome",
+        "perfect", "nice", "love", "like", "interesting", "interested", "helpful",
+        "thanks", "thank you", "cool", "fantastic", "wonderful", "exactly",
+    ], 1),
+    **dict.fromkeys([
+        "bad", "poor", "boring", "disappointing", "disappointed", "unfortunately",
+        "not a fit", "not interested", "waste", "annoying", "wrong", "confusing", "expensive",
+    ], -1),
+}
+
+# Terms that signal intent to work with John
+INTEREST_TERMS = frozenset([
+    "hire", "hiring", "interview", "job offer", "contract", "salary", "day rate", "hourly rate",
+    "schedule", "meeting", "available", "availability", "start date", "when can you start",
+])
+
+NEGATORS = frozenset(["not", "no", "never", "don't", "didn't", "isn't", "wasn't", "doesn't"])
+NEGATION_WINDOW = 3  # words
+
+_TURN_RE = re.compile(r"^\[?(USER|ASSISTANT)\]?:\s*", re.MULTILINE)
+_WORD_RE = re.compile(r"\S+")
+
+
+class LocalClassifier:
+    """Single-regex keyword matcher with a lexicon sentiment scorer"""
+
+    def __init__(self, taxonomy: Dict[str, Iterable[str]]):
+        self.topics_by_term: Dict[str, List[str]] = {}
+        for topic, terms in taxonomy.items():
+            for term in terms:
+                topics = self.topics_by_term.setdefault(term.lower(), [])
+                if topic not in topics:
+                    topics.append(topic)
+
+        vocabulary = set(self.topics_by_term) | set(SENTIMENT_LEXICON) | INTEREST_TERMS | NEGATORS
+        # Longest first so "machine learning" wins over "machine", "not interested" over "interested"
+        alternation = "|".join(re.escape(term) for term in sorted(vocabulary, key=len, reverse=True))
+        self.pattern = re.compile(rf"(?<![\w'])(?:{alternation})(?![\w'])", re.IGNORECASE)
+
+    def classify(self, messages: List[Dict]) -> Dict:
+        """
+        Analyze a conversation without any network call.
+
+        Only the visitor's turns are scored - the agent's replies (starting with
+        the fixed greeting) mention skills, projects and "your team" regardless
+        of what the visitor is after.
+
+        Args:
+            messages: Conversation messages with 'role' and 'content'
+
+        Returns:
+            Dictionary with topics, sentiment, summary, and interest_level
+        """
+        topic_hits: Counter = Counter()
+        sentiment_score = 0
+        interest_hits = 0
+
+        for message in messages:
+            if message.get("role", "user") != "user":
+                continue
+            content = message.get("content", "")
+            negated_until = -1
+            for match in self.pattern.finditer(content):
+                term = match.group(0).lower()
+                for topic in self.topics_by_term.get(term, ()):
+                    topic_hits[topic] += 1
+
+                if term in NEGATORS:
+                    negated_until = match.end() + self._window_chars(content, match.end())
+                    continue
+                negated = match.start() <= negated_until
+                polarity = SENTIMENT_LEXICON.get(term, 0)
+                sentiment_score += -polarity if negated else polarity
+                if term in INTEREST_TERMS and not negated:
+                    interest_hits += 1
+
+        topics = [topic for topic, _ in topic_hits.most_common(5)]
+        sentiment = self._sentiment(sentiment_score, interest_hits)
+        return {
+            "topics": topics,
+            "sentiment": sentiment,
+            "summary": (
+                f"Offline analysis of {len(messages)} messages. "
+                f"Main topics: {', '.join(topics) or 'none'}. Visitor sentiment score {sentiment_score:+d}."
+            ),
+            "interest_level": self._interest_level(sentiment_score, interest_hits, topic_hits),
+        }
+
+    def classify_text(self, transcript: str) -> Dict:
+        """Analyze a formatted transcript ("[USER]: ..." / "USER: ..." turns)"""
+        return self.classify(parse_transcript(transcript))
+
+    @staticmethod
+    def _window_chars(content: str, position: int) -> int:
+        """Character length of the next NEGATION_WINDOW words after a negator"""
+        words = _WORD_RE.finditer(content, position)
+        end = position
+        for _, word in zip(range(NEGATION_WINDOW), words):
+            end = word.end()
+        return end - position
+
+    @staticmethod
+    def _sentiment(score: int, interest_hits: int) -> str:
+        if interest_hits >= 2 and score >= 0:
+            return "Very Interested"
+        if score >= 2:
+            return "Positive"
+        if score <= -2:
+            return "Negative"
+        return "Neutral"
+
+    @staticmethod
+    def _interest_level(score: int, interest_hits: int, topic_hits: Counter) -> str:
+        if interest_hits >= 2 or (topic_hits["Job Opportunity"] and score > 0):
+            return "High"
+        # Politeness alone ("thanks, bye") is not interest - it has to be about something
+        if interest_hits or topic_hits["Follow-up"] or (score > 0 and topic_hits):
+            return "Medium"
+        return "Low"
+
+
+def parse_transcript(transcript: str) -> List[Dict]:
+    """Turn a formatted transcript back into role/content messages"""
+    parts = _TURN_RE.split(transcript)
+    # split() gives [preamble, role, content, role, content, ...]
+    return [
+        {"role": role.lower(), "content": content.strip()}
+        for role, content in zip(parts[1::2], parts[2::2])
+    ]
+
+
+def build_taxonomy(snapshot: Optional[PortfolioSnapshot]) -> Dict[str, List[str]]:
+    """BASE_TAXONOMY extended with every Skill (and its tech stack) under its Notion category"""
+    taxonomy = {topic: list(terms) for topic, terms in BASE_TAXONOMY.items()}
+    if snapshot is None:
+        return taxonomy
+    for skill in snapshot.skills:
+        category = skill.get("category")
+        if not category:
+            continue
+        terms = taxonomy.setdefault(category, [])
+        for term in [skill.get("name", "")] + skill.get("tech_stack", []):
+            term = term.strip().lower()
+            if term and term not in terms:
+                terms.append(term)
+    return taxonomy
+
+
+_classifier: Optional[Tuple[str, LocalClassifier]] = None
+_classifier_lock = threading.Lock()
+
+
+def get_local_classifier(snapshot: Optional[PortfolioSnapshot] = None) -> LocalClassifier:
+    """
+    Get the process-wide classifier, recompiled when the portfolio snapshot changes.
+
+    Args:
+        snapshot: Portfolio snapshot for the Skill taxonomy; None uses BASE_TAXONOMY
+    """
+    global _classifier
+    version = snapshot.version if snapshot is not None else ""
+    if _classifier is None or _classifier[0] != version:
+        with _classifier_lock:
+            if _classifier is None or _classifier[0] != version:
+                _classifier = (version, LocalClassifier(build_taxonomy(snapshot)))
+    return _classifier[1]
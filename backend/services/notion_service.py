@@ -4,11 +4,19 @@ Uses direct Notion API calls since notion-client doesn't have query method
 """
 
 import os
+import asyncio
+import hashlib
+import threading
+import time
 import requests
-from typing import List, Dict, Optional
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, List, Dict, Optional, Iterable, Iterator
 from dotenv import load_dotenv
 from pathlib import Path
 
+from . import notion_transport
+from .telemetry import record_cache
+
 # Load environment variables
 # Try to load from parent directories or just use environment variables
 try:
@@ -17,119 +25,450 @@ try:
 except:
     pass  # Use environment variables instead
 
+class NotionQueryError(Exception):
+    """Raised when a Notion database query returns an error response"""
+
+
+@dataclass
+class PortfolioSnapshot:
+    """All Active portfolio entries, partitioned by Type and indexed by page id"""
+    entries: List[Dict] = field(default_factory=list)
+    by_type: Dict[str, List[Dict]] = field(default_factory=dict)
+    by_id: Dict[str, Dict] = field(default_factory=dict)
+    version: str = ""
+    knowledge_base: Optional[str] = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[Dict]) -> "PortfolioSnapshot":
+        """Build a snapshot from formatted entries (already sorted by Display Order)"""
+        snapshot = cls()
+        for entry in entries:
+            snapshot.entries.append(entry)
+            snapshot.by_type.setdefault(entry.get("type") or "", []).append(entry)
+            snapshot.by_id[entry["id"]] = entry
+        
+        # Version acts as an ETag: it only changes when a page is added,
+        # removed or edited (last_edited_time moves)
+        digest = hashlib.sha1()
+        for page_id in sorted(snapshot.by_id):
+            digest.update(f"{page_id}:{snapshot.by_id[page_id].get('last_edited_time') or ''};".encode())
+        snapshot.version = digest.hexdigest()
+        return snapshot
+
+    def of_type(self, entry_type: str) -> List[Dict]:
+        """Get entries of a given Type"""
+        return self.by_type.get(entry_type, [])
+
+    @property
+    def bios(self) -> List[Dict]:
+        return self.of_type("Bio")
+
+    @property
+    def bio(self) -> Optional[Dict]:
+        bios = self.bios
+        return bios[0] if bios else None
+
+    @property
+    def skills(self) -> List[Dict]:
+        return self.of_type("Skill")
+
+    @property
+    def experience(self) -> List[Dict]:
+        return self.of_type("Experience")
+
+    @property
+    def education(self) -> List[Dict]:
+        return self.of_type("Education")
+
+    @property
+    def projects(self) -> List[Dict]:
+        return self.of_type("Project")
+
+    @property
+    def contacts(self) -> List[Dict]:
+        return self.of_type("Contact")
+
+
+def build_knowledge_base(snapshot: PortfolioSnapshot) -> str:
+    """Build a comprehensive knowledge base string for AI agent (rendered once per snapshot)"""
+    if snapshot.knowledge_base is None:
+        snapshot.knowledge_base = _render_knowledge_base(snapshot)
+    return snapshot.knowledge_base
+
+
+def _render_knowledge_base(snapshot: PortfolioSnapshot) -> str:
+    sections = []
+    
+    # Bio
+    bio = snapshot.bio
+    if bio:
+        sections.append(f"PROFILE:\n{bio.get('content', '')}")
+    
+    # Experience
+    experience = snapshot.experience
+    if experience:
+        sections.append("\nEXPERIENCE:")
+        for exp in experience:
+            sections.append(f"- {exp.get('name', '')}: {exp.get('content', '')[:300]}...")
+    
+    # Education
+    education = snapshot.education
+    if education:
+        sections.append("\nEDUCATION:")
+        for edu in education:
+            sections.append(f"- {edu.get('name', '')}: {edu.get('content', '')}")
+    
+    # Skills
+    skills = snapshot.skills
+    if skills:
+        sections.append("\nSKILLS:")
+        skill_names = [skill.get('name', '') for skill in skills]
+        sections.append(", ".join(skill_names))
+    
+    # Contact
+    contacts = snapshot.contacts
+    if contacts:
+        sections.append("\nCONTACT:")
+        for contact in contacts:
+            sections.append(f"- {contact.get('name', '')}: {contact.get('url', '')}")
+    
+    return "\n".join(sections)
+
+
+# After a failed fetch, wait this long before the next one (doubling per failure)
+FAILURE_BACKOFF_BASE = 5.0
+FAILURE_BACKOFF_MAX = 300.0
+
+
+class SnapshotCache:
+    """
+    Process-wide stale-while-revalidate cache for a PortfolioSnapshot.
+    
+    Reads are served from memory. Once the snapshot is older than the TTL, the
+    stale copy is still returned while a single background thread re-fetches it.
+    The cached snapshot is only swapped when its version has changed.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = ttl if ttl is not None else float(os.getenv("NOTION_CACHE_TTL", "300"))
+        self._snapshot: Optional[PortfolioSnapshot] = None
+        self._fetched_at = 0.0
+        # Failed fetches back off, so a Notion outage isn't answered with back-to-back refreshes
+        self._failures = 0
+        self._retry_at = 0.0
+        self._load_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+        self._refreshing = False
+        self._load_task: Optional[asyncio.Future] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def snapshot(self) -> Optional[PortfolioSnapshot]:
+        return self._snapshot
+
+    def is_stale(self) -> bool:
+        """Older than the TTL and not backing off from a failed fetch"""
+        now = time.monotonic()
+        return now - self._fetched_at > self.ttl and now >= self._retry_at
+
+    def _record_failure(self) -> None:
+        self._failures += 1
+        backoff = min(FAILURE_BACKOFF_MAX, FAILURE_BACKOFF_BASE * (2 ** (self._failures - 1)))
+        self._retry_at = time.monotonic() + backoff
+
+    def get(self, loader: Callable[[], Optional[PortfolioSnapshot]]) -> PortfolioSnapshot:
+        """
+        Get the cached snapshot, loading it on first use.
+        
+        Args:
+            loader: Callable that fetches a fresh snapshot (None on failure)
+        
+        Returns:
+            The cached snapshot, or an empty one if Notion could not be reached
+        """
+        snapshot = self._snapshot
+        record_cache("notion_snapshot", hit=snapshot is not None)
+        if snapshot is None:
+            # Cold start - only one caller fetches, the others wait for it
+            with self._load_lock:
+                if self._snapshot is None and time.monotonic() >= self._retry_at:
+                    self.store(loader())
+                snapshot = self._snapshot
+            return snapshot if snapshot is not None else PortfolioSnapshot()
+        
+        if self.is_stale():
+            self.refresh_in_background(loader)
+        return snapshot
+
+    async def aget(self, loader: Callable[[], Awaitable[Optional[PortfolioSnapshot]]]) -> PortfolioSnapshot:
+        """
+        Async variant of get() for coroutine loaders.
+        
+        Concurrent cold-start callers await the same in-flight load, and stale
+        reads schedule the refresh as a task on the running event loop.
+        """
+        record_cache("notion_snapshot", hit=self._snapshot is not None)
+        if self._snapshot is None:
+            if time.monotonic() < self._retry_at:
+                return PortfolioSnapshot()
+            if self._load_task is None or self._load_task.done():
+                self._load_task = asyncio.ensure_future(loader())
+            self.store(await asyncio.shield(self._load_task))
+            return self._snapshot if self._snapshot is not None else PortfolioSnapshot()
+        
+        if self.is_stale():
+            self.arefresh_in_background(loader)
+        return self._snapshot
+
+    def seed(self, snapshot: PortfolioSnapshot) -> bool:
+        """
+        Pre-load a snapshot from a build artifact without hitting Notion.
+        
+        The seeded copy is served immediately but counts as stale, so the first
+        read also kicks off a background refresh.
+        
+        Returns:
+            True if the cache was empty and has been seeded
+        """
+        with self._load_lock:
+            if self._snapshot is not None:
+                return False
+            self._snapshot = snapshot
+            self._fetched_at = 0.0
+            return True
+
+    def store(self, snapshot: Optional[PortfolioSnapshot]) -> bool:
+        """
+        Store a freshly fetched snapshot.
+        
+        Returns:
+            True if the cached snapshot was swapped, False if unchanged or None
+        """
+        if snapshot is None:
+            self._record_failure()
+            return False
+        
+        self._failures = 0
+        self._retry_at = 0.0
+        self._fetched_at = time.monotonic()
+        if self._snapshot is not None and self._snapshot.version == snapshot.version:
+            return False
+        
+        self._snapshot = snapshot
+        return True
+
+    def refresh(self, loader: Callable[[], Optional[PortfolioSnapshot]]) -> bool:
+        """Fetch synchronously and swap if changed"""
+        return self.store(loader())
+
+    def refresh_in_background(self, loader: Callable[[], Optional[PortfolioSnapshot]]) -> None:
+        """Start a background refresh unless one is already running"""
+        with self._state_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        
+        def run():
+            try:
+                if self.refresh(loader):
+                    print("🔄 Portfolio snapshot updated from Notion")
+            except Exception as e:
+                self._record_failure()
+                print(f"Error refreshing portfolio snapshot: {e}")
+            finally:
+                self._refreshing = False
+        
+        threading.Thread(target=run, name="notion-snapshot-refresh", daemon=True).start()
+
+    def arefresh_in_background(self, loader: Callable[[], Awaitable[Optional[PortfolioSnapshot]]]) -> None:
+        """Schedule a refresh task on the running loop unless one is already running"""
+        with self._state_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        
+        async def run():
+            try:
+                if self.store(await loader()):
+                    print("🔄 Portfolio snapshot updated from Notion")
+            except Exception as e:
+                self._record_failure()
+                print(f"Error refreshing portfolio snapshot: {e}")
+            finally:
+                self._refreshing = False
+        
+        self._refresh_task = asyncio.get_running_loop().create_task(run())
+
+    def invalidate(self) -> None:
+        """Mark the snapshot stale so the next read triggers a refresh"""
+        self._fetched_at = 0.0
+        self._retry_at = 0.0
+
+
+_snapshot_caches: Dict[str, SnapshotCache] = {}
+_snapshot_caches_lock = threading.Lock()
+
+
+def get_snapshot_cache(database_id: Optional[str]) -> SnapshotCache:
+    """Get the process-wide snapshot cache for a database"""
+    key = database_id or ""
+    with _snapshot_caches_lock:
+        cache = _snapshot_caches.get(key)
+        if cache is None:
+            cache = _snapshot_caches[key] = SnapshotCache()
+        return cache
+
+
 class NotionService:
     """Service for interacting with Notion database"""
     
     def __init__(self):
         self.api_key = os.getenv("NOTION_API_KEY")
         self.database_id = os.getenv("NOTION_DATABASE_ID")
-        self.headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'Notion-Version': '2022-06-28',
-            'Content-Type': 'application/json'
-        }
     
-    def get_all_entries(self, entry_type: Optional[str] = None) -> List[Dict]:
-        """Get all entries from database, optionally filtered by type"""
-        filter_dict = {}
+    def get_all_entries(self, entry_type: Optional[str] = None, page_size: int = 100) -> List[Dict]:
+        """Get all entries from database, optionally filtered by type; [] if any page fails"""
+        try:
+            return list(self.iter_entries(entry_type, page_size=page_size))
+        except (NotionQueryError, requests.RequestException) as e:
+            print(f"Error querying Notion: {e}")
+            return []
+    
+    def iter_entries(self, entry_type: Optional[str] = None, page_size: int = 100) -> Iterator[Dict]:
+        """
+        Stream Active entries, optionally filtered by type.
+        
+        Notion's cursors are walked lazily: each page of results is requested
+        only once the previous one has been consumed.
+        
+        Args:
+            entry_type: Only yield entries of this Type
+            page_size: Results per request (Notion allows at most 100)
+        
+        Yields:
+            Formatted entry dictionaries in Display Order
         
-        # Also filter by Active status
+        Raises:
+            NotionQueryError, requests.RequestException: A page of results could
+                not be fetched - the entries yielded so far are incomplete
+        """
+        for results in self._iter_result_pages(self._build_filter(entry_type), page_size):
+            yield from self._format_entries(results)
+    
+    def get_snapshot(self, refresh: bool = False) -> PortfolioSnapshot:
+        """
+        Get all Active entries, partitioned by Type.
+        
+        Served from the process-wide SnapshotCache, so the per-type accessors
+        below and concurrent sessions share one round trip to Notion.
+        
+        Args:
+            refresh: Re-query Notion synchronously before returning
+        
+        Returns:
+            PortfolioSnapshot with entries indexed by Type and page id
+        """
+        cache = get_snapshot_cache(self.database_id)
+        if refresh:
+            cache.refresh(self.fetch_snapshot)
+        return cache.get(self.fetch_snapshot)
+    
+    def fetch_snapshot(self) -> Optional[PortfolioSnapshot]:
+        """
+        Fetch all Active entries from Notion in a single paginated query.
+        
+        Returns:
+            PortfolioSnapshot, or None if the query failed
+        """
+        try:
+            entries = [
+                entry
+                for results in self._iter_result_pages(self._build_filter())
+                for entry in self._format_entries(results)
+            ]
+        except (NotionQueryError, requests.RequestException) as e:
+            print(f"Error querying Notion: {e}")
+            return None
+        
+        return PortfolioSnapshot.from_entries(entries)
+    
+    def _iter_result_pages(self, filter_dict: Dict, page_size: int = 100) -> Iterator[List[Dict]]:
+        """Yield raw result pages of a database query, following next_cursor"""
+        payload = self._build_query(filter_dict, page_size)
+        
+        while True:
+            response = notion_transport.request(
+                "POST",
+                f"/databases/{self.database_id}/query",
+                self.api_key,
+                json=payload
+            )
+            
+            if response.status_code != 200:
+                raise NotionQueryError(response.text)
+            
+            data = response.json()
+            yield data.get("results", [])
+            
+            if not data.get("has_more") or not data.get("next_cursor"):
+                return
+            payload["start_cursor"] = data["next_cursor"]
+    
+    @staticmethod
+    def _build_query(filter_dict: Dict, page_size: int = 100) -> Dict:
+        """Build a database query payload sorted by Display Order"""
+        return {
+            "filter": filter_dict,
+            "sorts": [{"property": "Display Order", "direction": "ascending"}],
+            "page_size": min(max(page_size, 1), 100)
+        }
+    
+    @staticmethod
+    def _build_filter(entry_type: Optional[str] = None) -> Dict:
+        """Build the Active (and optional Type) filter for a database query"""
         status_filter = {
             "property": "Status",
             "select": {"equals": "Active"}
         }
         
-        if entry_type:
-            type_filter = {
-                "property": "Type",
-                "select": {"equals": entry_type}
-            }
-            filter_dict = {
-                "and": [type_filter, status_filter]
-            }
-        else:
-            filter_dict = status_filter
-        
-        # Query database using direct API
-        response = requests.post(
-            f'https://api.notion.com/v1/databases/{self.database_id}/query',
-            headers=self.headers,
-            json={
-                "filter": filter_dict,
-                "sorts": [{"property": "Display Order", "direction": "ascending"}]
-            }
-        )
-        
-        if response.status_code != 200:
-            print(f"Error querying Notion: {response.text}")
-            return []
+        if not entry_type:
+            return status_filter
         
-        results = response.json().get("results", [])
-        return self._format_entries(results)
+        type_filter = {
+            "property": "Type",
+            "select": {"equals": entry_type}
+        }
+        return {
+            "and": [type_filter, status_filter]
+        }
     
     def get_bio(self) -> Optional[Dict]:
         """Get bio entry"""
-        entries = self.get_all_entries("Bio")
-        return entries[0] if entries else None
+        return self.get_snapshot().bio
     
     def get_skills(self) -> List[Dict]:
         """Get all skill entries"""
-        return self.get_all_entries("Skill")
+        return self.get_snapshot().skills
     
     def get_experience(self) -> List[Dict]:
         """Get all experience entries"""
-        return self.get_all_entries("Experience")
+        return self.get_snapshot().experience
     
     def get_education(self) -> List[Dict]:
         """Get all education entries"""
-        return self.get_all_entries("Education")
+        return self.get_snapshot().education
     
     def get_projects(self) -> List[Dict]:
         """Get all project entries"""
-        return self.get_all_entries("Project")
+        return self.get_snapshot().projects
     
     def get_contact_info(self) -> List[Dict]:
         """Get all contact entries"""
-        return self.get_all_entries("Contact")
+        return self.get_snapshot().contacts
     
     def get_knowledge_base(self) -> str:
         """Build a comprehensive knowledge base string for AI agent"""
-        sections = []
-        
-        # Bio
-        bio = self.get_bio()
-        if bio:
-            sections.append(f"PROFILE:\n{bio.get('content', '')}")
-        
-        # Experience
-        experience = self.get_experience()
-        if experience:
-            sections.append("\nEXPERIENCE:")
-            for exp in experience:
-                sections.append(f"- {exp.get('name', '')}: {exp.get('content', '')[:300]}...")
-        
-        # Education
-        education = self.get_education()
-        if education:
-            sections.append("\nEDUCATION:")
-            for edu in education:
-                sections.append(f"- {edu.get('name', '')}: {edu.get('content', '')}")
-        
-        # Skills
-        skills = self.get_skills()
-        if skills:
-            sections.append("\nSKILLS:")
-            skill_names = [skill.get('name', '') for skill in skills]
-            sections.append(", ".join(skill_names))
-        
-        # Contact
-        contacts = self.get_contact_info()
-        if contacts:
-            sections.append("\nCONTACT:")
-            for contact in contacts:
-                sections.append(f"- {contact.get('name', '')}: {contact.get('url', '')}")
-        
-        return "\n".join(sections)
+        return build_knowledge_base(self.get_snapshot())
     
     @staticmethod
     def _format_entries(results: List[Dict]) -> List[Dict]:
@@ -150,7 +489,8 @@ class NotionService:
                 "tech_stack": NotionService._extract_multi_select(props, "Tech Stack"),
                 "priority": NotionService._extract_select(props, "Priority"),
                 "status": NotionService._extract_select(props, "Status"),
-                "display_order": NotionService._extract_number(props, "Display Order")
+                "display_order": NotionService._extract_number(props, "Display Order"),
+                "last_edited_time": result.get("last_edited_time")
             }
             formatted.append(formatted_entry)
         
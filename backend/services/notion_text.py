@@ -0,0 +1,102 @@
+"""
+Notion Text - Fit long text into Notion's size limits
+A rich_text element holds at most 2000 characters, a property at most 100
+elements, and one append call at most 100 blocks. Transcripts are split on
+turn boundaries into segments that respect those limits; whatever does not fit
+the property spills over into page child blocks
+"""
+
+import io
+from typing import Dict, List, Tuple
+
+MAX_TEXT_CHARS = 2000
+MAX_RICH_TEXT_ITEMS = 100
+MAX_BLOCKS_PER_REQUEST = 100
+
+
+def format_turn(message: Dict) -> str:
+    """One transcript turn, e.g. "[USER]: Hello" """
+    return f"[{message.get('role', 'user').upper()}]: {message.get('content', '')}\n\n"
+
+
+def _split_long(text: str, max_chars: int) -> List[str]:
+    """Split a single oversized turn, preferring whitespace over mid-word cuts"""
+    pieces = []
+    while len(text) > max_chars:
+        cut = text.rfind(" ", 0, max_chars)
+        # Only a space near the limit is worth it; an early one (e.g. right after
+        # "[USER]:") would leave a tiny piece that wastes a whole rich_text slot
+        if cut <= max_chars // 2:
+            cut = max_chars
+        pieces.append(text[:cut])
+        text = text[cut:]
+    if text:
+        pieces.append(text)
+    return pieces
+
+
+def split_segments(parts: List[str], max_chars: int = MAX_TEXT_CHARS) -> List[str]:
+    """
+    Pack text parts (e.g. transcript turns) into segments of at most max_chars.
+
+    Parts are never split across segments unless a single part is itself
+    longer than max_chars.
+    """
+    segments = []
+    buffer = io.StringIO()
+    size = 0
+    for part in parts:
+        if len(part) > max_chars:
+            pieces = _split_long(part, max_chars)
+        else:
+            pieces = [part]
+        for piece in pieces:
+            if size and size + len(piece) > max_chars:
+                segments.append(buffer.getvalue())
+                buffer = io.StringIO()
+                size = 0
+            buffer.write(piece)
+            size += len(piece)
+    if size:
+        segments.append(buffer.getvalue())
+    return segments
+
+
+def transcript_segments(messages: List[Dict]) -> List[str]:
+    """Transcript text split into ≤2000-character segments on turn boundaries"""
+    return split_segments([format_turn(message) for message in messages])
+
+
+def rich_text(segments: List[str]) -> List[Dict]:
+    """rich_text array for already split segments"""
+    return [{"text": {"content": segment}} for segment in segments]
+
+
+def text_property(text: str) -> List[Dict]:
+    """rich_text array for a short free-text value, capped at the property limit"""
+    return rich_text(split_segments([text])[:MAX_RICH_TEXT_ITEMS])
+
+
+def split_for_property(segments: List[str]) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Divide segments between a rich_text property and overflow blocks.
+
+    Returns:
+        (rich_text array for the property, paragraph blocks for the page body)
+    """
+    inline = segments[:MAX_RICH_TEXT_ITEMS]
+    overflow = segments[MAX_RICH_TEXT_ITEMS:]
+    return rich_text(inline), [paragraph_block(segment) for segment in overflow]
+
+
+def paragraph_block(text: str) -> Dict:
+    return {"object": "block", "type": "paragraph", "paragraph": {"rich_text": rich_text([text])}}
+
+
+def heading_block(text: str) -> Dict:
+    return {"object": "block", "type": "heading_3", "heading_3": {"rich_text": rich_text([text])}}
+
+
+def batched(blocks: List[Dict], size: int = MAX_BLOCKS_PER_REQUEST) -> List[List[Dict]]:
+    """Blocks in groups small enough for one append-children call"""
+    return [blocks[i:i + size] for i in range(0, len(blocks), size)]
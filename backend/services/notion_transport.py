@@ -0,0 +1,158 @@
+"""
+Notion Transport - Shared HTTP plumbing for every Notion API call
+One pooled requests.Session with keep-alive, per-call timeouts and
+Retry-After aware backoff for rate limits (429) and, on calls that are safe
+to repeat, gateway errors and dropped connections
+"""
+
+import os
+import random
+import re
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional, Tuple, Union
+
+from .telemetry import span
+
+NOTION_API_URL = "https://api.notion.com/v1"
+NOTION_VERSION = "2022-06-28"
+
+# (connect, read) seconds - without a timeout a hung Notion call hangs a voice turn forever
+DEFAULT_TIMEOUT: Tuple[float, float] = (
+    float(os.getenv("NOTION_CONNECT_TIMEOUT", "5")),
+    float(os.getenv("NOTION_READ_TIMEOUT", "15")),
+)
+MAX_RETRIES = int(os.getenv("NOTION_MAX_RETRIES", "3"))
+
+# 429 is Notion's rate limit; the 50x statuses are transient gateway errors
+RETRY_STATUSES = {429, 502, 503, 504}
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 10.0
+
+# Page, database and block ids, with or without dashes
+_ID_PATTERN = re.compile(r"[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}")
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def notion_headers(api_key: Optional[str]) -> Dict[str, str]:
+    """Build the headers every Notion request needs"""
+    return {
+        'Authorization': f'Bearer {api_key}',
+        'Notion-Version': NOTION_VERSION,
+        'Content-Type': 'application/json'
+    }
+
+
+def retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    Seconds to wait before retry number `attempt` (starting at 0).
+
+    Honours a Retry-After header when Notion sends one, otherwise uses
+    exponential backoff with full jitter so concurrent sessions don't retry in lockstep.
+    """
+    if retry_after:
+        try:
+            return min(float(retry_after), BACKOFF_MAX) + random.uniform(0, BACKOFF_BASE)
+        except ValueError:
+            pass
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+
+def endpoint_name(method: str, path: str) -> str:
+    """Metrics label for a call, e.g. "POST /databases/{id}/query" """
+    path = path[len(NOTION_API_URL):] if path.startswith(NOTION_API_URL) else path
+    return f"{method.upper()} {_ID_PATTERN.sub('{id}', path.split('?')[0])}"
+
+
+def is_idempotent(method: str, path: str) -> bool:
+    """
+    Whether a call can be repeated without side effects: reads, database
+    queries and property updates can; creating pages or databases (POST) and
+    appending block children (PATCH .../children) cannot.
+    """
+    method = method.upper()
+    path = path.split("?")[0].rstrip("/")
+    if method == "POST":
+        return path.endswith("/query") or path.endswith("/search")
+    if method == "PATCH":
+        return not path.endswith("/children")
+    return True
+
+
+def get_session() -> requests.Session:
+    """Get the process-wide pooled session, creating it on first use"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+def request(
+    method: str,
+    path: str,
+    api_key: Optional[str],
+    json: Optional[Dict] = None,
+    timeout: Union[float, Tuple[float, float], None] = None,
+    max_retries: int = MAX_RETRIES,
+    idempotent: Optional[bool] = None,
+) -> requests.Response:
+    """
+    Send a request to the Notion API on the shared session.
+
+    Args:
+        method: HTTP method, e.g. "POST"
+        path: API path relative to /v1, e.g. "/pages"
+        api_key: Notion integration token
+        json: Request body
+        timeout: Seconds, or a (connect, read) tuple; defaults to DEFAULT_TIMEOUT
+        max_retries: Retries for rate limits, gateway errors and failed connections
+        idempotent: Whether the call is safe to repeat; defaults to is_idempotent().
+            Other calls are only retried on 429, since a gateway error or a dropped
+            connection may come after Notion has already applied them
+
+    Returns:
+        The final response - callers still check status_code as before
+
+    Raises:
+        requests.RequestException if the request still fails after all retries
+    """
+    url = path if path.startswith("http") else f"{NOTION_API_URL}{path}"
+    headers = notion_headers(api_key)
+    timeout = timeout if timeout is not None else DEFAULT_TIMEOUT
+    session = get_session()
+    if idempotent is None:
+        idempotent = is_idempotent(method, url)
+    retry_statuses = RETRY_STATUSES if idempotent else {429}
+
+    with span("notion", endpoint_name(method, url)):
+        return _send_with_retries(session, method, url, headers, json, timeout, max_retries,
+                                  retry_statuses, idempotent)
+
+
+def _send_with_retries(session, method, url, headers, json, timeout, max_retries,
+                       retry_statuses, retry_connection_errors) -> requests.Response:
+    attempt = 0
+    while True:
+        try:
+            response = session.request(method, url, headers=headers, json=json, timeout=timeout)
+        except requests.ConnectionError:
+            if not retry_connection_errors or attempt >= max_retries:
+                raise
+            time.sleep(retry_delay(attempt))
+            attempt += 1
+            continue
+
+        if response.status_code not in retry_statuses or attempt >= max_retries:
+            return response
+
+        time.sleep(retry_delay(attempt, response.headers.get("Retry-After")))
+        attempt += 1
@@ -0,0 +1,125 @@
+"""
+Repository Search - BM25 ranking over the local GitHub index
+Inverted index over repo name, description, topics and README with alias
+expansion, so "machine learning" finds a repo tagged "ml" and results come
+back by relevance instead of by last update
+"""
+
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+# Canonical token -> phrases that mean the same thing
+ALIASES = {
+    "ml": ["machine learning"],
+    "ai": ["artificial intelligence"],
+    "genai": ["generative ai", "gen ai"],
+    "llm": ["large language model"],
+    "nlp": ["natural language processing"],
+    "mcp": ["model context protocol"],
+    "rag": ["retrieval augmented generation"],
+    "etl": ["extract transform load"],
+    "dl": ["deep learning"],
+    "cv": ["computer vision"],
+}
+
+# How much a term occurrence counts in each field
+FIELD_WEIGHTS = {"name": 3, "topics": 3, "description": 2, "readme": 1}
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = frozenset(
+    "a an and are about any do for from has have in is it its me my of on or the "
+    "to with you your i project projects repo repos repository".split()
+)
+
+
+def _stem(token: str) -> str:
+    """Very light plural stripping so "pipelines" matches "pipeline" """
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def _build_phrase_table() -> Dict[Tuple[str, ...], str]:
+    table = {}
+    for canonical, phrases in ALIASES.items():
+        for phrase in phrases:
+            table[tuple(_stem(word) for word in _TOKEN_RE.findall(phrase))] = canonical
+    return table
+
+
+_PHRASES = _build_phrase_table()
+_MAX_PHRASE_LEN = max(len(phrase) for phrase in _PHRASES)
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Lowercase, split on anything non-alphanumeric (so snake_case and kebab-case
+    names split too) and add the canonical alias after every alias phrase.
+    """
+    words = [_stem(word) for word in _TOKEN_RE.findall(text.lower()) if word not in STOPWORDS]
+    tokens = []
+    for i, word in enumerate(words):
+        tokens.append(word)
+        for length in range(1, min(_MAX_PHRASE_LEN, len(words) - i) + 1):
+            canonical = _PHRASES.get(tuple(words[i:i + length]))
+            if canonical:
+                tokens.append(canonical)
+    return tokens
+
+
+class RepoSearchIndex:
+    """Okapi BM25 over the weighted fields of each repository record"""
+
+    def __init__(self, repos: Iterable[Dict], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.repos: List[Dict] = list(repos)
+        self.postings: Dict[str, List[Tuple[int, float]]] = defaultdict(list)
+        self.doc_lengths: List[float] = []
+
+        for doc_id, repo in enumerate(self.repos):
+            term_freqs: Counter = Counter()
+            for field, weight in FIELD_WEIGHTS.items():
+                value = repo.get(field) or ""
+                if field == "name":
+                    value = value.replace("-", " ").replace("_", " ")
+                elif field == "topics":
+                    value = " ".join(tag.replace("-", " ") for tag in value)
+                for token in tokenize(value):
+                    term_freqs[token] += weight
+            for token, freq in term_freqs.items():
+                self.postings[token].append((doc_id, freq))
+            self.doc_lengths.append(sum(term_freqs.values()))
+
+        count = len(self.repos)
+        self.avg_doc_length = (sum(self.doc_lengths) / count) if count else 0.0
+        self.idf = {
+            token: math.log(1 + (count - len(docs) + 0.5) / (len(docs) + 0.5))
+            for token, docs in self.postings.items()
+        }
+
+    def search(self, query: str, limit: int = 10) -> List[Tuple[Dict, float]]:
+        """
+        Rank repositories for a query.
+
+        Args:
+            query: Free text, e.g. "machine learning" or "snowflake pipelines"
+            limit: Number of results to return
+
+        Returns:
+            (repo, score) pairs, best first; ties keep the index order (most recent first)
+        """
+        scores: Dict[int, float] = defaultdict(float)
+        for token in set(tokenize(query)):
+            idf = self.idf.get(token)
+            if idf is None:
+                continue
+            for doc_id, freq in self.postings[token]:
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / self.avg_doc_length)
+                scores[doc_id] += idf * freq * (self.k1 + 1) / (freq + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [(self.repos[doc_id], round(score, 3)) for doc_id, score in ranked]
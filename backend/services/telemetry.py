@@ -0,0 +1,209 @@
+"""
+Telemetry - Request-scoped latency spans, Prometheus histograms and JSON logs
+Each HTTP request gets a trace held in a ContextVar, so it follows the request
+into tasks and worker threads. Instrumented code records spans (model calls,
+tool calls, Notion and GitHub HTTP) and cache lookups: every one is observed
+in a Prometheus histogram and summarised in the request's JSON log line.
+
+Percentiles are computed from the histogram buckets, e.g. p95 per route:
+    histogram_quantile(0.95, sum by (le, route) (rate(portfolio_request_seconds_bucket[5m])))
+"""
+
+import json
+import logging
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
+
+# Fine below a second (cache hits, Notion calls), coarse up to a minute (model turns)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 15.0, 30.0, 60.0)
+
+REQUEST_SECONDS = Histogram(
+    "portfolio_request_seconds", "HTTP request latency, until the last body chunk is sent",
+    ["method", "route", "status"], buckets=LATENCY_BUCKETS,
+)
+SPAN_SECONDS = Histogram(
+    "portfolio_span_seconds", "Latency of model calls, tool calls and upstream HTTP requests",
+    ["kind", "name", "outcome"], buckets=LATENCY_BUCKETS,
+)
+CACHE_LOOKUPS = Counter("portfolio_cache_lookups_total", "Cache lookups", ["cache", "result"])
+
+logger = logging.getLogger("portfolio.telemetry")
+
+
+@dataclass
+class RequestTrace:
+    request_id: str
+    started: float = field(default_factory=time.perf_counter)
+    spans: List[Tuple[str, str, float, bool]] = field(default_factory=list)
+    cache: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    def summary(self) -> Dict:
+        """Per-kind totals plus every span, for the request log line"""
+        totals: Dict[str, float] = {}
+        for kind, _, seconds, _ in self.spans:
+            totals[kind] = totals.get(kind, 0.0) + seconds
+        return {
+            "time_ms": {kind: round(seconds * 1000, 1) for kind, seconds in totals.items()},
+            "spans": [
+                {"kind": kind, "name": name, "ms": round(seconds * 1000, 1), **({"error": True} if error else {})}
+                for kind, name, seconds, error in self.spans
+            ],
+            "cache": self.cache,
+        }
+
+
+_current: ContextVar[Optional[RequestTrace]] = ContextVar("request_trace", default=None)
+
+# Spans opened and closed by separate callbacks (ADK before/after hooks), keyed by the caller.
+# A span whose close never comes (the call raised) is dropped once the table is full
+MAX_OPEN_SPANS = 1000
+_open_spans: Dict[str, float] = {}
+_open_spans_lock = threading.Lock()
+
+
+def current_trace() -> Optional[RequestTrace]:
+    return _current.get()
+
+
+def record_span(kind: str, name: str, seconds: float, error: bool = False) -> None:
+    """Observe a finished span and add it to the current request's trace, if any"""
+    SPAN_SECONDS.labels(kind, name, "error" if error else "ok").observe(seconds)
+    trace = _current.get()
+    if trace is not None:
+        trace.spans.append((kind, name, seconds, error))
+
+
+@contextmanager
+def span(kind: str, name: str):
+    """
+    Time a block as a span.
+
+    Args:
+        kind: What is being timed - "model", "tool", "notion", "github", ...
+        name: Low-cardinality label within the kind (a tool name, an endpoint template)
+    """
+    started = time.perf_counter()
+    error = False
+    try:
+        yield
+    except BaseException:
+        error = True
+        raise
+    finally:
+        record_span(kind, name, time.perf_counter() - started, error)
+
+
+def open_span(key: str) -> None:
+    """Start a span whose end is reported elsewhere (see close_span)"""
+    with _open_spans_lock:
+        _open_spans[key] = time.perf_counter()
+        if len(_open_spans) > MAX_OPEN_SPANS:
+            del _open_spans[next(iter(_open_spans))]
+
+
+def close_span(key: str, kind: str, name: str, error: bool = False) -> None:
+    """Finish a span started with open_span; unknown keys are ignored"""
+    with _open_spans_lock:
+        started = _open_spans.pop(key, None)
+    if started is not None:
+        record_span(kind, name, time.perf_counter() - started, error)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    result = "hit" if hit else "miss"
+    CACHE_LOOKUPS.labels(cache, result).inc()
+    trace = _current.get()
+    if trace is not None:
+        counts = trace.cache.setdefault(cache, {"hit": 0, "miss": 0})
+        counts[result] += 1
+
+
+def metrics_payload() -> Tuple[bytes, str]:
+    """Prometheus exposition of every metric in this process, with its content type"""
+    return generate_latest(), CONTENT_TYPE_LATEST
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per log line; fields passed as extra={"fields": {...}} are merged in"""
+
+    converter = time.gmtime
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S") + f".{int(record.msecs):03d}Z",
+            "level": record.levelname.lower(),
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        trace = _current.get()
+        if trace is not None:
+            entry["request_id"] = trace.request_id
+        entry.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def configure_json_logging(level: int = logging.INFO) -> None:
+    """Send all log records through a single JSON handler on stdout"""
+    handler = logging.StreamHandler()
+    handler.setFormatter(JsonFormatter())
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(level)
+
+
+class TelemetryMiddleware:
+    """
+    ASGI middleware: one trace, one latency observation and one JSON log line per request.
+
+    Requests are timed until their last body chunk is sent, so streamed chat
+    replies are measured in full rather than up to the response headers.
+    """
+
+    def __init__(self, app, skip_paths: Iterable[str] = ("/metrics",)):
+        self.app = app
+        self.skip_paths = set(skip_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        request_id = headers.get(b"x-request-id", b"").decode("latin-1")[:64] or uuid.uuid4().hex[:16]
+        trace = RequestTrace(request_id)
+        token = _current.set(trace)
+        status = 500
+
+        async def send_with_request_id(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                message["headers"] = list(message.get("headers") or []) + [
+                    (b"x-request-id", request_id.encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            duration = time.perf_counter() - trace.started
+            # Route template (e.g. /api/chat), never the raw path, to keep label cardinality bounded
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            REQUEST_SECONDS.labels(scope["method"], route, str(status)).observe(duration)
+            logger.info("request", extra={"fields": {
+                "method": scope["method"],
+                "route": route,
+                "status": status,
+                "duration_ms": round(duration * 1000, 1),
+                **trace.summary(),
+            }})
+            _current.reset(token)
@@ -0,0 +1,262 @@
+"""
+Vector Index - Semantic retrieval over Notion entries and GitHub READMEs
+Every Notion entry and README chunk is embedded into a NumPy matrix saved to
+disk, so the agents can hand the LLM only the few chunks relevant to the
+visitor's question instead of a fixed dump of the whole portfolio
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import zlib
+import numpy as np
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .notion_service import PortfolioSnapshot
+from .repo_search import tokenize
+
+DEFAULT_INDEX_DIR = Path(__file__).parent.parent / "data"
+CHUNK_CHARS = 800
+
+
+class HashingEmbedder:
+    """
+    Offline embedder: words (with alias expansion) and character trigrams are
+    hashed into a fixed-size signed vector. No model download, deterministic
+    across processes.
+    """
+
+    def __init__(self, dim: int = 1024):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, weight in self._features(text):
+                h = zlib.crc32(feature.encode("utf-8"))
+                vectors[row, h % self.dim] += weight if h & 0x80000000 else -weight
+        return _normalize(vectors)
+
+    @staticmethod
+    def _features(text: str):
+        for token in tokenize(text):
+            yield f"w:{token}", 1.0
+            padded = f"<{token}>"
+            for i in range(len(padded) - 2):
+                yield f"c:{padded[i:i + 3]}", 0.3
+
+
+class SentenceTransformerEmbedder:
+    """Local sentence-transformers model (optional dependency)"""
+
+    def __init__(self, model_name: str):
+        from sentence_transformers import SentenceTransformer
+        self.model = SentenceTransformer(model_name)
+        self.name = f"st-{model_name}"
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        vectors = self.model.encode(texts, normalize_embeddings=True, show_progress_bar=False)
+        return np.asarray(vectors, dtype=np.float32)
+
+
+def get_embedder():
+    """Use EMBEDDING_MODEL when sentence-transformers is installed, else the hashing fallback"""
+    model_name = os.getenv("EMBEDDING_MODEL")
+    if model_name:
+        try:
+            return SentenceTransformerEmbedder(model_name)
+        except ImportError:
+            print("⚠️ sentence-transformers not installed, using hashing embedder")
+    return HashingEmbedder()
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def split_text(text: str, max_chars: int = CHUNK_CHARS) -> List[str]:
+    """Split text into chunks of at most max_chars, breaking on paragraphs then sentences"""
+    text = text.strip()
+    if len(text) <= max_chars:
+        return [text] if text else []
+
+    pieces = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = paragraph.strip()
+        if len(paragraph) <= max_chars:
+            pieces.append(paragraph)
+            continue
+        for sentence in re.split(r"(?<=[.!?])\s+", paragraph):
+            while len(sentence) > max_chars:
+                pieces.append(sentence[:max_chars])
+                sentence = sentence[max_chars:]
+            pieces.append(sentence)
+
+    chunks, current = [], ""
+    for piece in pieces:
+        if not piece:
+            continue
+        if current and len(current) + len(piece) + 2 > max_chars:
+            chunks.append(current)
+            current = piece
+        else:
+            current = f"{current}\n\n{piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def build_chunks(snapshot: PortfolioSnapshot, repos: Iterable[Dict]) -> List[Dict]:
+    """Turn Notion entries and README text into retrievable chunks"""
+    chunks = []
+    for entry in snapshot.entries:
+        title = f"{entry.get('type') or 'Entry'}: {entry.get('name', '')}"
+        details = [entry.get("content") or ""]
+        if entry.get("tech_stack"):
+            details.append("Tech stack: " + ", ".join(entry["tech_stack"]))
+        if entry.get("location"):
+            details.append(f"Location: {entry['location']}")
+        for text in split_text("\n".join(d for d in details if d)) or [""]:
+            chunks.append({"source": "notion", "title": title, "text": text, "url": entry.get("url")})
+
+    for repo in repos:
+        title = f"GitHub project: {repo['name']}"
+        header = repo.get("description") or ""
+        if repo.get("topics"):
+            header += f" (topics: {', '.join(repo['topics'])})"
+        for text in split_text(f"{header}\n\n{repo.get('readme') or ''}"):
+            chunks.append({"source": "github", "title": title, "text": text, "url": repo.get("url")})
+    return chunks
+
+
+class VectorIndex:
+    """Normalized embedding matrix plus chunk metadata, searched by cosine similarity"""
+
+    def __init__(self, vectors: np.ndarray, chunks: List[Dict], fingerprint: str = "", embedder_name: str = ""):
+        self.vectors = vectors
+        self.chunks = chunks
+        self.fingerprint = fingerprint
+        self.embedder_name = embedder_name
+
+    @classmethod
+    def build(cls, chunks: List[Dict], embedder, fingerprint: str = "") -> "VectorIndex":
+        texts = [f"{chunk['title']}\n{chunk['text']}" for chunk in chunks]
+        vectors = embedder.embed(texts) if texts else np.zeros((0, 1), dtype=np.float32)
+        return cls(vectors, chunks, fingerprint, embedder.name)
+
+    def search(self, query_vector: np.ndarray, k: int = 5, min_score: float = 0.1) -> List[Dict]:
+        """
+        Top-k chunks for an already embedded query.
+
+        Returns:
+            Chunk dictionaries with a cosine "score", best first
+        """
+        if not self.chunks:
+            return []
+        scores = self.vectors @ query_vector
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [{**self.chunks[i], "score": round(float(scores[i]), 3)} for i in top if scores[i] >= min_score]
+
+    def save(self, directory: Path) -> None:
+        """
+        Write vectors (.npy) and metadata (.json) next to each other.
+
+        Both go to temp files that are renamed into place, vectors first: other
+        processes may have the old .npy memory-mapped, and overwriting it in place
+        would crash them (SIGBUS); a rename leaves their mapping intact.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        vectors_tmp = directory / "knowledge_vectors.npy.tmp"
+        with open(vectors_tmp, "wb") as f:
+            np.save(f, self.vectors)
+        os.replace(vectors_tmp, directory / "knowledge_vectors.npy")
+        meta_tmp = directory / "knowledge_index.json.tmp"
+        with open(meta_tmp, "w", encoding="utf-8") as f:
+            json.dump({"fingerprint": self.fingerprint, "embedder": self.embedder_name, "chunks": self.chunks}, f)
+        os.replace(meta_tmp, directory / "knowledge_index.json")
+
+    @classmethod
+    def load(cls, directory: Path) -> Optional["VectorIndex"]:
+        """Load a saved index (vectors are memory-mapped); None if missing or unreadable"""
+        try:
+            with open(directory / "knowledge_index.json", "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            vectors = np.load(directory / "knowledge_vectors.npy", mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        if len(vectors) != len(meta.get("chunks", [])):
+            return None
+        return cls(vectors, meta["chunks"], meta.get("fingerprint", ""), meta.get("embedder", ""))
+
+
+class KnowledgeRetriever:
+    """
+    Process-wide retriever that keeps the vector index in sync with its sources.
+
+    The index is rebuilt only when the Notion snapshot version, the repository
+    set or the embedder changes; otherwise it is loaded from disk once.
+    """
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(directory or os.getenv("KNOWLEDGE_INDEX_DIR") or DEFAULT_INDEX_DIR)
+        self.embedder = get_embedder()
+        self._index: Optional[VectorIndex] = None
+        self._lock = threading.Lock()
+
+    def fingerprint(self, snapshot: PortfolioSnapshot, repos: List[Dict]) -> str:
+        digest = hashlib.sha1(f"{self.embedder.name}|{snapshot.version}|".encode())
+        for repo in repos:
+            digest.update(f"{repo['name']}:{repo.get('updated_at')}:{len(repo.get('readme') or '')};".encode())
+        return digest.hexdigest()
+
+    def get_index(self, snapshot: PortfolioSnapshot, repos: Iterable[Dict]) -> VectorIndex:
+        """Get an index matching the given sources, loading or rebuilding as needed"""
+        repos = list(repos)
+        fingerprint = self.fingerprint(snapshot, repos)
+        if self._index is not None and self._index.fingerprint == fingerprint:
+            return self._index
+
+        with self._lock:
+            if self._index is None or self._index.fingerprint != fingerprint:
+                index = VectorIndex.load(self.directory)
+                if index is None or index.fingerprint != fingerprint:
+                    index = VectorIndex.build(build_chunks(snapshot, repos), self.embedder, fingerprint)
+                    index.save(self.directory)
+                self._index = index
+            return self._index
+
+    def retrieve(self, question: str, snapshot: PortfolioSnapshot, repos: Iterable[Dict], k: int = 5) -> List[Dict]:
+        """
+        Top-k chunks for a visitor's question.
+
+        Args:
+            question: The visitor's question in their own words
+            snapshot: Current portfolio snapshot
+            repos: Indexed GitHub repositories
+            k: Number of chunks to return
+        """
+        index = self.get_index(snapshot, repos)
+        query_vector = self.embedder.embed([question])[0]
+        return index.search(query_vector, k)
+
+
+_retriever: Optional[KnowledgeRetriever] = None
+_retriever_lock = threading.Lock()
+
+
+def get_knowledge_retriever() -> KnowledgeRetriever:
+    """Get the process-wide knowledge retriever"""
+    global _retriever
+    if _retriever is None:
+        with _retriever_lock:
+            if _retriever is None:
+                _retriever = KnowledgeRetriever()
+    return _retriever
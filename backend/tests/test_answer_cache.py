@@ -0,0 +1,19 @@
+from services.answer_cache import AnswerCache, normalize_question
+
+
+def test_normalize_question_ignores_case_punctuation_and_spacing():
+    assert normalize_question("  What's your  STACK? ") == normalize_question("whats your stack")
+
+
+def test_different_questions_get_different_keys():
+    assert normalize_question("Tell me about your projects") != normalize_question("Tell me about you")
+    assert normalize_question("What projects do you have?") != normalize_question("What do you do?")
+    assert normalize_question("Are you available?") != normalize_question("Is it available?")
+
+
+def test_cache_does_not_answer_a_different_question():
+    cache = AnswerCache(capacity=8, ttl=60)
+    cache.put("Tell me about your projects", "v1", "Projects answer")
+
+    assert cache.get("tell me about your projects!", "v1") == "Projects answer"
+    assert cache.get("Tell me about you", "v1") is None
@@ -0,0 +1,55 @@
+from services.batch_analysis import AnalysisCursor, BatchAnalysisJob
+
+
+class FakeDatabase:
+    """Conversation pages without a Sentiment, queried the way iter_pending does"""
+
+    def __init__(self, count):
+        self.pages = [
+            {"id": f"page-{i}", "created_time": f"2024-01-01T10:{i:02d}:00.000Z", "properties": {}}
+            for i in range(count)
+        ]
+        self.analyzed = set()
+        self.failing = set()
+
+    def pending(self, cursor):
+        for page in self.pages:
+            if page["id"] in self.analyzed:
+                continue
+            if cursor.watermark and page["created_time"] < cursor.watermark:
+                continue
+            if not cursor.is_seen(page):
+                yield page
+
+    def write(self, page_id, analysis):
+        if page_id in self.failing:
+            return False
+        self.analyzed.add(page_id)
+        return True
+
+
+def make_job(database, cursor_path):
+    job = BatchAnalysisJob(service=object(), batch_size=2, max_concurrency=1,
+                           cursor=AnalysisCursor(cursor_path))
+    job.iter_pending = lambda: database.pending(job.cursor)
+    job.analyze_batch = lambda transcripts: {page_id: {"sentiment": "Neutral"} for page_id in transcripts}
+    job._write_analysis = database.write
+    return job
+
+
+def test_failed_batch_is_retried_on_the_next_run(tmp_path):
+    database = FakeDatabase(6)
+    database.failing.add("page-2")
+    cursor_path = tmp_path / "cursor.json"
+
+    first = make_job(database, cursor_path).run()
+
+    assert first["failed"] == 1
+    assert "page-2" not in database.analyzed
+    assert AnalysisCursor(cursor_path).watermark < database.pages[2]["created_time"]
+
+    database.failing.clear()
+    second = make_job(database, cursor_path).run()
+
+    assert second["failed"] == 0
+    assert database.analyzed == {page["id"] for page in database.pages}
@@ -0,0 +1,26 @@
+from prompts import GREETING
+from services.local_classifier import LocalClassifier, BASE_TAXONOMY
+
+
+def classify(*turns):
+    classifier = LocalClassifier(BASE_TAXONOMY)
+    return classifier.classify([{"role": role, "content": content} for role, content in turns])
+
+
+def test_greeting_and_goodbye_is_not_a_lead():
+    analysis = classify(("assistant", GREETING), ("user", "ok thanks, bye"))
+
+    assert analysis["topics"] == []
+    assert analysis["interest_level"] == "Low"
+
+
+def test_topics_come_from_the_visitor():
+    analysis = classify(
+        ("assistant", GREETING),
+        ("user", "We're hiring for a data engineering position, are you available for an interview?"),
+    )
+
+    assert "Job Opportunity" in analysis["topics"]
+    assert "Data Engineering" in analysis["topics"]
+    assert "AI/ML" not in analysis["topics"]
+    assert analysis["interest_level"] == "High"